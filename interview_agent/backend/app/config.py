@@ -15,12 +15,57 @@ class Settings(BaseSettings):
     jwt_algorithm: str = "HS256"
     jwt_expiration_hours: int = 24
 
+    # Password hashing
+    bcrypt_rounds: int = 12
+    password_hash_workers: int = 4
+    password_hash_max_pending: int = 64
+    password_hash_retry_after_seconds: int = 1
+
+    # Authenticated principal cache (ttl 0 disables it). The TTL bounds how
+    # long a user changed or deleted outside this process stays cached
+    principal_cache_ttl_seconds: int = 30
+    principal_cache_max_entries: int = 10000
+
     # Azure OpenAI Realtime
     azure_openai_endpoint: str = ""
     azure_openai_api_key: str = ""
     azure_openai_deployment: str = "gpt-4o-realtime-preview"
     azure_openai_api_version: str = "2024-10-01-preview"
 
+    # LLM answer judge (chat completions on the same Azure OpenAI resource;
+    # judge_base_url points it at any OpenAI-compatible endpoint instead,
+    # e.g. the local stand-in judge in benchmarks/judge_server.py)
+    azure_openai_judge_deployment: str = "gpt-4o"
+    azure_openai_judge_api_version: str = "2024-06-01"
+    judge_base_url: str = ""
+    judge_max_concurrency: int = 8
+    judge_requests_per_second: float = 10.0
+    judge_burst: int = 10
+    judge_timeout_seconds: float = 30.0
+    judge_max_attempts: int = 3
+    judge_backoff_seconds: float = 0.5
+
+    # Judge verdict cache: in-memory LRU in front of the judge_verdicts table
+    # (max entries 0 disables the memory tier)
+    judge_cache_max_entries: int = 10000
+
+    # Local pre-scoring in front of the judge: answers it scores with at
+    # least this confidence skip the LLM call
+    judge_prescore_enabled: bool = True
+    judge_prescore_min_confidence: float = 0.8
+
+    # Population answer-latency sketches (percentiles per domain/difficulty/persona)
+    latency_sketch_k: int = 200
+    latency_sketch_flush_seconds: int = 60
+    latency_min_samples: int = 50
+
+    # Background report generation (evaluation + feedback report after a
+    # session ends); a running job is reclaimed once its lease expires
+    report_workers: int = 2
+    report_job_lease_seconds: int = 300
+    report_job_max_attempts: int = 3
+    report_job_poll_seconds: float = 5.0
+
     # Azure Document Intelligence
     azure_doc_intel_endpoint: str = ""
     azure_doc_intel_key: str = ""
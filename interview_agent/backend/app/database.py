@@ -37,5 +37,5 @@ def get_db_context():
 
 def init_db():
     """Initialize database tables."""
-    from app.models import user, session, skill  # noqa: F401
+    from app.models import user, session, skill, judge, latency, report  # noqa: F401
     Base.metadata.create_all(bind=engine)
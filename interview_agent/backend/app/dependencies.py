@@ -4,7 +4,7 @@ from sqlalchemy.orm import Session
 
 from app.database import get_db
 from app.services.auth import decode_token, get_user_by_id
-from app.models.user import User
+from app.services.principal_cache import Principal, principal_cache
 
 security = HTTPBearer()
 
@@ -12,8 +12,13 @@ security = HTTPBearer()
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: Session = Depends(get_db)
-) -> User:
-    """Dependency to get the current authenticated user."""
+) -> Principal:
+    """
+    Dependency to get the current authenticated user.
+
+    Returns a detached Principal, served from the principal cache when the
+    same token was seen recently so the user row is not re-read.
+    """
     token = credentials.credentials
     payload = decode_token(token)
 
@@ -32,6 +37,11 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+    cache_key = principal_cache.make_key(int(user_id), token)
+    principal = principal_cache.get(cache_key)
+    if principal is not None:
+        return principal
+
     user = get_user_by_id(db, int(user_id))
     if user is None:
         raise HTTPException(
@@ -40,4 +50,6 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    return user
+    principal = Principal.from_user(user)
+    principal_cache.put(cache_key, principal, token_exp=payload.get("exp"))
+    return principal
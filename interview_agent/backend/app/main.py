@@ -1,3 +1,5 @@
+import asyncio
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
@@ -5,6 +7,9 @@ from app.config import get_settings
 from app.database import init_db
 from app.routers import auth_router, users_router, sessions_router, resume_router
 from app.routers.websocket import router as websocket_router
+from app.services.latency_stats import latency_stats
+from app.services.report_jobs import report_jobs
+from app.services.verdict_cache import verdict_cache
 
 settings = get_settings()
 
@@ -21,6 +26,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "ETag", "Retry-After"],
 )
 
 # Include routers
@@ -35,6 +41,21 @@ app.include_router(websocket_router)
 async def startup():
     """Initialize database on startup."""
     init_db()
+    # Population latency statistics: load, then merge with other workers periodically
+    await asyncio.to_thread(latency_stats.load)
+    app.state.latency_flush_task = asyncio.create_task(
+        latency_stats.run_periodic_flush(settings.latency_sketch_flush_seconds)
+    )
+    # Report jobs: also picks up jobs queued, or left running past their lease, by earlier processes
+    report_jobs.start()
+
+
+@app.on_event("shutdown")
+async def shutdown():
+    """Persist latency observations not yet flushed and hand back running report jobs."""
+    await report_jobs.stop()
+    app.state.latency_flush_task.cancel()
+    await asyncio.to_thread(latency_stats.flush)
 
 
 @app.get("/")
@@ -54,5 +75,7 @@ async def health_check():
         "status": "healthy",
         "database": "connected",
         "azure_realtime": bool(settings.azure_openai_endpoint),
-        "azure_doc_intel": bool(settings.azure_doc_intel_endpoint)
+        "azure_doc_intel": bool(settings.azure_doc_intel_endpoint),
+        "judge_cache": verdict_cache.metrics(),
+        "latency_stats": latency_stats.metrics()
     }
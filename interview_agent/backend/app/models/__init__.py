@@ -1,5 +1,8 @@
 from app.models.user import User
-from app.models.session import InterviewSession
-from app.models.skill import UserSkill
+from app.models.session import InterviewSession, SessionContent
+from app.models.skill import UserSkill, SkillObservation, SkillTrend
+from app.models.judge import JudgeVerdictRecord
+from app.models.latency import LatencySketchRecord
+from app.models.report import ReportJob
 
-__all__ = ["User", "InterviewSession", "UserSkill"]
+__all__ = ["User", "InterviewSession", "SessionContent", "UserSkill", "SkillObservation", "SkillTrend", "JudgeVerdictRecord", "LatencySketchRecord", "ReportJob"]
@@ -0,0 +1,23 @@
+from sqlalchemy import Column, String, DateTime, JSON
+from datetime import datetime
+
+from app.database import Base
+
+
+class JudgeVerdictRecord(Base):
+    """
+    Persistent tier of the LLM judge verdict cache.
+
+    key is the SHA-256 of everything that determines a verdict: the
+    normalised answer, question, rubric, judge model and prompt template.
+    """
+    __tablename__ = "judge_verdicts"
+
+    key = Column(String(64), primary_key=True)
+    question_id = Column(String, nullable=True)
+    judge_model = Column(String, nullable=False)
+    verdict = Column(JSON, nullable=False)  # The documented judge output format
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+    def __repr__(self):
+        return f"<JudgeVerdictRecord(key={self.key[:12]}, question_id={self.question_id})>"
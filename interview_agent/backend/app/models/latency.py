@@ -0,0 +1,24 @@
+from sqlalchemy import Column, Integer, String, DateTime, JSON
+from datetime import datetime
+
+from app.database import Base
+
+
+class LatencySketchRecord(Base):
+    """
+    Population answer-latency quantile sketch for one (domain, difficulty,
+    persona) slice, merged from every worker.
+
+    version is bumped on each write; workers merge their new observations
+    with a compare-and-set on it, so concurrent flushes never lose data.
+    """
+    __tablename__ = "latency_sketches"
+
+    key = Column(String, primary_key=True)  # "domain/difficulty/persona", "*" for any
+    count = Column(Integer, nullable=False, default=0)
+    sketch = Column(JSON, nullable=False)  # KLLSketch.to_dict()
+    version = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    def __repr__(self):
+        return f"<LatencySketchRecord(key={self.key}, count={self.count})>"
@@ -0,0 +1,34 @@
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Index
+from datetime import datetime
+
+from app.database import Base
+
+
+class ReportJob(Base):
+    """
+    Background evaluation and feedback report generation for one ended session.
+
+    One job per session (session_id is unique), so repeated end and report
+    requests share it. Workers claim a queued job by marking it running
+    under a lease; a running job whose lease expired (its worker died) is
+    claimed again, and attempts fences out the stale worker's writes.
+    """
+    __tablename__ = "report_jobs"
+    __table_args__ = (
+        # Serves claiming the oldest claimable job
+        Index("ix_report_jobs_status_id", "status", "id"),
+    )
+
+    id = Column(Integer, primary_key=True)
+    session_id = Column(Integer, ForeignKey("sessions.id", ondelete="CASCADE"), nullable=False, unique=True)
+
+    status = Column(String, nullable=False, default="queued")  # queued, running, done, no_transcript, failed
+    attempts = Column(Integer, nullable=False, default=0)
+    error = Column(String, nullable=True)  # Last failure
+
+    created_at = Column(DateTime, default=datetime.utcnow)
+    lease_expires_at = Column(DateTime, nullable=True)  # While running
+    finished_at = Column(DateTime, nullable=True)
+
+    def __repr__(self):
+        return f"<ReportJob(id={self.id}, session_id={self.session_id}, status={self.status})>"
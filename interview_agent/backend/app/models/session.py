@@ -1,12 +1,75 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, JSON
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, JSON, Index, LargeBinary
+from sqlalchemy.ext.associationproxy import association_proxy
 from sqlalchemy.orm import relationship
+from sqlalchemy.types import TypeDecorator
 from datetime import datetime
+import json
+import zlib
 
 from app.database import Base
 
 
+class CompressedText(TypeDecorator):
+    """Text stored as a zlib-compressed BLOB."""
+
+    impl = LargeBinary
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return zlib.compress(value.encode("utf-8"), 6)
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return zlib.decompress(value).decode("utf-8")
+
+
+class CompressedJSON(CompressedText):
+    """JSON stored as a zlib-compressed BLOB."""
+
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return super().process_bind_param(json.dumps(value, separators=(",", ":")), dialect)
+
+    def process_result_value(self, value, dialect):
+        text = super().process_result_value(value, dialect)
+        return json.loads(text) if text is not None else None
+
+
+class SessionContent(Base):
+    """
+    Large per-session text kept out of the hot sessions table.
+
+    Loaded only when a session's resume, transcript summary or report is
+    actually read.
+    """
+    __tablename__ = "session_contents"
+
+    session_id = Column(Integer, ForeignKey("sessions.id", ondelete="CASCADE"), primary_key=True)
+    resume_text = Column(CompressedText, nullable=True)
+    transcript_summary = Column(CompressedText, nullable=True)
+    # Structured transcript (role, content, timestamp, question_id per entry):
+    # what evaluation re-segments, question tags included
+    transcript = Column(CompressedJSON, nullable=True)
+    feedback_report = Column(CompressedText, nullable=True)
+
+    session = relationship("InterviewSession", back_populates="content")
+
+    def __repr__(self):
+        return f"<SessionContent(session_id={self.session_id})>"
+
+
 class InterviewSession(Base):
     __tablename__ = "sessions"
+    __table_args__ = (
+        # Serves keyset pagination of a user's sessions, newest first
+        Index("ix_sessions_user_started_id", "user_id", "started_at", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
@@ -17,7 +80,6 @@ class InterviewSession(Base):
     domains = Column(JSON, nullable=False)  # List of domains: coding, system_design, ml
 
     # Candidate inputs
-    resume_text = Column(Text, nullable=True)
     declared_weak_areas = Column(JSON, nullable=True)  # List of weak area strings
 
     # Session state
@@ -26,13 +88,36 @@ class InterviewSession(Base):
     ended_at = Column(DateTime, nullable=True)
 
     # Session results
-    transcript_summary = Column(Text, nullable=True)
-    feedback_report = Column(Text, nullable=True)
     detected_weak_areas = Column(JSON, nullable=True)
     scores = Column(JSON, nullable=True)  # Domain/topic scores
 
-    # Relationship
+    # Relationships
     user = relationship("User", back_populates="sessions")
+    content = relationship(
+        "SessionContent",
+        back_populates="session",
+        uselist=False,
+        cascade="all, delete-orphan"
+    )
+
+    # Large text lives in session_contents; these proxies read and write it
+    # transparently, creating the content row on first assignment.
+    resume_text = association_proxy(
+        "content", "resume_text",
+        creator=lambda value: SessionContent(resume_text=value)
+    )
+    transcript_summary = association_proxy(
+        "content", "transcript_summary",
+        creator=lambda value: SessionContent(transcript_summary=value)
+    )
+    transcript = association_proxy(
+        "content", "transcript",
+        creator=lambda value: SessionContent(transcript=value)
+    )
+    feedback_report = association_proxy(
+        "content", "feedback_report",
+        creator=lambda value: SessionContent(feedback_report=value)
+    )
 
     def __repr__(self):
         return f"<InterviewSession(id={self.id}, user_id={self.user_id}, status={self.status})>"
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, Float, Date, DateTime, ForeignKey, Index, func, literal_column
 from sqlalchemy.orm import relationship
 from datetime import datetime
 
@@ -32,3 +32,81 @@ class UserSkill(Base):
 
     def __repr__(self):
         return f"<UserSkill(user_id={self.user_id}, domain={self.domain}, topic={self.topic}, status={self.status})>"
+
+
+# One row per (user, skill). subtopic is nullable and SQLite treats NULLs as
+# distinct in unique indexes, so the key uses coalesce(subtopic, '').
+SKILL_KEY_ELEMENTS = (
+    UserSkill.user_id,
+    UserSkill.domain,
+    UserSkill.topic,
+    func.coalesce(UserSkill.subtopic, literal_column("''")),
+)
+
+Index("uq_user_skills_skill", *SKILL_KEY_ELEMENTS, unique=True)
+
+
+class SkillObservation(Base):
+    """
+    One skill score from one session. Append-only: the raw history that
+    the SkillTrend rollups summarise.
+    """
+    __tablename__ = "skill_observations"
+    __table_args__ = (
+        Index("ix_skill_observations_user_observed", "user_id", "observed_at"),
+    )
+
+    id = Column(Integer, primary_key=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    session_id = Column(Integer, nullable=True)
+
+    domain = Column(String, nullable=False)
+    topic = Column(String, nullable=False)
+    subtopic = Column(String, nullable=True)
+
+    score = Column(Float, nullable=False)  # 0.0 to 1.0
+    confidence = Column(Float, nullable=False)
+    observed_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+
+    def __repr__(self):
+        return f"<SkillObservation(user_id={self.user_id}, domain={self.domain}, topic={self.topic}, score={self.score})>"
+
+
+class SkillTrend(Base):
+    """
+    Weekly rollup of a user's observations of one skill.
+
+    Maintained incrementally as observations are appended. ema carries
+    across weeks: a week's value is the exponential moving average of every
+    observation up to the end of that week (or up to now for the current one).
+    """
+    __tablename__ = "skill_trends"
+
+    id = Column(Integer, primary_key=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+
+    domain = Column(String, nullable=False)
+    topic = Column(String, nullable=False)
+    subtopic = Column(String, nullable=True)
+    week_start = Column(Date, nullable=False)  # Monday of the week
+
+    count = Column(Integer, nullable=False)
+    mean = Column(Float, nullable=False)
+    ema = Column(Float, nullable=False)
+    last_score = Column(Float, nullable=False)
+    updated_at = Column(DateTime, default=datetime.utcnow)
+
+    def __repr__(self):
+        return f"<SkillTrend(user_id={self.user_id}, domain={self.domain}, topic={self.topic}, week={self.week_start})>"
+
+
+# One rollup row per (user, skill, week), keyed like UserSkill
+TREND_KEY_ELEMENTS = (
+    SkillTrend.user_id,
+    SkillTrend.domain,
+    SkillTrend.topic,
+    func.coalesce(SkillTrend.subtopic, literal_column("''")),
+    SkillTrend.week_start,
+)
+
+Index("uq_skill_trends_skill_week", *TREND_KEY_ELEMENTS, unique=True)
@@ -7,35 +7,58 @@ from app.services.auth import (
     get_user_by_email,
     create_user,
     authenticate_user,
-    create_access_token
+    create_access_token,
+    EmailAlreadyRegistered,
+    PasswordHashingBusy
 )
 
 router = APIRouter(prefix="/v1/auth", tags=["authentication"])
 
 
+def raise_email_registered():
+    raise HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail="Email already registered"
+    )
+
+
+def raise_hashing_busy(error: PasswordHashingBusy):
+    """Shed load when the password hashing pool is saturated."""
+    raise HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="Too many authentication requests, please retry shortly",
+        headers={"Retry-After": str(error.retry_after)},
+    )
+
+
 @router.post("/register", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
 async def register(user_data: UserCreate, db: Session = Depends(get_db)):
     """Register a new user."""
     existing_user = get_user_by_email(db, user_data.email)
     if existing_user:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Email already registered"
-        )
+        raise_email_registered()
 
-    user = create_user(
-        db,
-        email=user_data.email,
-        password=user_data.password,
-        full_name=user_data.full_name
-    )
+    try:
+        user = await create_user(
+            db,
+            email=user_data.email,
+            password=user_data.password,
+            full_name=user_data.full_name
+        )
+    except EmailAlreadyRegistered:
+        raise_email_registered()
+    except PasswordHashingBusy as e:
+        raise_hashing_busy(e)
     return user
 
 
 @router.post("/login", response_model=TokenResponse)
 async def login(credentials: UserLogin, db: Session = Depends(get_db)):
     """Login and get an access token."""
-    user = authenticate_user(db, credentials.email, credentials.password)
+    try:
+        user = await authenticate_user(db, credentials.email, credentials.password)
+    except PasswordHashingBusy as e:
+        raise_hashing_busy(e)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -5,9 +5,10 @@ from datetime import datetime
 from app.database import get_db
 from app.dependencies import get_current_user
 from app.schemas import ResumeParseResponse
-from app.models.user import User
+from app.services.principal_cache import Principal
 from app.models.session import InterviewSession
 from app.services.document_intel import parse_resume
+from app.services.session_manager import session_manager
 
 router = APIRouter(prefix="/v1/resume", tags=["resume"])
 
@@ -16,7 +17,7 @@ router = APIRouter(prefix="/v1/resume", tags=["resume"])
 async def upload_and_parse_resume(
     session_id: int,
     file: UploadFile = File(...),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Upload and parse a resume for the current session."""
@@ -55,6 +56,7 @@ async def upload_and_parse_resume(
     # Update session with resume text
     session.resume_text = resume_text
     db.commit()
+    session_manager.set_resume_text(session_id, resume_text)
 
     return ResumeParseResponse(
         text=resume_text,
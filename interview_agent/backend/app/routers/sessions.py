@@ -1,22 +1,91 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import Session, joinedload
+from typing import List, Optional, Tuple
 from datetime import datetime
+import base64
+import hashlib
 
 from app.database import get_db
 from app.dependencies import get_current_user
-from app.schemas import SessionCreate, SessionResponse, SessionDetailResponse
-from app.models.user import User
-from app.models.session import InterviewSession
+from app.schemas import (
+    SessionCreate, SessionResponse, SessionDetailResponse, FeedbackResponse, ReportJobResponse
+)
+from app.services.principal_cache import Principal
+from app.models.report import ReportJob
+from app.models.session import InterviewSession, SessionContent
+from app.services.report_jobs import report_jobs
 from app.services.session_manager import session_manager
 
 router = APIRouter(prefix="/v1/sessions", tags=["sessions"])
 
+# Columns needed to build a SessionResponse. Large text lives in
+# session_contents and is never touched when listing.
+SESSION_LIST_COLUMNS = (
+    InterviewSession.id,
+    InterviewSession.user_id,
+    InterviewSession.persona,
+    InterviewSession.depth_mode,
+    InterviewSession.domains,
+    InterviewSession.status,
+    InterviewSession.started_at,
+    InterviewSession.ended_at,
+    InterviewSession.declared_weak_areas,
+)
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+# Suggested polling interval while a report is being generated
+REPORT_RETRY_AFTER_SECONDS = 2
+
+
+def encode_cursor(started_at: datetime, session_id: int) -> str:
+    """Encode a (started_at, id) keyset position as an opaque cursor."""
+    raw = f"{started_at.isoformat()}|{session_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """Decode a cursor produced by encode_cursor."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        started_at, session_id = base64.urlsafe_b64decode(padded).decode().split("|")
+        return datetime.fromisoformat(started_at), int(session_id)
+    except (ValueError, UnicodeDecodeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+
+
+def report_etag(report: str) -> str:
+    return '"' + hashlib.sha256(report.encode("utf-8")).hexdigest()[:32] + '"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Whether an If-None-Match header (weak or strong, possibly a list) matches etag."""
+    if not if_none_match:
+        return False
+    tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return "*" in tags or etag in tags
+
+
+def job_accepted(job: ReportJob) -> JSONResponse:
+    """202 with the job's status, while its report is not ready yet."""
+    return JSONResponse(
+        status_code=status.HTTP_202_ACCEPTED,
+        content=jsonable_encoder(ReportJobResponse.model_validate(job)),
+        headers={"Retry-After": str(REPORT_RETRY_AFTER_SECONDS)},
+    )
+
 
 @router.post("", response_model=SessionResponse, status_code=status.HTTP_201_CREATED)
 async def create_session(
     session_data: SessionCreate,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Create a new interview session."""
@@ -68,31 +137,70 @@ async def create_session(
     db.refresh(interview_session)
 
     # Initialize in-memory session state
-    session_manager.create_session(interview_session.id, current_user.id)
+    session_manager.create_session(
+        interview_session.id,
+        current_user.id,
+        domains=session_data.domains,
+        declared_weak_areas=session_data.declared_weak_areas,
+        persona=session_data.persona
+    )
 
     return interview_session
 
 
 @router.get("", response_model=List[SessionResponse])
 async def list_sessions(
-    current_user: User = Depends(get_current_user),
+    response: Response,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
-    """List all sessions for the current user."""
-    sessions = db.query(InterviewSession).filter(
+    """
+    List sessions for the current user, newest first.
+
+    Uses keyset pagination on (started_at, id). When more sessions are
+    available, the cursor for the next page is returned in the
+    X-Next-Cursor response header.
+    """
+    query = db.query(*SESSION_LIST_COLUMNS).filter(
         InterviewSession.user_id == current_user.id
-    ).order_by(InterviewSession.started_at.desc()).all()
-    return sessions
+    )
+
+    if cursor:
+        cursor_started_at, cursor_id = decode_cursor(cursor)
+        query = query.filter(or_(
+            InterviewSession.started_at < cursor_started_at,
+            and_(
+                InterviewSession.started_at == cursor_started_at,
+                InterviewSession.id < cursor_id
+            )
+        ))
+
+    # Fetch one extra row to know whether another page exists
+    rows = query.order_by(
+        InterviewSession.started_at.desc(),
+        InterviewSession.id.desc()
+    ).limit(limit + 1).all()
+
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        response.headers["X-Next-Cursor"] = encode_cursor(last.started_at, last.id)
+
+    return rows
 
 
 @router.get("/{session_id}", response_model=SessionDetailResponse)
 async def get_session(
     session_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Get details of a specific session."""
-    session = db.query(InterviewSession).filter(
+    session = db.query(InterviewSession).options(
+        joinedload(InterviewSession.content)
+    ).filter(
         InterviewSession.id == session_id,
         InterviewSession.user_id == current_user.id
     ).first()
@@ -106,13 +214,19 @@ async def get_session(
     return session
 
 
-@router.delete("/{session_id}", status_code=status.HTTP_204_NO_CONTENT)
+@router.delete("/{session_id}", response_model=ReportJobResponse, status_code=status.HTTP_202_ACCEPTED)
 async def end_session(
     session_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
-    """End an active session (mid-session exit)."""
+    """
+    End an active session (mid-session exit) and queue its feedback report.
+
+    Evaluation and report generation run in the background; poll
+    GET /v1/sessions/{id}/report for the result. Ending a session that
+    already ended returns its existing job.
+    """
     session = db.query(InterviewSession).filter(
         InterviewSession.id == session_id,
         InterviewSession.user_id == current_user.id
@@ -125,17 +239,116 @@ async def end_session(
         )
 
     if session.status != "active":
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Session is not active"
-        )
+        job = db.query(ReportJob).filter(ReportJob.session_id == session_id).first()
+        if job is None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Session is not active"
+            )
+        return job
 
     # Update session status
     session.status = "terminated"
     session.ended_at = datetime.utcnow()
+
+    # Partial feedback for whatever was covered. The transcript is stored
+    # now, so the job can still re-evaluate it if this process goes away
+    # before it runs.
+    transcript = session_manager.get_transcript(session_id)
+    transcript_summary = session_manager.get_transcript_summary(session_id)
+    state = session_manager.end_session(session_id)
+    if state is not None:
+        session.transcript = transcript
+        session.transcript_summary = transcript_summary
+    job = report_jobs.enqueue(db, session_id, state)
+
     db.commit()
+    report_jobs.notify()
+
+    return job
+
+
+@router.get(
+    "/{session_id}/report",
+    response_model=FeedbackResponse,
+    responses={
+        status.HTTP_202_ACCEPTED: {"model": ReportJobResponse, "description": "Report still being generated"},
+        status.HTTP_304_NOT_MODIFIED: {"description": "Report unchanged since the given ETag"},
+    }
+)
+async def get_session_report(
+    session_id: int,
+    request: Request,
+    response: Response,
+    current_user: Principal = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Get the feedback report of an ended session.
+
+    Returns 202 with the report job's status (and Retry-After) until the
+    report is ready, then the stored report with an ETag; a request whose
+    If-None-Match still matches gets 304 without the body. An ended session
+    with neither a report nor a job gets one queued. A session with no
+    recorded transcript gets 409, since no report will ever be generated.
+    """
+    row = db.query(InterviewSession.status, InterviewSession.ended_at, ReportJob).outerjoin(
+        ReportJob, ReportJob.session_id == InterviewSession.id
+    ).filter(
+        InterviewSession.id == session_id,
+        InterviewSession.user_id == current_user.id
+    ).first()
+
+    if not row:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Session not found"
+        )
+
+    session_status, ended_at, job = row
+    if session_status == "active":
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Session is still active"
+        )
+
+    if job is not None and job.status == "failed":
+        # The cause is logged by the worker and kept on the job, not shown
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Report generation failed"
+        )
+    if job is not None and job.status == "no_transcript":
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="No transcript was recorded for this session, so it has no report"
+        )
+    if job is not None and job.status != "done":
+        return job_accepted(job)
 
-    # Clean up in-memory state
-    session_manager.end_session(session_id)
+    report = db.query(SessionContent.feedback_report).filter(
+        SessionContent.session_id == session_id
+    ).scalar()
+    if report is None:
+        if job is not None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Session has no report"
+            )
+        job = report_jobs.enqueue(db, session_id)
+        db.commit()
+        report_jobs.notify()
+        return job_accepted(job)
 
-    return None
+    # Reports can be rewritten (re-scoring), so clients always revalidate
+    etag = report_etag(report)
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    response.headers.update(headers)
+    return FeedbackResponse(
+        session_id=session_id,
+        report_markdown=report,
+        generated_at=job.finished_at if job is not None else ended_at
+    )
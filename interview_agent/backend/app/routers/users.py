@@ -1,41 +1,57 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 
 from app.database import get_db
 from app.dependencies import get_current_user
-from app.schemas import UserResponse, SkillResponse
-from app.models.user import User
+from app.schemas import UserResponse, SkillResponse, SkillTrendResponse
+from app.services.principal_cache import Principal
 from app.models.skill import UserSkill
+from app.services.skill_profile import skill_trends
 
 router = APIRouter(prefix="/v1/users", tags=["users"])
 
 
 @router.get("/me", response_model=UserResponse)
-async def get_current_user_info(current_user: User = Depends(get_current_user)):
+async def get_current_user_info(current_user: Principal = Depends(get_current_user)):
     """Get the current user's information."""
     return current_user
 
 
 @router.get("/me/skills", response_model=List[SkillResponse])
 async def get_user_skills(
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
-    """Get all skill assessments for the current user."""
-    skills = db.query(UserSkill).filter(UserSkill.user_id == current_user.id).all()
+    """Get all skill assessments for the current user (inferred priors are not listed)."""
+    skills = db.query(UserSkill).filter(
+        UserSkill.user_id == current_user.id,
+        UserSkill.times_assessed > 0
+    ).all()
     return skills
 
 
+@router.get("/me/skills/trends", response_model=List[SkillTrendResponse])
+async def get_user_skill_trends(
+    domain: Optional[str] = None,
+    weeks: int = Query(12, ge=1, le=104),
+    current_user: Principal = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Get weekly skill trends (count, mean, moving average, last score) over recent weeks."""
+    return skill_trends(db, current_user.id, weeks, domain)
+
+
 @router.get("/me/skills/{domain}", response_model=List[SkillResponse])
 async def get_user_skills_by_domain(
     domain: str,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
-    """Get skill assessments for a specific domain."""
+    """Get skill assessments for a specific domain (inferred priors are not listed)."""
     skills = db.query(UserSkill).filter(
         UserSkill.user_id == current_user.id,
-        UserSkill.domain == domain
+        UserSkill.domain == domain,
+        UserSkill.times_assessed > 0
     ).all()
     return skills
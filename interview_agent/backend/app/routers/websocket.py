@@ -87,7 +87,8 @@ async def websocket_session(
         depth_mode=depth_mode,
         domains=domains,
         declared_weak_areas=declared_weak_areas or [],
-        resume_text=resume_text
+        resume_text=resume_text,
+        question_source=lambda: session_manager.next_question(session_id)
     )
 
     try:
@@ -192,6 +193,8 @@ async def handle_azure_messages(
                 # User speech state changed
                 is_speaking = event.get("is_speaking", False)
                 session_manager.update_speaking_state(session_id, is_speaking)
+                if is_speaking:
+                    session_manager.mark_answer_started(session_id)
 
                 await websocket.send_json({
                     "type": "status",
@@ -1,6 +1,6 @@
 from pydantic import BaseModel, EmailStr
 from typing import Optional, List
-from datetime import datetime
+from datetime import date, datetime
 
 
 # Auth Schemas
@@ -82,8 +82,40 @@ class SkillResponse(BaseModel):
         from_attributes = True
 
 
+class SkillTrendPoint(BaseModel):
+    week_start: date
+    count: int
+    mean: float
+    ema: float
+    last_score: float
+
+    class Config:
+        from_attributes = True
+
+
+class SkillTrendResponse(BaseModel):
+    domain: str
+    topic: str
+    subtopic: Optional[str]
+    ema: float  # latest week's moving average
+    change: Optional[float]  # ema change over the window; None with a single week
+    points: List[SkillTrendPoint]
+
+
 # Feedback Schemas
 class FeedbackResponse(BaseModel):
     session_id: int
     report_markdown: str
     generated_at: datetime
+
+
+class ReportJobResponse(BaseModel):
+    id: int
+    session_id: int
+    status: str  # queued, running, done, no_transcript, failed
+    attempts: int
+    created_at: datetime
+    finished_at: Optional[datetime]
+
+    class Config:
+        from_attributes = True
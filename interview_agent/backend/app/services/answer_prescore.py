@@ -0,0 +1,256 @@
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Sequence, Set, Tuple
+import re
+import threading
+
+import numpy as np
+
+from app.services.llm_judge import DimensionScore, JudgeRequest, JudgeVerdict
+from app.services.question_search import tokenize
+from app.services.question_vectors import HashedNgramEncoder
+from app.services.verdict_cache import rubric_version
+
+
+# Answers shorter than this (content tokens) are too terse to score by
+# coverage ("Binary search, O(log n)" can be right) and go to the judge
+MIN_ANSWER_TOKENS = 4
+
+# Explicit non-answers are decided locally only when the hedge is the
+# whole answer: at most this many content tokens (besides filler) may be
+# left once it is removed. "I don't know the proof, but binary search
+# halves the range" is hedged, not a non-answer, and goes to the judge
+NON_ANSWER_RESIDUE_TOKENS = 2
+NON_ANSWER = re.compile(
+    r"\b(i don'?t know|not sure|no idea|can we skip|skip this|pass on this|"
+    r"haven'?t (seen|done|used|worked)|never (seen|done|used|worked)|don'?t remember)\b"
+)
+
+FILLER_WORDS = frozenset("um uh er erm hmm like basically actually literally anyway".split())
+FILLER_PHRASES = re.compile(r"\b(you know|i mean|kind of|sort of)\b")
+
+# Filler share of the words above which a low-coverage answer is rambling
+FILLER_DOMINATED = 0.25
+
+# Cosine similarity of hashed n-gram vectors mapped onto 0-1 coverage
+SIMILARITY_FLOOR = 0.10
+SIMILARITY_CEILING = 0.45
+
+# Local score bands: at or below LOW is a clear miss, at or above HIGH
+# clearly complete; confidence grows with the distance past the band edge
+LOW_SCORE = 0.25
+HIGH_SCORE = 0.60
+CONFIDENCE_MARGIN = 0.10
+
+# Covering another question's rubric this well while missing its own
+# rubric marks an answer as off-topic
+OFF_TOPIC_SCORE = 0.45
+
+# Answers' own rubrics whose criteria are kept encoded
+CRITERIA_CACHE_SIZE = 1024
+
+
+def is_non_answer(answer: str) -> bool:
+    """Whether a lowercased answer is an explicit non-answer and little else."""
+    residue, hedges = NON_ANSWER.subn(" ", answer)
+    if not hedges:
+        return False
+    residue = FILLER_PHRASES.sub(" ", residue)
+    content = [token for token in tokenize(residue) if token not in FILLER_WORDS]
+    return len(content) <= NON_ANSWER_RESIDUE_TOKENS
+
+
+@dataclass
+class Prescore:
+    """Local first-stage assessment of one answer."""
+    score: float  # 0.0 to 1.0, estimated rubric coverage
+    confidence: float  # 0.0 to 1.0
+    decision: Optional[str]  # "low", "high", or None to escalate to the LLM judge
+    features: Dict[str, float] = field(default_factory=dict)
+    verdict: Optional[JudgeVerdict] = None  # set when decided locally
+
+
+class AnswerPrescorer:
+    """
+    Cheap local scoring of answers against their rubric, in front of the LLM judge.
+
+    Each rubric criterion's coverage blends the share of its tokens the
+    answer uses with the cosine similarity of hashed character n-gram
+    vectors (robust to inflections). The answer's score is the mean over
+    its rubric less the share of filler words.
+
+    Scores clearly above the ambiguous band are decided locally. A low
+    score alone is not enough, since a correct answer can use different
+    words than the rubric: an answer is only decided low when it is empty
+    or an explicit non-answer, mostly filler, or clearly covers another
+    question's rubric instead (off-topic; needs reference_rubrics, usually
+    the whole question bank). Answers too short to score by coverage are
+    escalated unless they are non-answers. Local decisions come with a
+    verdict in the judge's schema; everything else, or anything below
+    min_confidence, is escalated.
+
+    reference_rubrics should return the same list object while the
+    rubrics are unchanged (question_bank.rubrics does, per snapshot): the
+    reference criteria are rebuilt only when the list changes identity.
+    """
+
+    def __init__(
+        self,
+        min_confidence: float = 0.8,
+        reference_rubrics: Optional[Callable[[], Sequence[Dict[str, str]]]] = None,
+        encoder: Optional[HashedNgramEncoder] = None,
+        max_cached_rubrics: int = CRITERIA_CACHE_SIZE
+    ):
+        self.min_confidence = min_confidence
+        self.reference_rubrics = reference_rubrics
+        self.encoder = encoder or HashedNgramEncoder()
+        self.max_cached_rubrics = max_cached_rubrics
+        self._criteria_cache: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        # (source list, its criteria); replaced as one reference
+        self._references: Optional[Tuple[Sequence[Dict[str, str]], tuple]] = None
+
+    def prescore(self, request: JudgeRequest) -> Prescore:
+        return self.prescore_many([request])[0]
+
+    def prescore_many(self, requests: Sequence[JudgeRequest]) -> List[Prescore]:
+        """Prescore a batch; answers are encoded in one pass."""
+        if not requests:
+            return []
+        answer_vectors = self.encoder.encode([r.answer for r in requests])
+        references = self._reference_criteria()
+        return [
+            self._prescore(request, answer_vectors[i], references)
+            for i, request in enumerate(requests)
+        ]
+
+    def _prescore(self, request: JudgeRequest, answer_vector: np.ndarray, references: Optional[tuple]) -> Prescore:
+        raw = request.answer.lower()
+        words = raw.split()
+        tokens = tokenize(raw)
+        fillers = sum(word.strip(".,!?;:") in FILLER_WORDS for word in words)
+        fillers += len(FILLER_PHRASES.findall(raw))
+        filler_ratio = fillers / max(len(words), 1)
+        features = {"tokens": float(len(tokens)), "filler_ratio": filler_ratio}
+
+        if not tokens or is_non_answer(raw):
+            coverage = {dimension: 0.0 for dimension in request.rubric}
+            return self._decide(0.0, 1.0, "low", coverage, features)
+
+        if len(tokens) < MIN_ANSWER_TOKENS or not request.rubric:
+            return Prescore(score=0.0, confidence=0.0, decision=None, features=features)
+
+        token_set = set(tokens)
+        own = self._own_criteria(request.rubric)
+        coverage_values = self._coverage(token_set, answer_vector, own)
+        coverage = dict(zip(request.rubric, coverage_values.tolist()))
+        score = float(np.clip(coverage_values.mean() - filler_ratio, 0.0, 1.0))
+        features["coverage"] = float(coverage_values.mean())
+
+        decision, margin = None, 0.0
+        if score >= HIGH_SCORE:
+            decision, margin = "high", score - HIGH_SCORE
+        elif score <= LOW_SCORE:
+            off_topic = self._best_other_coverage(token_set, answer_vector, references, own[0][0])
+            features["off_topic"] = off_topic
+            if filler_ratio >= FILLER_DOMINATED:
+                decision, margin = "low", min(LOW_SCORE - score, filler_ratio - FILLER_DOMINATED)
+            elif off_topic >= OFF_TOPIC_SCORE:
+                decision, margin = "low", min(LOW_SCORE - score, off_topic - OFF_TOPIC_SCORE)
+
+        confidence = min(1.0, 0.5 + 0.5 * margin / CONFIDENCE_MARGIN) if decision else 0.0
+        if decision is None or confidence < self.min_confidence:
+            return Prescore(score=score, confidence=confidence, decision=None, features=features)
+        return self._decide(score, confidence, decision, coverage, features)
+
+    def _decide(
+        self,
+        score: float,
+        confidence: float,
+        decision: str,
+        coverage: Dict[str, float],
+        features: Dict[str, float]
+    ) -> Prescore:
+        verdict = JudgeVerdict(
+            scores={
+                dimension: DimensionScore(
+                    score=1 + int(round(4 * value)),
+                    evidence=f"Local pre-score: rubric coverage {value:.2f}"
+                )
+                for dimension, value in coverage.items()
+            },
+            overall_score=round(1 + 4 * score, 1),
+            strengths=[d for d, value in coverage.items() if value >= HIGH_SCORE],
+            areas_for_improvement=[d for d, value in coverage.items() if value <= LOW_SCORE]
+        )
+        return Prescore(score=score, confidence=confidence, decision=decision, features=features, verdict=verdict)
+
+    def _coverage(self, tokens: Set[str], answer_vector: np.ndarray, criteria: tuple) -> np.ndarray:
+        """Coverage in 0.0-1.0 of each criterion."""
+        _, token_sets, vectors, _, _ = criteria
+        overlap = np.array([len(tokens & c) / len(c) if c else 0.0 for c in token_sets])
+        similarity = vectors @ answer_vector
+        scaled = np.clip((similarity - SIMILARITY_FLOOR) / (SIMILARITY_CEILING - SIMILARITY_FLOOR), 0.0, 1.0)
+        return 0.5 * overlap + 0.5 * scaled
+
+    def _best_other_coverage(
+        self,
+        tokens: Set[str],
+        answer_vector: np.ndarray,
+        references: Optional[tuple],
+        own_version: str
+    ) -> float:
+        """Highest mean coverage of any reference rubric other than the answer's own."""
+        if references is None or not references[0]:
+            return 0.0
+        versions, _, _, rubric_ids, sizes = references
+        per_rubric = np.bincount(
+            rubric_ids, weights=self._coverage(tokens, answer_vector, references), minlength=len(versions)
+        ) / sizes
+        per_rubric[[v == own_version for v in versions]] = 0.0
+        return float(per_rubric.max())
+
+    def _reference_criteria(self) -> Optional[tuple]:
+        """Criteria of the reference rubrics, rebuilt only when the list is replaced."""
+        if self.reference_rubrics is None:
+            return None
+        rubrics = self.reference_rubrics()
+        cached = self._references
+        if cached is None or cached[0] is not rubrics:
+            cached = (rubrics, self._criteria([r for r in rubrics if r]))
+            self._references = cached
+        return cached[1]
+
+    def _own_criteria(self, rubric: Dict[str, str]) -> tuple:
+        """Criteria of an answer's own rubric, in a bounded LRU keyed by content."""
+        version = rubric_version(rubric)
+        with self._lock:
+            cached = self._criteria_cache.get(version)
+            if cached is not None:
+                self._criteria_cache.move_to_end(version)
+                return cached
+        cached = self._criteria([rubric])
+        if self.max_cached_rubrics > 0:
+            with self._lock:
+                self._criteria_cache[version] = cached
+                while len(self._criteria_cache) > self.max_cached_rubrics:
+                    self._criteria_cache.popitem(last=False)
+        return cached
+
+    def _criteria(self, rubrics: Sequence[Dict[str, str]]) -> tuple:
+        """
+        Criteria of the given rubrics, flattened.
+
+        Returns:
+            (rubric versions, criterion token sets, criterion vectors,
+            owning rubric index per criterion, criteria count per rubric)
+        """
+        criteria = [text for rubric in rubrics for text in rubric.values()]
+        rubric_ids = np.array([i for i, rubric in enumerate(rubrics) for _ in rubric], dtype=np.int64)
+        return (
+            tuple(rubric_version(rubric) for rubric in rubrics),
+            [set(tokenize(text)) for text in criteria],
+            self.encoder.encode(criteria),
+            rubric_ids,
+            np.array([max(len(rubric), 1) for rubric in rubrics], dtype=np.float64)
+        )
@@ -1,14 +1,96 @@
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Optional, Tuple
+import asyncio
 from passlib.context import CryptContext
 from jose import JWTError, jwt
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from app.config import get_settings
 from app.models.user import User
 
 settings = get_settings()
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Pinning min/max rounds to the configured cost makes needs_update() true for
+# hashes created under any other cost, so they are rehashed on next login.
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__default_rounds=settings.bcrypt_rounds,
+    bcrypt__min_rounds=settings.bcrypt_rounds,
+    bcrypt__max_rounds=settings.bcrypt_rounds
+)
+
+
+class PasswordHashingBusy(Exception):
+    """Raised when too many password hashes are already queued."""
+
+    def __init__(self, retry_after: int):
+        super().__init__("Password hashing pool is saturated")
+        self.retry_after = retry_after
+
+
+class EmailAlreadyRegistered(Exception):
+    """Raised when a new user's email is taken (e.g. by a concurrent signup)."""
+
+
+class PasswordHasher:
+    """
+    Runs bcrypt on a bounded thread pool so it never blocks the event loop.
+
+    bcrypt releases the GIL while hashing, so threads give real parallelism.
+    Admission is capped at max_pending hashes (running plus queued); beyond
+    that PasswordHashingBusy is raised instead of letting the queue grow.
+    """
+
+    def __init__(self, max_workers: int, max_pending: int, retry_after: int):
+        self.max_pending = max_pending
+        self.retry_after = retry_after
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="password-hash"
+        )
+        self._pending = 0  # only touched from the event loop thread
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    async def hash(self, password: str) -> str:
+        """Hash a password off the event loop."""
+        return await self._run(hash_password, password)
+
+    async def verify_and_update(
+        self,
+        plain_password: str,
+        hashed_password: str
+    ) -> Tuple[bool, Optional[str]]:
+        """
+        Verify a password off the event loop.
+
+        Returns (valid, new_hash); new_hash is set when the stored hash was
+        made with an outdated cost and should be replaced.
+        """
+        return await self._run(pwd_context.verify_and_update, plain_password, hashed_password)
+
+    async def _run(self, fn, *args):
+        if self._pending >= self.max_pending:
+            raise PasswordHashingBusy(self.retry_after)
+
+        self._pending += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, fn, *args)
+        finally:
+            self._pending -= 1
+
+
+# Global password hasher instance
+password_hasher = PasswordHasher(
+    max_workers=settings.password_hash_workers,
+    max_pending=settings.password_hash_max_pending,
+    retry_after=settings.password_hash_retry_after_seconds
+)
 
 
 def hash_password(password: str) -> str:
@@ -60,25 +142,47 @@ def get_user_by_id(db: Session, user_id: int) -> Optional[User]:
     return db.query(User).filter(User.id == user_id).first()
 
 
-def create_user(db: Session, email: str, password: str, full_name: Optional[str] = None) -> User:
-    """Create a new user."""
-    hashed_password = hash_password(password)
+async def create_user(db: Session, email: str, password: str, full_name: Optional[str] = None) -> User:
+    """
+    Create a new user.
+
+    Raises EmailAlreadyRegistered if the email was taken meanwhile: the
+    caller checks before hashing, and a concurrent signup can commit first.
+    """
+    # Nothing is pending yet; release the connection while bcrypt runs
+    db.rollback()
+    hashed_password = await password_hasher.hash(password)
     user = User(
         email=email,
         password_hash=hashed_password,
         full_name=full_name
     )
     db.add(user)
-    db.commit()
+    try:
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        raise EmailAlreadyRegistered(email)
     db.refresh(user)
     return user
 
 
-def authenticate_user(db: Session, email: str, password: str) -> Optional[User]:
-    """Authenticate a user with email and password."""
+async def authenticate_user(db: Session, email: str, password: str) -> Optional[User]:
+    """Authenticate a user with email and password, upgrading stale hashes."""
     user = get_user_by_email(db, email)
     if not user:
         return None
-    if not verify_password(password, user.password_hash):
+
+    # Release the pooled connection while bcrypt runs, otherwise a burst of
+    # logins parked on the hashing pool can exhaust the connection pool.
+    db.expunge(user)
+    db.rollback()
+
+    valid, new_hash = await password_hasher.verify_and_update(password, user.password_hash)
+    if not valid:
         return None
+    if new_hash:
+        db.add(user)
+        user.password_hash = new_hash
+        db.commit()
     return user
@@ -1,4 +1,4 @@
-from typing import List, Optional, AsyncGenerator
+from typing import Callable, List, Optional, AsyncGenerator
 import asyncio
 import json
 import base64
@@ -8,12 +8,27 @@ from app.personas import get_persona_prompt
 
 settings = get_settings()
 
+# Function tool through which the model takes its questions from the bank
+NEXT_QUESTION_TOOL = {
+    "type": "function",
+    "name": "next_question",
+    "description": (
+        "Get the next main interview question, chosen for this candidate from the question bank. "
+        "Call it whenever you move on to a new question; ask follow-ups yourself."
+    ),
+    "parameters": {"type": "object", "properties": {}}
+}
+
 
 class AzureRealtimeClient:
     """
     Client for Azure OpenAI Realtime API.
 
     Handles WebSocket connection to Azure for real-time voice conversation.
+
+    With a question_source, the model takes each main question from it
+    through the next_question tool (the mock interview opens with one), so
+    the session's question selection decides what is asked.
     """
 
     def __init__(
@@ -23,7 +38,8 @@ class AzureRealtimeClient:
         depth_mode: str,
         domains: List[str],
         declared_weak_areas: List[str],
-        resume_text: Optional[str] = None
+        resume_text: Optional[str] = None,
+        question_source: Optional[Callable[[], Optional[dict]]] = None
     ):
         self.session_id = session_id
         self.persona = persona
@@ -31,6 +47,7 @@ class AzureRealtimeClient:
         self.domains = domains
         self.declared_weak_areas = declared_weak_areas
         self.resume_text = resume_text
+        self.question_source = question_source
 
         self._connection = None
         self._connected = False
@@ -74,7 +91,7 @@ class AzureRealtimeClient:
                     "prefix_padding_ms": 300,
                     "silence_duration_ms": settings.silence_detection_ms
                 },
-                "tools": [],
+                "tools": [NEXT_QUESTION_TOOL] if self.question_source else [],
                 "voice": "alloy"
             })
 
@@ -126,6 +143,9 @@ class AzureRealtimeClient:
 
         try:
             async for event in self._connection:
+                if event.type == "response.function_call_arguments.done" and event.name == "next_question":
+                    await self._answer_next_question(event.call_id)
+                    continue
                 parsed_event = self._parse_event(event)
                 if parsed_event:
                     await self._event_queue.put(parsed_event)
@@ -135,6 +155,25 @@ class AzureRealtimeClient:
                 "message": str(e)
             })
 
+    async def _answer_next_question(self, call_id: str):
+        """Return the next bank question as the tool result and let the model ask it."""
+        question = self.question_source() if self.question_source else None
+        if question:
+            output = {
+                "question": question.get("question"),
+                "topic": question.get("topic"),
+                "difficulty": question.get("difficulty"),
+                "follow_ups": list(question.get("follow_ups") or [])
+            }
+        else:
+            output = {"question": None, "note": "No more bank questions; continue with your own."}
+        await self._connection.conversation.item.create(item={
+            "type": "function_call_output",
+            "call_id": call_id,
+            "output": json.dumps(output)
+        })
+        await self._connection.response.create()
+
     def _parse_event(self, event) -> Optional[dict]:
         """Parse Azure Realtime event into our protocol."""
         event_type = event.type
@@ -208,6 +247,12 @@ class AzureRealtimeClient:
             "",
             "## Interview Guidelines",
             "- Start immediately with interview questions - no warm-up or small talk",
+        ])
+        if self.question_source:
+            context_parts.append(
+                "- Get every new main question by calling next_question, and ask it in your own words"
+            )
+        context_parts.extend([
             "- Use verbal drilling for coding questions (no live coding)",
             "- Ask follow-up questions to probe depth of understanding",
             "- Track which topics have been covered",
@@ -231,6 +276,9 @@ class AzureRealtimeClient:
         }
 
         greeting = greetings.get(self.persona, greetings["neutral"])
+        question = self.question_source() if self.question_source else None
+        if question and question.get("question"):
+            greeting = question["question"]
 
         await self._event_queue.put({
             "type": "transcript",
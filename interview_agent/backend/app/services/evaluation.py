@@ -1,7 +1,25 @@
-from typing import Dict, List, Optional
-from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+from dataclasses import dataclass, field
 from enum import Enum
 
+import numpy as np
+
+from app.config import get_settings
+from app.services.answer_prescore import AnswerPrescorer
+from app.services.latency_stats import latency_stats
+from app.services.llm_judge import JudgeRequest, JudgeVerdict, LLMJudge
+from app.services.question_bank import question_bank
+from app.services.score_fusion import SIGNAL_INDEX, SIGNALS, fuse_scores, signal_weights
+from app.services.turn_segmenter import Exchange, TurnSegmenter
+from app.services.verdict_cache import verdict_cache
+
+settings = get_settings()
+
+# Verdict for an asked question left without any answer: the lowest score
+NO_ANSWER_VERDICT = JudgeVerdict(
+    scores={}, overall_score=1.0, strengths=[], areas_for_improvement=["No answer given"]
+)
+
 
 class SkillStatus(str, Enum):
     WEAK = "weak"
@@ -28,6 +46,57 @@ class DomainScore:
     weaknesses: List[str]
 
 
+@dataclass
+class TopicAccumulator:
+    """Running totals for one (domain, topic) over the exchanges folded so far."""
+    exchanges: int = 0
+    judged: int = 0
+    score_sum: float = 0.0
+    latencies: int = 0
+    latency_score_sum: float = 0.0
+    evidence: List[str] = field(default_factory=list)
+
+
+class EvaluationAccumulator:
+    """
+    Running evaluation state for one session.
+
+    Each exchange is folded in once, with its judge verdict if it has one,
+    as soon as it closes. Topic totals are kept as running sums, so
+    finalizing an evaluation costs O(topics) however long the session.
+    """
+
+    def __init__(self):
+        self.topics: Dict[Tuple[str, str], TopicAccumulator] = {}
+        self.folded: Set[int] = set()
+
+    def add(self, exchange: Exchange, verdict: Optional[JudgeVerdict] = None):
+        """Fold one exchange in; exchanges already folded are ignored."""
+        if exchange.index in self.folded:
+            return
+        self.folded.add(exchange.index)
+        if exchange.domain is None or exchange.topic is None:
+            return
+
+        topic = self.topics.setdefault((exchange.domain, exchange.topic), TopicAccumulator())
+        topic.exchanges += 1
+        if exchange.question_id:
+            topic.evidence.append(exchange.question_id)
+        if verdict is not None:
+            topic.judged += 1
+            topic.score_sum += verdict.normalized_score
+
+    def add_latency(self, domain: str, topic: str, score: float):
+        """Fold in one answer-latency score (see EvaluationService.latency_score)."""
+        topic_totals = self.topics.setdefault((domain, topic), TopicAccumulator())
+        topic_totals.latencies += 1
+        topic_totals.latency_score_sum += score
+
+    def pending(self, exchanges: Iterable[Exchange]) -> List[Exchange]:
+        """Exchanges not folded in yet."""
+        return [exchange for exchange in exchanges if exchange.index not in self.folded]
+
+
 @dataclass
 class SessionEvaluation:
     session_id: int
@@ -38,6 +107,17 @@ class SessionEvaluation:
     time_spent_minutes: float
 
 
+def session_evaluation_from_dict(data: dict) -> SessionEvaluation:
+    """Rebuild a SessionEvaluation from its asdict() form, as stored in InterviewSession.scores."""
+    return SessionEvaluation(**{
+        **data,
+        "domain_scores": [
+            DomainScore(**{**domain, "topic_scores": [TopicScore(**topic) for topic in domain["topic_scores"]]})
+            for domain in data["domain_scores"]
+        ]
+    })
+
+
 class EvaluationService:
     """
     Evaluates candidate performance using multi-signal fusion.
@@ -47,6 +127,10 @@ class EvaluationService:
     - Follow-up failure rate (high weight)
     - Verbal cues - filler words, tone (medium weight)
     - Response latency (low weight)
+
+    Signals are fused per topic as a (topics x signals) matrix; signals not
+    observed for a topic are masked out and the remaining weights
+    renormalised (see score_fusion).
     """
 
     # Signal weights
@@ -56,9 +140,69 @@ class EvaluationService:
         "verbal_cues": 0.15,
         "latency": 0.10
     }
+    WEIGHT_VECTOR = signal_weights(WEIGHTS)
+
+    def __init__(self, judge: Optional[LLMJudge] = None):
+        if judge is None:
+            prescorer = None
+            if settings.judge_prescore_enabled:
+                prescorer = AnswerPrescorer(
+                    min_confidence=settings.judge_prescore_min_confidence,
+                    reference_rubrics=question_bank.rubrics
+                )
+            judge = LLMJudge(cache=verdict_cache, prescorer=prescorer)
+        self.judge = judge
+
+    async def judge_exchanges(self, exchanges: Iterable[Exchange]) -> Dict[int, JudgeVerdict]:
+        """
+        Score every answered exchange with the judge, concurrently; clear-cut
+        answers are scored locally when the judge has a pre-scorer, and a
+        question left without any answer gets the lowest score.
 
-    def __init__(self):
-        pass
+        Exchanges without a topic (no bank question) are not judged, since
+        no topic would take their verdict. Exchanges whose evaluation failed
+        after retries are left out, so their topics fall back to the other
+        signals.
+
+        Returns:
+            Verdicts keyed by exchange index
+        """
+        verdicts, = await self.judge_sessions([exchanges])
+        return verdicts
+
+    async def judge_sessions(self, sessions: Sequence[Iterable[Exchange]]) -> List[Dict[int, JudgeVerdict]]:
+        """
+        judge_exchanges for several sessions in one batch, so answers repeated
+        across them share one cache lookup and one judge call.
+
+        Returns:
+            Per session, verdicts keyed by exchange index
+        """
+        requests = []
+        verdicts: List[Dict[int, JudgeVerdict]] = [{} for _ in sessions]
+        for position, exchanges in enumerate(sessions):
+            for exchange in exchanges:
+                if exchange.domain is None or exchange.topic is None:
+                    continue
+                if exchange.answer.strip():
+                    requests.append(self._judge_request(exchange, key=(position, exchange.index)))
+                else:
+                    verdicts[position][exchange.index] = NO_ANSWER_VERDICT
+        for result in await self.judge.evaluate_many(requests):
+            if result.verdict is not None:
+                position, index = result.key
+                verdicts[position][index] = result.verdict
+        return verdicts
+
+    def _judge_request(self, exchange: Exchange, key: object) -> JudgeRequest:
+        question = question_bank.get(exchange.question_id) if exchange.question_id else None
+        return JudgeRequest(
+            key=key,
+            question=exchange.question.prompt,
+            answer=exchange.answer,
+            rubric=(question or {}).get("rubric") or {},
+            question_id=exchange.question_id
+        )
 
     def evaluate_session(
         self,
@@ -67,7 +211,8 @@ class EvaluationService:
         declared_weak_areas: List[str],
         domains: List[str],
         depth_mode: str,
-        session_state: dict
+        session_state: dict,
+        verdicts: Optional[Dict[int, JudgeVerdict]] = None
     ) -> SessionEvaluation:
         """
         Evaluate the complete session and generate scores.
@@ -78,24 +223,72 @@ class EvaluationService:
             declared_weak_areas: Candidate-declared weak areas
             domains: Domains covered
             depth_mode: Requested depth level
-            session_state: In-memory session state data
+            session_state: In-memory session state data; an "exchanges"
+                TurnSegmenter kept up to date during the session is reused
+                instead of re-segmenting the transcript, and an "evaluation"
+                EvaluationAccumulator holding the exchanges judged during the
+                session is finalized rather than recomputed
+            verdicts: Judge verdicts from judge_exchanges, keyed by exchange
+                index, for exchanges not folded in yet; signals missing for
+                a topic are masked out of its fused score
 
         Returns:
             SessionEvaluation with comprehensive scoring
         """
         domain_scores = []
 
-        for domain in domains:
-            domain_score = self._evaluate_domain(
-                domain, transcript, session_state
-            )
-            domain_scores.append(domain_score)
+        exchanges = session_state.get("exchanges")
+        if exchanges is None:
+            exchanges = TurnSegmenter(domains).feed_all(transcript)
+
+        accumulator = session_state.get("evaluation") or EvaluationAccumulator()
+        verdicts = verdicts or {}
+        for exchange in accumulator.pending(exchanges.exchanges):
+            accumulator.add(exchange, verdicts.get(exchange.index))
+
+        # One signals row per topic, in the order the segmenter first saw them
+        domain_index = {domain: i for i, domain in enumerate(domains)}
+        topic_keys = [
+            key for key in exchanges.by_topic
+            if key[0] in domain_index and key in accumulator.topics
+        ]
+        topics = [accumulator.topics[key] for key in topic_keys]
+        signals = np.full((len(topics), len(SIGNALS)), np.nan)
+        signals[:, SIGNAL_INDEX["semantic"]] = [
+            t.score_sum / t.judged if t.judged else np.nan for t in topics
+        ]
+        signals[:, SIGNAL_INDEX["latency"]] = [
+            t.latency_score_sum / t.latencies if t.latencies else np.nan for t in topics
+        ]
+        follow_up_success_rate = self._follow_up_success_rate(session_state)
+        if follow_up_success_rate is not None:
+            signals[:, SIGNAL_INDEX["follow_up"]] = follow_up_success_rate
+        # Verbal cues are not yet measured per topic: left masked
+
+        fused = fuse_scores(
+            signals,
+            confidence=np.array([min(1.0, t.exchanges / 3) for t in topics]),
+            topic_domains=np.array([domain_index[key[0]] for key in topic_keys], dtype=np.int64),
+            num_domains=len(domains),
+            weights=self.WEIGHT_VECTOR
+        )
+
+        topic_scores: Dict[str, List[TopicScore]] = {domain: [] for domain in domains}
+        for row, (key, totals) in enumerate(zip(topic_keys, topics)):
+            topic_scores[key[0]].append(TopicScore(
+                topic=key[1],
+                subtopic=None,
+                score=float(fused.topic_scores[row]),
+                confidence=float(fused.topic_confidence[row]),
+                evidence=list(totals.evidence)
+            ))
+        for i, domain in enumerate(domains):
+            domain_scores.append(self._evaluate_domain(
+                domain, float(fused.domain_scores[i]), topic_scores[domain], follow_up_success_rate
+            ))
 
         # Calculate overall score
-        if domain_scores:
-            overall_score = sum(d.overall_score for d in domain_scores) / len(domain_scores)
-        else:
-            overall_score = 0.0
+        overall_score = float(fused.overall_scores[0]) if domain_scores else 0.0
 
         # Compare declared vs actual weak areas
         declared_vs_actual = self._compare_declared_actual(
@@ -117,38 +310,44 @@ class EvaluationService:
             time_spent_minutes=time_spent
         )
 
-    def _evaluate_domain(
+    def latency_score(
         self,
-        domain: str,
-        transcript: List[dict],
-        session_state: dict
-    ) -> DomainScore:
-        """Evaluate performance for a specific domain."""
-        # Extract relevant exchanges for this domain
-        # In production, this would use LLM-as-judge
-
-        # Mock evaluation for development
-        topic_scores = []
-        strengths = []
-        weaknesses = []
+        latency_ms: float,
+        domain: Optional[str],
+        difficulty: Optional[str],
+        persona: Optional[str]
+    ) -> Optional[float]:
+        """
+        Latency signal in 0.0-1.0: the share of the population (same domain,
+        difficulty and persona where there is enough data) that answered
+        slower. None while the population is too small to judge against.
+        """
+        percentile = latency_stats.percentile(latency_ms, domain, difficulty, persona)
+        return None if percentile is None else 1.0 - percentile
 
-        # Calculate follow-up failure rate
+    def _follow_up_success_rate(self, session_state: dict) -> Optional[float]:
+        """Fraction of follow-ups answered successfully; None if there were none."""
         total_follow_ups = session_state.get("total_follow_ups", 0)
         follow_up_failures = session_state.get("follow_up_failures", 0)
-
         if total_follow_ups > 0:
-            follow_up_success_rate = 1 - (follow_up_failures / total_follow_ups)
-        else:
-            follow_up_success_rate = 0.5  # Neutral if no follow-ups
+            return 1 - (follow_up_failures / total_follow_ups)
+        return None
 
-        # Mock scores based on signals
-        overall_score = (
-            0.6 * follow_up_success_rate +  # Base on follow-up performance
-            0.4 * 0.7  # Placeholder for semantic analysis
-        )
+    def _evaluate_domain(
+        self,
+        domain: str,
+        overall_score: float,
+        topic_scores: List[TopicScore],
+        follow_up_success_rate: Optional[float]
+    ) -> DomainScore:
+        """Assemble a domain's score with its strengths and weaknesses."""
+        strengths = []
+        weaknesses = []
 
         # Determine strengths and weaknesses
-        if follow_up_success_rate > 0.7:
+        if follow_up_success_rate is None:
+            pass  # No follow-ups asked: no signal either way
+        elif follow_up_success_rate > 0.7:
             strengths.append(f"Strong follow-up handling in {domain}")
         else:
             weaknesses.append(f"Struggled with follow-up questions in {domain}")
@@ -201,63 +400,5 @@ class EvaluationService:
         return len(transcript) * 0.5  # Assume 30 seconds per exchange
 
 
-class LLMJudge:
-    """
-    LLM-based evaluation of answers.
-
-    Uses GPT to assess answer quality against rubrics.
-    """
-
-    EVALUATION_PROMPT = """You are an expert technical interviewer evaluating a candidate's answer.
-
-Question: {question}
-Candidate's Answer: {answer}
-
-Rubric:
-{rubric}
-
-Evaluate the answer on each rubric dimension on a scale of 1-5.
-Provide specific evidence for your scores.
-
-Output format:
-{{
-  "scores": {{
-    "dimension1": {{"score": X, "evidence": "..."}},
-    ...
-  }},
-  "overall_score": X.X,
-  "strengths": ["...", "..."],
-  "areas_for_improvement": ["...", "..."]
-}}
-"""
-
-    def __init__(self):
-        pass
-
-    async def evaluate_answer(
-        self,
-        question: str,
-        answer: str,
-        rubric: Dict[str, str]
-    ) -> dict:
-        """
-        Evaluate a single answer using LLM.
-
-        In production, this calls Azure OpenAI GPT-4.
-        """
-        # Placeholder for LLM call
-        # In production:
-        # 1. Format prompt with question, answer, rubric
-        # 2. Call GPT-4 for evaluation
-        # 3. Parse structured response
-
-        return {
-            "scores": {},
-            "overall_score": 0.7,
-            "strengths": [],
-            "areas_for_improvement": []
-        }
-
-
 # Global evaluation service instance
 evaluation_service = EvaluationService()
@@ -0,0 +1,224 @@
+from datetime import datetime
+from typing import Callable, Dict, Optional, Tuple
+import asyncio
+import logging
+import threading
+
+from sqlalchemy import update
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.orm import Session
+
+from app.config import get_settings
+from app.database import SessionLocal
+from app.models.latency import LatencySketchRecord
+from app.services.quantile_sketch import KLLSketch
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+ANY = "*"
+
+# Compare-and-set attempts per key before a flush gives up on it for now
+MAX_MERGE_ATTEMPTS = 5
+
+# Consecutive failed periodic flushes before they are reported as persistent
+PERSISTENT_FLUSH_FAILURES = 3
+
+
+def sketch_keys(domain: Optional[str], difficulty: Optional[str], persona: Optional[str]) -> Tuple[str, ...]:
+    """Keys an observation is recorded under, most specific first."""
+    domain, difficulty, persona = domain or ANY, difficulty or ANY, persona or ANY
+    return tuple(dict.fromkeys((
+        f"{domain}/{difficulty}/{persona}",
+        f"{domain}/{difficulty}/{ANY}",
+        f"{domain}/{ANY}/{ANY}",
+        f"{ANY}/{ANY}/{ANY}"
+    )))
+
+
+class LatencyStats:
+    """
+    Process-wide answer-latency distributions, as KLL quantile sketches.
+
+    Every observation updates the sketches of its (domain, difficulty,
+    persona) slice and of the coarser slices above it, so a percentile can
+    fall back to a broader population while a slice is still thin. Memory
+    is O(k) per slice however many sessions are recorded.
+
+    Each worker keeps the merged population view plus a sketch of what it
+    observed since its last flush. flush() merges those deltas into the
+    latency_sketches table with a compare-and-set on the row version, then
+    reloads the merged view, so every worker converges on all workers' data.
+    """
+
+    def __init__(
+        self,
+        k: int,
+        min_samples: int,
+        session_factory: Callable[[], Session] = SessionLocal
+    ):
+        self.k = k
+        self.min_samples = min_samples
+        self._session_factory = session_factory
+        self._merged: Dict[str, KLLSketch] = {}
+        self._pending: Dict[str, KLLSketch] = {}
+        self._lock = threading.Lock()
+        self.flush_failures = 0  # consecutive failed periodic flushes
+
+    def record(
+        self,
+        latency_ms: float,
+        domain: Optional[str] = None,
+        difficulty: Optional[str] = None,
+        persona: Optional[str] = None
+    ):
+        """Add one answer latency to the population."""
+        with self._lock:
+            for key in sketch_keys(domain, difficulty, persona):
+                for sketches in (self._merged, self._pending):
+                    sketch = sketches.get(key)
+                    if sketch is None:
+                        sketch = sketches[key] = KLLSketch(self.k)
+                    sketch.update(latency_ms)
+
+    def percentile(
+        self,
+        latency_ms: float,
+        domain: Optional[str] = None,
+        difficulty: Optional[str] = None,
+        persona: Optional[str] = None
+    ) -> Optional[float]:
+        """
+        Fraction of the population answering at least this fast.
+
+        Uses the most specific slice with at least min_samples observations.
+        A lookup is a binary search over the sketch's O(k) items, so its
+        cost does not grow with the number of sessions recorded.
+
+        Returns:
+            Percentile in 0.0-1.0, or None until some slice has enough data
+        """
+        with self._lock:
+            for key in sketch_keys(domain, difficulty, persona):
+                sketch = self._merged.get(key)
+                if sketch is not None and sketch.count >= self.min_samples:
+                    return sketch.rank(latency_ms)
+        return None
+
+    def count(self, key: str) -> int:
+        with self._lock:
+            sketch = self._merged.get(key)
+            return sketch.count if sketch is not None else 0
+
+    def flush(self) -> int:
+        """
+        Merge local observations into the table and reload the merged view.
+
+        Deltas that could not be written stay pending for the next flush.
+
+        Returns:
+            Number of slices written
+        """
+        with self._lock:
+            pending, self._pending = self._pending, {}
+
+        unsent = dict(pending)
+        db = None
+        try:
+            db = self._session_factory()
+            for key, delta in pending.items():
+                if self._merge_into_table(db, key, delta):
+                    del unsent[key]
+            rows = db.query(LatencySketchRecord.key, LatencySketchRecord.sketch).all()
+        finally:
+            if db is not None:
+                db.close()
+            if unsent:
+                with self._lock:
+                    for key, delta in unsent.items():
+                        local = self._pending.get(key)
+                        if local is not None:
+                            delta.merge(local)
+                        self._pending[key] = delta
+
+        with self._lock:
+            for key, data in rows:
+                merged = KLLSketch.from_dict(data)
+                # Observations made since this flush started are not in the table yet
+                local = self._pending.get(key)
+                if local is not None:
+                    merged.merge(local)
+                self._merged[key] = merged
+        return len(pending) - len(unsent)
+
+    def load(self) -> int:
+        """Load the persisted population (a flush with nothing pending)."""
+        return self.flush()
+
+    async def run_periodic_flush(self, interval_seconds: float):
+        """
+        Flush every interval_seconds until cancelled.
+
+        A failed flush is logged and retried at the next interval (its
+        deltas stay pending). After PERSISTENT_FLUSH_FAILURES in a row it is
+        logged as an error, and metrics() reports the streak until a flush
+        succeeds again.
+        """
+        while True:
+            await asyncio.sleep(interval_seconds)
+            try:
+                await asyncio.to_thread(self.flush)
+            except Exception:
+                self.flush_failures += 1
+                if self.flush_failures >= PERSISTENT_FLUSH_FAILURES:
+                    logger.error(
+                        "Latency sketch flush has failed %d times in a row", self.flush_failures, exc_info=True
+                    )
+                else:
+                    logger.warning("Latency sketch flush failed, retrying next interval", exc_info=True)
+            else:
+                if self.flush_failures >= PERSISTENT_FLUSH_FAILURES:
+                    logger.info("Latency sketch flush recovered after %d failures", self.flush_failures)
+                self.flush_failures = 0
+
+    def metrics(self) -> dict:
+        """Flush health: slices awaiting a flush and the current failure streak."""
+        with self._lock:
+            return {
+                "pending_slices": len(self._pending),
+                "flush_failures": self.flush_failures,
+                "flush_failing": self.flush_failures >= PERSISTENT_FLUSH_FAILURES
+            }
+
+    def _merge_into_table(self, db: Session, key: str, delta: KLLSketch) -> bool:
+        for _ in range(MAX_MERGE_ATTEMPTS):
+            row = db.query(LatencySketchRecord.sketch, LatencySketchRecord.version).filter(
+                LatencySketchRecord.key == key
+            ).first()
+            if row is None:
+                result = db.execute(insert(LatencySketchRecord).values(
+                    key=key, count=delta.count, sketch=delta.to_dict(), version=1,
+                    updated_at=datetime.utcnow()
+                ).on_conflict_do_nothing(index_elements=["key"]))
+            else:
+                merged = KLLSketch.from_dict(row.sketch)
+                merged.merge(delta)
+                result = db.execute(update(LatencySketchRecord).where(
+                    LatencySketchRecord.key == key,
+                    LatencySketchRecord.version == row.version
+                ).values(
+                    count=merged.count, sketch=merged.to_dict(), version=row.version + 1,
+                    updated_at=datetime.utcnow()
+                ))
+            db.commit()
+            if result.rowcount:
+                return True
+            # Another worker wrote this key first: merge onto its version
+        return False
+
+
+# Global latency statistics instance
+latency_stats = LatencyStats(
+    k=settings.latency_sketch_k,
+    min_samples=settings.latency_min_samples
+)
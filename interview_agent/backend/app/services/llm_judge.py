@@ -0,0 +1,404 @@
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence
+import asyncio
+import hashlib
+import json
+import random
+import time
+
+import httpx
+from pydantic import BaseModel, ConfigDict, Field, ValidationError
+
+from app.config import get_settings
+from app.services.verdict_cache import VerdictCache, verdict_key
+
+if TYPE_CHECKING:
+    from app.services.answer_prescore import AnswerPrescorer
+
+settings = get_settings()
+
+
+EVALUATION_PROMPT = """You are an expert technical interviewer evaluating a candidate's answer.
+
+Question: {question}
+Candidate's Answer: {answer}
+
+Rubric:
+{rubric}
+
+Evaluate the answer on each rubric dimension on a scale of 1-5.
+Provide specific evidence for your scores.
+
+Output format:
+{{
+  "scores": {{
+    "dimension1": {{"score": X, "evidence": "..."}},
+    ...
+  }},
+  "overall_score": X.X,
+  "strengths": ["...", "..."],
+  "areas_for_improvement": ["...", "..."]
+}}
+"""
+
+# Changes whenever the prompt template does, so cached verdicts from an older
+# prompt are not reused
+PROMPT_VERSION = hashlib.sha256(EVALUATION_PROMPT.encode()).hexdigest()[:16]
+
+# HTTP statuses worth retrying: rate limited, or the service is struggling
+RETRYABLE_STATUSES = {408, 409, 429, 500, 502, 503, 504}
+
+
+class DimensionScore(BaseModel):
+    model_config = ConfigDict(extra="forbid", strict=True)
+
+    score: int = Field(ge=1, le=5)
+    evidence: str
+
+
+class JudgeVerdict(BaseModel):
+    """The judge's JSON output, validated strictly against the documented schema."""
+    model_config = ConfigDict(extra="forbid", strict=True)
+
+    scores: Dict[str, DimensionScore]
+    overall_score: float = Field(ge=1, le=5)
+    strengths: List[str]
+    areas_for_improvement: List[str]
+
+    @property
+    def normalized_score(self) -> float:
+        """overall_score mapped from the 1-5 scale onto 0.0-1.0."""
+        return (self.overall_score - 1) / 4
+
+
+class JudgeError(Exception):
+    """A judge call failed; retryable errors are retried by the pipeline."""
+
+    def __init__(self, message: str, retryable: bool = True, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retryable = retryable
+        self.retry_after = retry_after
+
+
+def format_rubric(rubric: Dict[str, str]) -> str:
+    return "\n".join(f"- {dimension}: {criteria}" for dimension, criteria in rubric.items())
+
+
+def parse_verdict(content: str, rubric: Dict[str, str]) -> JudgeVerdict:
+    """
+    Parse the judge's reply into a JudgeVerdict.
+
+    The reply must be a single JSON object matching the schema exactly
+    (no extra keys, integer 1-5 dimension scores) and must score every
+    rubric dimension and nothing else.
+
+    Raises:
+        JudgeError: (retryable) when the reply does not conform
+    """
+    try:
+        verdict = JudgeVerdict.model_validate(json.loads(content))
+    except (json.JSONDecodeError, ValidationError) as e:
+        raise JudgeError(f"Malformed verdict: {e}") from e
+    if rubric and set(verdict.scores) != set(rubric):
+        raise JudgeError(
+            f"Verdict dimensions {sorted(verdict.scores)} do not match rubric {sorted(rubric)}"
+        )
+    return verdict
+
+
+class TokenBucket:
+    """
+    Async token-bucket rate limiter.
+
+    Holds up to burst tokens, refilled continuously at rate per second.
+    acquire() waits until a token is available; waiters are served in
+    arrival order so no caller starves under sustained load.
+    """
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        if self.rate <= 0:
+            return
+        async with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            deficit = -self._tokens
+        if deficit > 0:
+            # The token is already reserved; sleep until it would have been refilled
+            await asyncio.sleep(deficit / self.rate)
+
+
+@dataclass
+class JudgeRequest:
+    """One answer to evaluate. key identifies it to the caller (e.g. an exchange index)."""
+    key: object
+    question: str
+    answer: str
+    rubric: Dict[str, str]
+    question_id: Optional[str] = None
+
+
+@dataclass
+class JudgeResult:
+    key: object
+    verdict: Optional[JudgeVerdict]
+    error: Optional[str]
+    attempts: int
+    latency_ms: float
+    cached: bool = False
+    prescored: bool = False  # decided by the local pre-scorer, no LLM call
+
+
+class ChatCompletionsTransport:
+    """
+    POSTs prompts to an OpenAI-compatible chat completions endpoint.
+
+    With base_url set (e.g. the local stand-in judge) requests go to
+    {base_url}/chat/completions; otherwise to the Azure OpenAI deployment.
+    """
+
+    def __init__(
+        self,
+        base_url: str = "",
+        azure_endpoint: str = "",
+        api_key: str = "",
+        deployment: str = "",
+        api_version: str = "",
+        max_connections: int = 100
+    ):
+        if base_url:
+            self.url = f"{base_url.rstrip('/')}/chat/completions"
+            self.params = {}
+            headers = {"Authorization": f"Bearer {api_key}"} if api_key else {}
+        else:
+            self.url = f"{azure_endpoint.rstrip('/')}/openai/deployments/{deployment}/chat/completions"
+            self.params = {"api-version": api_version}
+            headers = {"api-key": api_key}
+        self.model = deployment
+        self._client = httpx.AsyncClient(
+            headers=headers,
+            limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+            timeout=None  # The pipeline enforces per-call timeouts
+        )
+
+    async def complete(self, prompt: str) -> str:
+        """Send one prompt and return the reply text."""
+        body = {
+            "model": self.model,
+            "messages": [{"role": "user", "content": prompt}],
+            "temperature": 0,
+            "response_format": {"type": "json_object"}
+        }
+        try:
+            response = await self._client.post(self.url, params=self.params, json=body)
+        except httpx.TransportError as e:
+            raise JudgeError(f"Transport error: {e!r}") from e
+
+        if response.status_code != 200:
+            retry_after = response.headers.get("retry-after")
+            raise JudgeError(
+                f"Judge returned HTTP {response.status_code}",
+                retryable=response.status_code in RETRYABLE_STATUSES,
+                retry_after=float(retry_after) if retry_after and retry_after.isdigit() else None
+            )
+        try:
+            return response.json()["choices"][0]["message"]["content"]
+        except (ValueError, KeyError, IndexError, TypeError) as e:
+            raise JudgeError(f"Unexpected completion payload: {e!r}") from e
+
+    async def aclose(self):
+        await self._client.aclose()
+
+
+class LLMJudge:
+    """
+    LLM-based evaluation of answers.
+
+    Uses GPT to assess answer quality against rubrics. evaluate_many fans
+    out a whole session's evaluations at once: at most max_concurrency
+    calls are in flight, call starts are rate limited by a token bucket,
+    each attempt has its own timeout, and retryable failures (timeouts,
+    429/5xx, malformed verdicts) back off exponentially with full jitter.
+
+    With a VerdictCache, answers already judged under the same question,
+    rubric, model and prompt are served from the cache without a call, and
+    identical answers within one run are judged once.
+
+    With an AnswerPrescorer, clearly empty, off-topic or complete answers
+    are scored locally and only the ambiguous ones are sent to the LLM.
+    Local verdicts are not cached; they are cheaper to recompute.
+    """
+
+    EVALUATION_PROMPT = EVALUATION_PROMPT
+
+    def __init__(
+        self,
+        transport: Optional[ChatCompletionsTransport] = None,
+        cache: Optional[VerdictCache] = None,
+        prescorer: Optional["AnswerPrescorer"] = None,
+        max_concurrency: int = settings.judge_max_concurrency,
+        requests_per_second: float = settings.judge_requests_per_second,
+        burst: int = settings.judge_burst,
+        timeout_seconds: float = settings.judge_timeout_seconds,
+        max_attempts: int = settings.judge_max_attempts,
+        backoff_seconds: float = settings.judge_backoff_seconds
+    ):
+        if transport is None and (settings.judge_base_url or settings.azure_openai_endpoint):
+            transport = ChatCompletionsTransport(
+                base_url=settings.judge_base_url,
+                azure_endpoint=settings.azure_openai_endpoint,
+                api_key=settings.azure_openai_api_key,
+                deployment=settings.azure_openai_judge_deployment,
+                api_version=settings.azure_openai_judge_api_version,
+                max_connections=max_concurrency
+            )
+        self.transport = transport
+        self.cache = cache
+        self.prescorer = prescorer
+        self.max_concurrency = max_concurrency
+        self.timeout_seconds = timeout_seconds
+        self.max_attempts = max_attempts
+        self.backoff_seconds = backoff_seconds
+        self.rate_limiter = TokenBucket(requests_per_second, burst)
+
+    @property
+    def enabled(self) -> bool:
+        return self.transport is not None
+
+    @property
+    def model(self) -> str:
+        return self.transport.model if self.transport is not None else ""
+
+    def cache_key(self, request: JudgeRequest) -> str:
+        return verdict_key(
+            request.question_id, request.question, request.answer,
+            request.rubric, self.model, PROMPT_VERSION
+        )
+
+    async def evaluate_answer(
+        self,
+        question: str,
+        answer: str,
+        rubric: Dict[str, str]
+    ) -> dict:
+        """
+        Evaluate a single answer using LLM.
+
+        Returns:
+            The verdict as a dict in the documented output format
+
+        Raises:
+            JudgeError: when every attempt failed
+        """
+        if not self.enabled:
+            # Development mode - no judge configured
+            return {
+                "scores": {},
+                "overall_score": 0.7,
+                "strengths": [],
+                "areas_for_improvement": []
+            }
+        result, = await self.evaluate_many([JudgeRequest(None, question, answer, rubric)])
+        if result.verdict is None:
+            raise JudgeError(result.error, retryable=False)
+        return result.verdict.model_dump()
+
+    async def evaluate_many(self, requests: Sequence[JudgeRequest]) -> List[JudgeResult]:
+        """
+        Evaluate many answers concurrently.
+
+        Never raises for individual failures: a request that exhausts its
+        attempts comes back with verdict None and the last error.
+
+        Returns:
+            One JudgeResult per request, in request order
+        """
+        keys = [self.cache_key(request) for request in requests]
+        cached = await asyncio.to_thread(self.cache.get_many, keys) if self.cache is not None else {}
+
+        # One call per distinct uncached key
+        pending: Dict[str, JudgeRequest] = {}
+        for key, request in zip(keys, requests):
+            if key not in cached:
+                pending.setdefault(key, request)
+
+        # Clear-cut answers are decided locally; only the rest reach the LLM
+        prescored: Dict[str, JudgeVerdict] = {}
+        if self.prescorer is not None and pending:
+            prescores = await asyncio.to_thread(self.prescorer.prescore_many, list(pending.values()))
+            for key, prescore in zip(list(pending), prescores):
+                if prescore.verdict is not None:
+                    prescored[key] = prescore.verdict
+                    del pending[key]
+
+        judged = dict(zip(pending, await self._judge(list(pending.values()))))
+        fresh = [
+            (key, pending[key].question_id, self.model, result.verdict.model_dump())
+            for key, result in judged.items() if result.verdict is not None
+        ]
+        if fresh and self.cache is not None:
+            await asyncio.to_thread(self.cache.put_many, fresh)
+
+        results = []
+        for key, request in zip(keys, requests):
+            if key in cached:
+                results.append(JudgeResult(
+                    request.key, JudgeVerdict.model_validate(cached[key]), None, 0, 0.0, cached=True
+                ))
+            elif key in prescored:
+                results.append(JudgeResult(request.key, prescored[key], None, 0, 0.0, prescored=True))
+            else:
+                result = judged[key]
+                results.append(JudgeResult(
+                    request.key, result.verdict, result.error, result.attempts, result.latency_ms
+                ))
+        return results
+
+    async def _judge(self, requests: Sequence[JudgeRequest]) -> List[JudgeResult]:
+        if not self.enabled:
+            return [JudgeResult(r.key, None, "No judge configured", 0, 0.0) for r in requests]
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        return list(await asyncio.gather(*(self._run(request, semaphore) for request in requests)))
+
+    async def _run(self, request: JudgeRequest, semaphore: asyncio.Semaphore) -> JudgeResult:
+        prompt = self.EVALUATION_PROMPT.format(
+            question=request.question,
+            answer=request.answer,
+            rubric=format_rubric(request.rubric)
+        )
+        start = time.perf_counter()
+        error = None
+        attempt = 0
+        while attempt < self.max_attempts:
+            attempt += 1
+            retry_after = None
+            async with semaphore:
+                await self.rate_limiter.acquire()
+                try:
+                    content = await asyncio.wait_for(self.transport.complete(prompt), self.timeout_seconds)
+                    verdict = parse_verdict(content, request.rubric)
+                    return JudgeResult(request.key, verdict, None, attempt, (time.perf_counter() - start) * 1000)
+                except asyncio.TimeoutError:
+                    error = f"Timed out after {self.timeout_seconds}s"
+                except JudgeError as e:
+                    error = str(e)
+                    if not e.retryable:
+                        break
+                    retry_after = e.retry_after
+            if attempt < self.max_attempts:
+                # Back off outside the semaphore so the slot goes to another request
+                delay = random.uniform(0, self.backoff_seconds * 2 ** (attempt - 1))
+                await asyncio.sleep(max(delay, retry_after or 0))
+        return JudgeResult(request.key, None, error, attempt, (time.perf_counter() - start) * 1000)
+
+    async def aclose(self):
+        if self.transport is not None:
+            await self.transport.aclose()
@@ -0,0 +1,140 @@
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Optional, Set, Tuple
+import hashlib
+import threading
+import time
+
+from sqlalchemy import event
+
+from app.config import get_settings
+from app.models.user import User
+
+settings = get_settings()
+
+
+@dataclass(frozen=True)
+class Principal:
+    """Detached snapshot of the authenticated user."""
+    id: int
+    email: str
+    full_name: Optional[str]
+    created_at: datetime
+
+    @classmethod
+    def from_user(cls, user: User) -> "Principal":
+        return cls(
+            id=user.id,
+            email=user.email,
+            full_name=user.full_name,
+            created_at=user.created_at
+        )
+
+
+CacheKey = Tuple[int, str]
+
+
+class PrincipalCache:
+    """
+    Bounded LRU cache of authenticated principals with TTL.
+
+    Keyed by (user_id, token hash) so a revoked or replaced token never
+    reuses another token's entry. Entries expire after ttl_seconds or when
+    the token itself expires, whichever is first.
+
+    Staleness is bounded by ttl_seconds, not prevented: the invalidation
+    hooks below only see ORM flushes of User objects in this process, so a
+    user deleted or changed by another worker process, by a bulk
+    update()/delete() or directly in the database keeps its cached
+    principal until the entry expires. Keep the TTL short (seconds, not
+    minutes). Tokens themselves are not revoked by user changes, cached or
+    not; the cache only delays noticing a deleted user or a changed email
+    or name.
+    """
+
+    def __init__(self, ttl_seconds: int, max_entries: int):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[CacheKey, Tuple[float, Principal]]" = OrderedDict()
+        self._keys_by_user: Dict[int, Set[CacheKey]] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0 and self.max_entries > 0
+
+    @staticmethod
+    def make_key(user_id: int, token: str) -> CacheKey:
+        return user_id, hashlib.sha256(token.encode()).hexdigest()
+
+    def get(self, key: CacheKey) -> Optional[Principal]:
+        """Return a cached principal, or None if missing or expired."""
+        if not self.enabled:
+            return None
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, principal = entry
+            if expires_at <= time.monotonic():
+                self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+            return principal
+
+    def put(self, key: CacheKey, principal: Principal, token_exp: Optional[float] = None):
+        """Cache a principal, evicting the least recently used entry if full."""
+        if not self.enabled:
+            return
+
+        ttl = self.ttl_seconds
+        if token_exp is not None:
+            ttl = min(ttl, token_exp - time.time())
+            if ttl <= 0:
+                return
+
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, principal)
+            self._entries.move_to_end(key)
+            self._keys_by_user.setdefault(key[0], set()).add(key)
+            while len(self._entries) > self.max_entries:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+
+    def invalidate_user(self, user_id: int):
+        """Drop every cached principal for a user."""
+        with self._lock:
+            for key in self._keys_by_user.pop(user_id, set()):
+                self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._keys_by_user.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _remove(self, key: CacheKey):
+        self._entries.pop(key, None)
+        keys = self._keys_by_user.get(key[0])
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_user[key[0]]
+
+
+# Global principal cache instance
+principal_cache = PrincipalCache(
+    ttl_seconds=settings.principal_cache_ttl_seconds,
+    max_entries=settings.principal_cache_max_entries
+)
+
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _invalidate_cached_principal(mapper, connection, target):
+    """Drop a user's principals on ORM updates and deletes in this process (see PrincipalCache)."""
+    principal_cache.invalidate_user(target.id)
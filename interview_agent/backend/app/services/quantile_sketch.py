@@ -0,0 +1,125 @@
+from math import ceil
+from typing import List, Optional, Tuple
+import random
+
+import numpy as np
+
+# Compaction coin flips for sketches created without a seed
+_shared_rng = random.Random()
+
+
+class KLLSketch:
+    """
+    KLL streaming quantile sketch (Karnin, Lang, Liberty 2016).
+
+    Items enter compactor 0. When a compactor fills it sorts its items and
+    promotes every other one (random offset) to the next level, where each
+    item stands for twice the weight. Capacities shrink geometrically (by c)
+    towards the lower levels, so the sketch holds O(k) items however many
+    it has seen, with rank error around 1/k. Sketches with the same k merge
+    by concatenating levels and compacting.
+    """
+
+    def __init__(self, k: int = 200, c: float = 2 / 3, seed: Optional[int] = None):
+        self.k = k
+        self.c = c
+        self.count = 0
+        self.size = 0  # items held
+        self.compactors: List[List[float]] = []
+        self.max_size = 0
+        self._rng = random.Random(seed) if seed is not None else _shared_rng
+        self._cdf: Optional[Tuple[np.ndarray, np.ndarray]] = None
+        self._grow()
+
+    def __len__(self) -> int:
+        """Items held (not items seen; that is count)."""
+        return self.size
+
+    def update(self, value: float):
+        self.compactors[0].append(float(value))
+        self.count += 1
+        self.size += 1
+        self._cdf = None
+        if self.size >= self.max_size:
+            self._compress()
+
+    def merge(self, other: "KLLSketch"):
+        """Fold another sketch into this one."""
+        while len(self.compactors) < len(other.compactors):
+            self._grow()
+        for level, items in enumerate(other.compactors):
+            self.compactors[level].extend(items)
+        self.count += other.count
+        self.size += other.size
+        self._cdf = None
+        while self.size >= self.max_size:
+            self._compress()
+
+    def rank(self, value: float) -> float:
+        """Estimated fraction of seen values <= value (0.0 when empty)."""
+        if not self.count:
+            return 0.0
+        items, cumulative = self._weighted_cdf()
+        position = int(np.searchsorted(items, value, side="right"))
+        return float(cumulative[position - 1]) / float(cumulative[-1]) if position else 0.0
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Estimated value at fraction q of the distribution, None when empty."""
+        if not self.count:
+            return None
+        items, cumulative = self._weighted_cdf()
+        position = int(np.searchsorted(cumulative, q * cumulative[-1], side="left"))
+        return float(items[min(position, len(items) - 1)])
+
+    def to_dict(self) -> dict:
+        return {"k": self.k, "c": self.c, "count": self.count, "compactors": self.compactors}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "KLLSketch":
+        sketch = cls(k=data["k"], c=data["c"])
+        while len(sketch.compactors) < len(data["compactors"]):
+            sketch._grow()
+        sketch.compactors = [list(items) for items in data["compactors"]]
+        sketch.count = data["count"]
+        sketch.size = sum(len(items) for items in sketch.compactors)
+        return sketch
+
+    def copy(self) -> "KLLSketch":
+        return KLLSketch.from_dict(self.to_dict())
+
+    def _capacity(self, level: int) -> int:
+        depth = len(self.compactors) - level - 1
+        return int(ceil(self.k * self.c ** depth)) + 1
+
+    def _grow(self):
+        self.compactors.append([])
+        self.max_size = sum(self._capacity(level) for level in range(len(self.compactors)))
+
+    def _compress(self):
+        for level in range(len(self.compactors)):
+            if len(self.compactors[level]) < self._capacity(level):
+                continue
+            if level + 1 == len(self.compactors):
+                self._grow()
+            items = sorted(self.compactors[level])
+            # An odd item out, picked at random so neither tail is favoured,
+            # stays behind; the rest are halved into the next level
+            keep = [items.pop(self._rng.randrange(len(items)))] if len(items) % 2 else []
+            promoted = items[self._rng.randrange(2)::2]
+            self.compactors[level + 1].extend(promoted)
+            self.compactors[level] = keep
+            self.size -= len(items) - len(promoted)
+            if self.size < self.max_size:
+                break
+
+    def _weighted_cdf(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Sorted items and cumulative weights, cached until the next update."""
+        if self._cdf is None:
+            items = np.concatenate([np.asarray(level_items, dtype=np.float64) for level_items in self.compactors])
+            weights = np.concatenate([
+                np.full(len(level_items), 2 ** level, dtype=np.float64)
+                for level, level_items in enumerate(self.compactors)
+            ])
+            order = np.argsort(items, kind="stable")
+            self._cdf = items[order], np.cumsum(weights[order])
+        return self._cdf
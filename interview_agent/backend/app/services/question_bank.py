@@ -1,22 +1,321 @@
+import copy
 import json
 import random
+import threading
+import time
+from collections import ChainMap
+from dataclasses import dataclass, field
+from itertools import product
 from pathlib import Path
-from typing import List, Optional, Dict
+from typing import List, Mapping, Optional, Dict, Tuple
+
+import numpy as np
 
 from app.skill_trees import get_skill_tree
+from app.services.question_search import BM25Index, question_document, tokenize
+from app.services.skill_coverage import SkillCoverage
+from app.services.question_store import (
+    CompiledIdMap,
+    CompiledQuestion,
+    CompiledQuestionStore,
+    NULL_LABEL,
+    source_hash,
+)
+from app.services.question_vectors import VectorIndex
 
 
 QUESTIONS_DIR = Path(__file__).parent.parent.parent / "data" / "questions"
+# Build artifacts produced by build_question_bank.py
+INDEX_DIR = QUESTIONS_DIR.parent / "index"
+DOMAINS = ["coding", "system_design", "ml"]
 
+# (domain, topic, subtopic, difficulty); None in a slot means "any"
+IndexKey = Tuple[str, Optional[str], Optional[str], Optional[str]]
 
-def load_questions(domain: str) -> List[dict]:
-    """Load questions for a domain from JSON file."""
-    file_path = QUESTIONS_DIR / f"{domain}.json"
-    if not file_path.exists():
-        return []
 
-    with open(file_path, "r") as f:
-        return json.load(f)
+@dataclass(frozen=True)
+class _BankSnapshot:
+    """Immutable view of the question bank; swapped wholesale on reload."""
+    mtimes: Dict[str, float] = field(default_factory=dict)
+    by_domain: Dict[str, List[dict]] = field(default_factory=dict)
+    by_id: Mapping[str, dict] = field(default_factory=dict)
+    by_key: Dict[IndexKey, List[dict]] = field(default_factory=dict)
+    search: Dict[str, BM25Index] = field(default_factory=dict)
+    vectors: Dict[str, VectorIndex] = field(default_factory=dict)
+    # Domains served from a current compiled artifact; their filter and
+    # search indexes are filled in lazily on first use
+    compiled: Dict[str, CompiledQuestionStore] = field(default_factory=dict)
+    buckets: Dict[str, Dict[Tuple[str, str], List[dict]]] = field(default_factory=dict)
+    coverage: Dict[str, SkillCoverage] = field(default_factory=dict)
+    texts: Dict[str, Dict[str, dict]] = field(default_factory=dict)
+    rubrics: Dict[Tuple[str, ...], List[Dict[str, str]]] = field(default_factory=dict)
+
+
+class QuestionBank:
+    """
+    In-memory, indexed question bank.
+
+    Questions are loaded once and indexed by id and by every combination of
+    (domain, topic, subtopic, difficulty) filters, so lookups never touch
+    disk. File mtimes (question JSON and built index metadata) are checked
+    at most every check_interval seconds and a change triggers an atomic
+    rebuild of the whole snapshot.
+
+    When build_question_bank.py has compiled a domain and the artifact's
+    content hash still matches the JSON, the domain is memory-mapped from
+    the artifact instead of parsed, and questions are decoded on access.
+    """
+
+    def __init__(
+        self,
+        questions_dir: Path = QUESTIONS_DIR,
+        index_dir: Path = INDEX_DIR,
+        check_interval: float = 1.0
+    ):
+        self.questions_dir = questions_dir
+        self.index_dir = index_dir
+        self.check_interval = check_interval
+        self._snapshot = _BankSnapshot()
+        self._last_check = float("-inf")
+        self._lock = threading.Lock()
+
+    def questions(self, domain: str) -> List[dict]:
+        """All questions for a domain."""
+        return self._current().by_domain.get(domain, [])
+
+    def get(self, question_id: str) -> Optional[dict]:
+        """Look up a question by id."""
+        return self._current().by_id.get(question_id)
+
+    def candidates(
+        self,
+        domain: str,
+        topic: Optional[str] = None,
+        subtopic: Optional[str] = None,
+        difficulty: Optional[str] = None
+    ) -> List[dict]:
+        """Questions matching the given filters; None means any value."""
+        snapshot = self._current()
+        key = (domain, topic, subtopic, difficulty)
+        matches = snapshot.by_key.get(key)
+        if matches is None:
+            store = snapshot.compiled.get(domain)
+            if store is None:
+                return []
+            questions = snapshot.by_domain[domain]
+            rows = store.filter(topic=topic, subtopic=subtopic, difficulty=difficulty)
+            matches = snapshot.by_key.setdefault(key, [questions[row] for row in rows])
+        return matches
+
+    def buckets(self, domain: str) -> Dict[Tuple[str, str], List[dict]]:
+        """Questions of a domain grouped by (topic, difficulty)."""
+        snapshot = self._current()
+        groups = snapshot.buckets.get(domain)
+        if groups is None:
+            store = snapshot.compiled.get(domain)
+            if store is not None:
+                labels = store.label_strings()
+                pairs = {
+                    (labels[topic], labels[difficulty])
+                    for topic, difficulty in np.unique(store.labels[:, [1, 3]], axis=0).tolist()
+                    if topic != NULL_LABEL and difficulty != NULL_LABEL
+                }
+            else:
+                pairs = {
+                    (topic, difficulty)
+                    for (key_domain, topic, subtopic, difficulty) in snapshot.by_key
+                    if key_domain == domain and topic is not None and subtopic is None and difficulty is not None
+                }
+            groups = snapshot.buckets.setdefault(domain, {
+                (topic, difficulty): self.candidates(domain, topic, None, difficulty)
+                for topic, difficulty in sorted(pairs)
+            })
+        return groups
+
+    def coverage(self, domain: str) -> SkillCoverage:
+        """Skill x difficulty coverage of a domain's questions, built on first use."""
+        snapshot = self._current()
+        coverage = snapshot.coverage.get(domain)
+        if coverage is None:
+            coverage = snapshot.coverage.setdefault(
+                domain, SkillCoverage(snapshot.by_domain.get(domain, []))
+            )
+        return coverage
+
+    def find_text(self, normalized: str, domains: Optional[List[str]] = None) -> Optional[dict]:
+        """
+        Question whose text normalises to exactly the given string.
+
+        Text is normalised as " ".join(tokenize(text)); the per-domain
+        lookup tables are built on first use.
+        """
+        snapshot = self._current()
+        for domain in domains or DOMAINS:
+            texts = snapshot.texts.get(domain)
+            if texts is None:
+                texts = snapshot.texts.setdefault(domain, {
+                    " ".join(tokenize(q.get("question") or "")): q
+                    for q in snapshot.by_domain.get(domain, [])
+                })
+            question = texts.get(normalized)
+            if question is not None:
+                return question
+        return None
+
+    def rubrics(self, domains: Optional[List[str]] = None) -> List[Dict[str, str]]:
+        """
+        Rubrics of the domains' questions, collected on first use.
+
+        The same list is returned until the bank reloads, so callers can
+        key anything derived from it on its identity.
+        """
+        snapshot = self._current()
+        key = tuple(domains or DOMAINS)
+        rubrics = snapshot.rubrics.get(key)
+        if rubrics is None:
+            rubrics = snapshot.rubrics.setdefault(key, [
+                q["rubric"] for domain in key for q in snapshot.by_domain.get(domain, []) if q.get("rubric")
+            ])
+        return rubrics
+
+    def search(self, domain: str, query: str, count: int) -> List[dict]:
+        """Top questions in a domain by BM25 relevance to a free-text query."""
+        snapshot = self._current()
+        index = snapshot.search.get(domain)
+        if index is None:
+            if domain not in snapshot.compiled:
+                return []
+            index = snapshot.search.setdefault(
+                domain, BM25Index([question_document(q) for q in snapshot.by_domain[domain]])
+            )
+        questions = snapshot.by_domain[domain]
+        return [questions[i] for i in index.search(query, count)]
+
+    def semantic_search(self, domain: str, query: str, count: int) -> List[dict]:
+        """
+        Top questions in a domain by embedding similarity.
+
+        Returns [] until the vector index has been built offline. Ids the
+        index knows but the bank no longer has are skipped.
+        """
+        snapshot = self._current()
+        index = snapshot.vectors.get(domain)
+        if index is None:
+            return []
+        by_id = snapshot.by_id
+        return [by_id[qid] for qid in index.search(query, count) if qid in by_id]
+
+    def reload(self):
+        """Rebuild the snapshot from disk unconditionally."""
+        with self._lock:
+            self._snapshot = self._build(self._read_mtimes())
+            self._last_check = time.monotonic()
+
+    def _current(self) -> _BankSnapshot:
+        now = time.monotonic()
+        if now - self._last_check < self.check_interval:
+            return self._snapshot
+
+        with self._lock:
+            if now - self._last_check >= self.check_interval:
+                mtimes = self._read_mtimes()
+                if mtimes != self._snapshot.mtimes:
+                    self._snapshot = self._build(mtimes)
+                self._last_check = now
+            return self._snapshot
+
+    def _tracked_files(self) -> List[Path]:
+        files = []
+        for domain in DOMAINS:
+            files.append(self.questions_dir / f"{domain}.json")
+            files.append(self.index_dir / f"{domain}.meta.json")
+            files.append(self.index_dir / f"{domain}.qbank")
+        return files
+
+    def _read_mtimes(self) -> Dict[str, float]:
+        return {
+            str(path): path.stat().st_mtime
+            for path in self._tracked_files()
+            if path.exists()
+        }
+
+    def _build(self, mtimes: Dict[str, float]) -> _BankSnapshot:
+        by_domain: Dict[str, List[dict]] = {}
+        by_id: Dict[str, dict] = {}
+        by_key: Dict[IndexKey, List[dict]] = {}
+        search: Dict[str, BM25Index] = {}
+        vectors: Dict[str, VectorIndex] = {}
+        compiled: Dict[str, CompiledQuestionStore] = {}
+        compiled_ids: List[CompiledIdMap] = []
+
+        for domain in DOMAINS:
+            file_path = self.questions_dir / f"{domain}.json"
+            if str(file_path) not in mtimes:
+                continue
+
+            try:
+                vector_index = VectorIndex.load(self.index_dir, domain)
+            except (OSError, ValueError, KeyError):
+                # Unreadable or mid-rebuild: weak-area lookup falls back to
+                # BM25 until the finished index's metadata triggers a reload
+                vector_index = None
+            if vector_index is not None:
+                vectors[domain] = vector_index
+
+            store = CompiledQuestionStore.open_if_current(
+                self.index_dir / f"{domain}.qbank", source_hash([file_path])
+            )
+            if store is not None:
+                questions = [CompiledQuestion(store, row) for row in range(len(store))]
+                by_domain[domain] = questions
+                compiled[domain] = store
+                compiled_ids.append(CompiledIdMap(store, questions))
+                continue
+
+            with open(file_path, "r") as f:
+                questions = json.load(f)
+            by_domain[domain] = questions
+
+            for q in questions:
+                if q.get("id") is not None:
+                    by_id[q["id"]] = q
+                # Index under every wildcard combination of the three filters
+                for topic, subtopic, difficulty in product(
+                    (q.get("topic"), None), (q.get("subtopic"), None), (q.get("difficulty"), None)
+                ):
+                    by_key.setdefault((domain, topic, subtopic, difficulty), []).append(q)
+
+            search[domain] = BM25Index([question_document(q) for q in questions])
+
+        return _BankSnapshot(
+            mtimes=mtimes,
+            by_domain=by_domain,
+            by_id=ChainMap(by_id, *compiled_ids) if compiled_ids else by_id,
+            by_key=by_key,
+            search=search,
+            vectors=vectors,
+            compiled=compiled
+        )
+
+
+# Global question bank instance
+question_bank = QuestionBank()
+
+
+def _as_dict(question: Mapping) -> dict:
+    """
+    A plain, independent copy of a bank question.
+
+    The module-level functions below return these, so callers can mutate
+    or JSON-serialize results without touching the shared snapshot (whose
+    compiled questions are read-only Mapping proxies).
+    """
+    return copy.deepcopy(dict(question))
+
+
+def load_questions(domain: str) -> List[dict]:
+    """Load questions for a domain."""
+    return [_as_dict(q) for q in question_bank.questions(domain)]
 
 
 def get_question(
@@ -39,26 +338,17 @@ def get_question(
     Returns:
         A question dict or None if no matching question found
     """
-    questions = load_questions(domain)
-    exclude_ids = exclude_ids or []
-
-    # Filter questions
-    candidates = []
-    for q in questions:
-        if q.get("id") in exclude_ids:
-            continue
-        if topic and q.get("topic") != topic:
-            continue
-        if subtopic and q.get("subtopic") != subtopic:
-            continue
-        if difficulty and q.get("difficulty") != difficulty:
-            continue
-        candidates.append(q)
+    # Empty filters mean "any", as None does
+    candidates = question_bank.candidates(domain, topic or None, subtopic or None, difficulty or None)
+
+    if exclude_ids:
+        excluded = set(exclude_ids)
+        candidates = [q for q in candidates if q.get("id") not in excluded]
 
     if not candidates:
         return None
 
-    return random.choice(candidates)
+    return _as_dict(random.choice(candidates))
 
 
 def get_questions_for_weak_area(
@@ -67,7 +357,7 @@ def get_questions_for_weak_area(
     count: int = 3
 ) -> List[dict]:
     """
-    Get questions targeting a declared weak area.
+    Get questions targeting a declared weak area, most relevant first.
 
     Args:
         domain: The domain
@@ -77,32 +367,24 @@ def get_questions_for_weak_area(
     Returns:
         List of relevant questions
     """
-    questions = load_questions(domain)
-
-    # Simple keyword matching for now
-    # In production, this would use semantic search
-    weak_area_lower = weak_area.lower()
-    relevant = []
-
-    for q in questions:
-        text = f"{q.get('topic', '')} {q.get('subtopic', '')} {q.get('question', '')}".lower()
-        if any(word in text for word in weak_area_lower.split()):
-            relevant.append(q)
-
-    # Shuffle and return requested count
-    random.shuffle(relevant)
-    return relevant[:count]
+    # Lexical matches (BM25) first; when they run short, fill from semantic
+    # search, which also catches paraphrases and inflected forms.
+    relevant = question_bank.search(domain, weak_area, count)
+    if len(relevant) < count:
+        seen = {q.get("id") for q in relevant}
+        for q in question_bank.semantic_search(domain, weak_area, count):
+            if q.get("id") not in seen:
+                relevant.append(q)
+                seen.add(q.get("id"))
+    return [_as_dict(q) for q in relevant[:count]]
 
 
 def get_follow_up_questions(question_id: str) -> List[str]:
     """Get follow-up questions for a given question."""
-    # Search all domains for the question
-    for domain in ["coding", "system_design", "ml"]:
-        questions = load_questions(domain)
-        for q in questions:
-            if q.get("id") == question_id:
-                return q.get("follow_ups", [])
-    return []
+    question = question_bank.get(question_id)
+    if question is None:
+        return []
+    return list(question.get("follow_ups", []))
 
 
 def generate_follow_up(
@@ -145,9 +427,8 @@ def generate_follow_up(
 
 def get_rubric(question_id: str) -> Optional[Dict]:
     """Get the evaluation rubric for a question."""
-    for domain in ["coding", "system_design", "ml"]:
-        questions = load_questions(domain)
-        for q in questions:
-            if q.get("id") == question_id:
-                return q.get("rubric")
-    return None
+    question = question_bank.get(question_id)
+    if question is None:
+        return None
+    rubric = question.get("rubric")
+    return dict(rubric) if rubric is not None else None
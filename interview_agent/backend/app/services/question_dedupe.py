@@ -0,0 +1,207 @@
+import json
+import zlib
+from pathlib import Path
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+from app.services.question_search import tokenize
+
+
+# Shingles hashed per chunk; bounds the (num_perm x shingles) uint64
+# temporary to 32 MB at the default 128 permutations.
+SHINGLE_CHUNK = 1 << 15
+
+
+def question_text(question: dict) -> str:
+    """Text compared for near-duplicates: the question and its follow-ups."""
+    parts = [question.get("question") or ""]
+    parts.extend(question.get("follow_ups") or [])
+    return " ".join(parts)
+
+
+def shingle_hashes(texts: Sequence[str], size: int = 3) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Hashes of the word size-grams of each normalised text, as one flat array.
+
+    Tokens are hashed once each (CRC32, stable across processes) and
+    combined into shingle hashes with vectorised arithmetic. Texts shorter
+    than size yield a single shingle; empty texts yield none.
+
+    Returns:
+        (hashes, offsets): shingles of text i are hashes[offsets[i]:offsets[i + 1]]
+    """
+    token_hashes: Dict[str, int] = {}
+    padded: List[int] = []
+    starts: List[int] = []
+    counts = np.zeros(len(texts), dtype=np.int64)
+    for i, text in enumerate(texts):
+        tokens = tokenize(text)
+        if not tokens:
+            continue
+        starts.append(len(padded))
+        counts[i] = max(len(tokens) - size + 1, 1)
+        for token in tokens:
+            value = token_hashes.get(token)
+            if value is None:
+                value = token_hashes[token] = zlib.crc32(token.encode())
+            padded.append(value)
+        # Padding keeps every window inside its own text
+        padded.extend([0] * (size - 1))
+
+    sequence = np.asarray(padded, dtype=np.uint64)
+    offsets = np.zeros(len(texts) + 1, dtype=np.int64)
+    np.cumsum(counts, out=offsets[1:])
+    if not starts:
+        return np.empty(0, dtype=np.uint64), offsets
+
+    # Window start positions: each text's run of counts[i] consecutive slots
+    nonempty = counts[counts > 0]
+    positions = np.repeat(np.asarray(starts, dtype=np.int64) - offsets[:-1][counts > 0], nonempty)
+    positions += np.arange(int(offsets[-1]))
+
+    hashes = np.zeros(len(positions), dtype=np.uint64)
+    for k in range(size):
+        hashes = hashes * np.uint64(0x100000001B3) + sequence[positions + k]
+    return hashes, offsets
+
+
+class MinHasher:
+    """
+    MinHash signatures of shingle sets.
+
+    Each of num_perm permutations is simulated by a multiply-shift hash,
+    ((a * x + b) mod 2^64) >> 32. The signatures of a whole corpus are
+    computed in vectorised chunks over all shingles with a segmented minimum
+    per document, so cost is linear in the total number of shingles.
+    """
+
+    def __init__(self, num_perm: int = 128, seed: int = 1):
+        rng = np.random.default_rng(seed)
+        self.num_perm = num_perm
+        self.a = (rng.integers(1, 2**63, size=num_perm, dtype=np.uint64) << np.uint64(1)) | np.uint64(1)
+        self.b = rng.integers(0, 2**63, size=num_perm, dtype=np.uint64)
+
+    def signatures(self, hashes: np.ndarray, offsets: np.ndarray) -> np.ndarray:
+        """(n, num_perm) uint32 signatures; documents without shingles get all-max rows."""
+        count = len(offsets) - 1
+        signatures = np.full((count, self.num_perm), np.iinfo(np.uint32).max, dtype=np.uint32)
+        nonempty = np.flatnonzero(np.diff(offsets))
+        if not len(nonempty):
+            return signatures
+
+        # Whole documents per chunk, so reduceat segments never straddle chunks
+        doc_starts = offsets[nonempty]
+        bounds = np.searchsorted(doc_starts, np.arange(0, offsets[-1], SHINGLE_CHUNK), side="left")
+        bounds = np.unique(np.r_[bounds, len(nonempty)])
+        buffer = np.empty((self.num_perm, SHINGLE_CHUNK + int(np.diff(offsets).max())), dtype=np.uint64)
+        for first, last in zip(bounds[:-1], bounds[1:]):
+            docs = nonempty[first:last]
+            start, end = offsets[docs[0]], offsets[docs[-1] + 1]
+            # Permutations along rows: the segmented min then runs over contiguous memory
+            hashed = buffer[:, :end - start]
+            np.multiply(self.a[:, None], hashes[None, start:end], out=hashed)
+            hashed += self.b[:, None]
+            hashed >>= np.uint64(32)
+            signatures[docs] = np.minimum.reduceat(hashed, offsets[docs] - start, axis=1).T
+        return signatures
+
+
+def lsh_candidate_pairs(signatures: np.ndarray, bands: int) -> np.ndarray:
+    """
+    Pairs of rows that agree on every row of at least one band.
+
+    Each band is reduced to a 64-bit key; rows are sorted by key and each
+    run of equal keys is a bucket. Within a bucket every row is paired with
+    the bucket's first row, which keeps the pair count linear even for
+    large buckets; clustering recovers the transitive links.
+    """
+    n, num_perm = signatures.shape
+    rows = num_perm // bands
+    multipliers = np.random.default_rng(0).integers(1, 2**63, size=rows, dtype=np.uint64) | np.uint64(1)
+    pairs = []
+    for band in range(bands):
+        block = signatures[:, band * rows:(band + 1) * rows].astype(np.uint64)
+        keys = (block * multipliers).sum(axis=1)
+        order = np.argsort(keys, kind="stable")
+        sorted_keys = keys[order]
+        starts = np.r_[True, sorted_keys[1:] != sorted_keys[:-1]]
+        first = order[np.flatnonzero(starts)[np.cumsum(starts) - 1]]
+        linked = first != order
+        if linked.any():
+            pairs.append(np.stack([first[linked], order[linked]], axis=1))
+    if not pairs:
+        return np.empty((0, 2), dtype=np.int64)
+    return np.unique(np.concatenate(pairs), axis=0)
+
+
+def _find(parent: np.ndarray, i: int) -> int:
+    while parent[i] != i:
+        parent[i] = parent[parent[i]]
+        i = parent[i]
+    return i
+
+
+def find_near_duplicates(
+    questions: Sequence[dict],
+    threshold: float = 0.8,
+    num_perm: int = 128,
+    bands: int = 16
+) -> List[List[Tuple[str, float]]]:
+    """
+    Cluster near-duplicate questions.
+
+    Candidate pairs from LSH banding are kept when their estimated Jaccard
+    similarity (fraction of agreeing signature slots) reaches threshold,
+    then merged with union-find. With the defaults (16 bands of 8 rows)
+    pairs above ~0.7 similarity are almost always proposed.
+
+    Returns:
+        Clusters of two or more questions, largest first. Each is a list of
+        (question id, estimated similarity to the cluster's first question).
+    """
+    hashes, offsets = shingle_hashes([question_text(q) for q in questions])
+    signatures = MinHasher(num_perm).signatures(hashes, offsets)
+    empty = (signatures == np.iinfo(np.uint32).max).all(axis=1)
+
+    pairs = lsh_candidate_pairs(signatures, bands)
+    if len(pairs):
+        pairs = pairs[~empty[pairs[:, 0]] & ~empty[pairs[:, 1]]]
+        similarity = (signatures[pairs[:, 0]] == signatures[pairs[:, 1]]).mean(axis=1)
+        pairs = pairs[similarity >= threshold]
+
+    parent = np.arange(len(questions))
+    for i, j in pairs.tolist():
+        root_i, root_j = _find(parent, i), _find(parent, j)
+        if root_i != root_j:
+            parent[max(root_i, root_j)] = min(root_i, root_j)
+
+    groups: Dict[int, List[int]] = {}
+    for i in np.unique(pairs).tolist():
+        groups.setdefault(_find(parent, i), []).append(i)
+
+    clusters = []
+    for members in groups.values():
+        members.sort()
+        head = signatures[members[0]]
+        clusters.append([
+            (str(questions[i].get("id")), round(float((signatures[i] == head).mean()), 3))
+            for i in members
+        ])
+    clusters.sort(key=lambda cluster: (-len(cluster), cluster[0][0]))
+    return clusters
+
+
+def write_duplicate_report(path: Path, domain: str, count: int, clusters: List[List[Tuple[str, float]]]):
+    """Write the duplicate-cluster report as JSON."""
+    report = {
+        "domain": domain,
+        "questions": count,
+        "clusters": [
+            [{"id": question_id, "similarity": similarity} for question_id, similarity in cluster]
+            for cluster in clusters
+        ],
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(report, f, indent=2)
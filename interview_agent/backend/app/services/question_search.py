@@ -0,0 +1,110 @@
+import re
+from typing import Dict, List, Sequence
+
+import numpy as np
+
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+STOPWORDS = frozenset("""
+a an and are as at be by can do does for from how i if in into is it its me my
+of on or our so that the their then there these this to was we what when where
+which while who why will with you your would could should about
+""".split())
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase, split on non-alphanumerics (including underscores) and drop stopwords."""
+    return [
+        token for token in TOKEN_PATTERN.findall(text.lower())
+        if token not in STOPWORDS and (len(token) > 1 or token.isdigit())
+    ]
+
+
+def question_document(question: dict) -> List[str]:
+    """
+    Tokens indexed for a question.
+
+    Topic and subtopic are repeated so a match on the skill name outweighs a
+    passing mention in the question text.
+    """
+    parts = [
+        question.get("topic") or "",
+        question.get("subtopic") or "",
+    ] * 2
+    parts.append(question.get("question") or "")
+    parts.extend(question.get("follow_ups") or [])
+    parts.extend((question.get("rubric") or {}).values())
+    return tokenize(" ".join(parts))
+
+
+class BM25Index:
+    """
+    Okapi BM25 over an inverted index stored as CSR-style NumPy arrays.
+
+    postings for term t are doc_ids[indptr[t]:indptr[t + 1]] with matching
+    term frequencies in tfs. A query touches only the postings of its own
+    terms, scores them with vectorized arithmetic and selects the top k with
+    argpartition.
+    """
+
+    def __init__(self, documents: Sequence[List[str]], k1: float = 1.2, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self.num_docs = len(documents)
+
+        postings: Dict[str, Dict[int, int]] = {}
+        doc_len = np.zeros(self.num_docs, dtype=np.float32)
+        for doc_id, tokens in enumerate(documents):
+            doc_len[doc_id] = len(tokens)
+            for token in tokens:
+                counts = postings.setdefault(token, {})
+                counts[doc_id] = counts.get(doc_id, 0) + 1
+
+        self.vocabulary: Dict[str, int] = {}
+        indptr = [0]
+        doc_ids: List[int] = []
+        tfs: List[int] = []
+        for term_id, (token, counts) in enumerate(postings.items()):
+            self.vocabulary[token] = term_id
+            doc_ids.extend(counts.keys())
+            tfs.extend(counts.values())
+            indptr.append(len(doc_ids))
+
+        self.indptr = np.asarray(indptr, dtype=np.int64)
+        self.doc_ids = np.asarray(doc_ids, dtype=np.int32)
+        self.tfs = np.asarray(tfs, dtype=np.float32)
+
+        doc_freq = np.diff(self.indptr).astype(np.float32)
+        self.idf = np.log1p((self.num_docs - doc_freq + 0.5) / (doc_freq + 0.5)).astype(np.float32)
+
+        avg_len = float(doc_len.mean()) if self.num_docs else 0.0
+        # Per-document length normalisation, precomputed once
+        self.norm = (k1 * (1 - b + b * doc_len / max(avg_len, 1e-9))).astype(np.float32)
+
+    def scores(self, query: str) -> np.ndarray:
+        """BM25 score of every document for the query."""
+        scores = np.zeros(self.num_docs, dtype=np.float32)
+        for token in set(tokenize(query)):
+            term_id = self.vocabulary.get(token)
+            if term_id is None:
+                continue
+            start, end = self.indptr[term_id], self.indptr[term_id + 1]
+            docs = self.doc_ids[start:end]
+            tf = self.tfs[start:end]
+            # doc ids are unique within a posting list, so fancy-index += is safe
+            scores[docs] += self.idf[term_id] * tf * (self.k1 + 1) / (tf + self.norm[docs])
+        return scores
+
+    def search(self, query: str, k: int) -> List[int]:
+        """Indices of the top k matching documents, best first."""
+        if k <= 0 or self.num_docs == 0:
+            return []
+
+        scores = self.scores(query)
+        matched = np.flatnonzero(scores > 0)
+        if matched.size > k:
+            top = np.argpartition(-scores[matched], k - 1)[:k]
+            matched = matched[top]
+        order = np.argsort(-scores[matched], kind="stable")
+        return matched[order].tolist()
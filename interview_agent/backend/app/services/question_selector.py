@@ -0,0 +1,249 @@
+import heapq
+import itertools
+import random
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from app.services.question_bank import QuestionBank, question_bank
+from app.services.skill_coverage import DIFFICULTIES
+
+# Weak-signal thresholds (weak_signals holds a weakness score, higher = weaker)
+CONFIRMED_WEAK_THRESHOLD = 0.6
+DISPROVED_THRESHOLD = 0.3
+NEUTRAL_SIGNAL = 0.5
+
+# Priority tiers, lowest served first (specs section 8)
+TIER_CONFIRMED_WEAK = 0
+TIER_DECLARED = 1
+TIER_RESUME = 2
+TIER_COVERAGE = 3
+
+# Questions per declared area / resume used to map free text onto topics
+AREA_MATCHES = 3
+RESUME_MATCHES = 5
+
+BucketKey = Tuple[str, str, str]  # (domain, topic, difficulty)
+
+
+@dataclass
+class _Bucket:
+    """Questions of one (domain, topic, difficulty), walked in a random cyclic order."""
+    questions: List[dict]
+    start: int
+    stride: int
+    position: int = 0
+    asked: bytearray = field(default_factory=bytearray)
+    remaining: int = 0
+    version: int = 0
+
+    def is_asked(self, index: int) -> bool:
+        return bool(self.asked[index >> 3] & (1 << (index & 7)))
+
+    def mark_asked(self, index: int) -> bool:
+        if self.is_asked(index):
+            return False
+        self.asked[index >> 3] |= 1 << (index & 7)
+        self.remaining -= 1
+        return True
+
+    def take(self) -> Optional[dict]:
+        """Next unasked question; each index is visited once per full cycle."""
+        count = len(self.questions)
+        while self.remaining and self.position < count:
+            index = (self.start + self.position * self.stride) % count
+            self.position += 1
+            if self.mark_asked(index):
+                return self.questions[index]
+        return None
+
+
+def _coprime_stride(count: int, rng: random.Random) -> int:
+    """Random stride coprime to count, so stepping by it visits every index."""
+    if count <= 2:
+        return 1
+    while True:
+        stride = rng.randrange(1, count)
+        a, b = stride, count
+        while b:
+            a, b = b, a % b
+        if a == 1:
+            return stride
+
+
+class QuestionSelector:
+    """
+    Per-session next-question selection.
+
+    Candidate (domain, topic, difficulty) buckets sit in a heap keyed by
+    utility: priority tier (confirmed weak > declared weak > resume risk >
+    coverage), then uncovered before covered, then distance from the
+    topic's target difficulty (moved to the nearest level the bank covers,
+    per the skill coverage matrix), then weakness. Signal changes re-key only
+    the buckets of the affected topic; stale heap entries are skipped when
+    popped, so updates and next_question are O(log n) in the number of
+    buckets. Asked questions are tracked in per-bucket bitsets.
+    """
+
+    def __init__(
+        self,
+        domains: List[str],
+        declared_weak_areas: Optional[List[str]] = None,
+        bank: QuestionBank = question_bank,
+        seed: Optional[int] = None
+    ):
+        self.domains = list(domains)
+        self._bank = bank
+        self._rng = random.Random(seed)
+        self._buckets: Dict[BucketKey, _Bucket] = {}
+        self._topic_buckets: Dict[str, List[BucketKey]] = {}
+        self._heap: List[Tuple[tuple, int, BucketKey, int]] = []
+        self._counter = itertools.count()
+
+        self.weak_signals: Dict[str, float] = {}
+        # Weakness implied through the prerequisite graph, for topics
+        # without direct evidence
+        self.inferred_signals: Dict[str, float] = {}
+        self.covered: Set[str] = set()
+        self.declared_topics: Set[str] = set()
+        self.resume_topics: Set[str] = set()
+
+        for domain in self.domains:
+            for (topic, difficulty), questions in bank.buckets(domain).items():
+                key = (domain, topic, difficulty)
+                self._buckets[key] = _Bucket(
+                    questions=questions,
+                    start=self._rng.randrange(len(questions)),
+                    stride=_coprime_stride(len(questions), self._rng),
+                    asked=bytearray((len(questions) + 7) // 8),
+                    remaining=len(questions)
+                )
+                self._topic_buckets.setdefault(topic, []).append(key)
+
+        self.declared_topics = self._match_topics(declared_weak_areas or [], AREA_MATCHES)
+        for key in self._buckets:
+            self._push(key)
+
+    def next_question(self) -> Optional[dict]:
+        """Highest-utility unasked question, or None when all are exhausted."""
+        while self._heap:
+            _, _, key, version = self._heap[0]
+            bucket = self._buckets[key]
+            if version != bucket.version or not bucket.remaining:
+                heapq.heappop(self._heap)
+                continue
+            question = bucket.take()
+            if not bucket.remaining:
+                heapq.heappop(self._heap)
+            return question
+        return None
+
+    def exclude(self, question_ids: Iterable[str]):
+        """Mark questions as already asked (e.g. from earlier sessions)."""
+        for question_id in question_ids:
+            question = self._bank.get(question_id)
+            if question is None:
+                continue
+            key = (question.get("domain"), question.get("topic"), question.get("difficulty"))
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                continue
+            for index, candidate in enumerate(bucket.questions):
+                if candidate.get("id") == question_id:
+                    bucket.mark_asked(index)
+                    break
+
+    def update_weak_signal(self, topic: str, weakness: float):
+        """Apply a new weakness score for a topic and re-key its buckets."""
+        self.weak_signals[topic] = weakness
+        self._refresh(topic)
+
+    def update_inferred_signals(self, inferred: Dict[str, float]):
+        """Replace the inferred weaknesses and re-key topics whose value changed."""
+        previous = self.inferred_signals
+        self.inferred_signals = dict(inferred)
+        for topic in previous.keys() | inferred.keys():
+            if previous.get(topic) != inferred.get(topic):
+                self._refresh(topic)
+
+    def mark_topic_covered(self, topic: str):
+        """Record topic coverage and re-key its buckets."""
+        if topic not in self.covered:
+            self.covered.add(topic)
+            self._refresh(topic)
+
+    def set_resume_text(self, resume_text: str):
+        """Derive resume risk topics from parsed resume text."""
+        previous = self.resume_topics
+        self.resume_topics = self._match_topics([resume_text], RESUME_MATCHES)
+        for topic in previous ^ self.resume_topics:
+            self._refresh(topic)
+
+    def tier(self, topic: str) -> int:
+        """Priority tier of a topic under the current signals."""
+        signal = self.weak_signals.get(topic)
+        if signal is not None and signal >= CONFIRMED_WEAK_THRESHOLD:
+            return TIER_CONFIRMED_WEAK
+        if topic in self.covered:
+            return TIER_COVERAGE
+        # A declaration holds unless in-session evidence disproves it
+        if topic in self.declared_topics and (signal is None or signal > DISPROVED_THRESHOLD):
+            return TIER_DECLARED
+        if topic in self.resume_topics:
+            return TIER_RESUME
+        return TIER_COVERAGE
+
+    def weakness(self, topic: str) -> float:
+        """Direct weak signal if any, else the inferred one, else neutral."""
+        signal = self.weak_signals.get(topic)
+        if signal is None:
+            signal = self.inferred_signals.get(topic, NEUTRAL_SIGNAL)
+        return signal
+
+    def target_difficulty(self, topic: str) -> int:
+        """Step difficulty down for weak topics and up for strong ones."""
+        signal = self.weakness(topic)
+        if signal >= CONFIRMED_WEAK_THRESHOLD:
+            return 0
+        if signal <= DISPROVED_THRESHOLD:
+            return 2
+        return 1
+
+    def _reachable_target(self, domain: str, topic: str) -> int:
+        """Target difficulty moved to the nearest level the bank has questions for."""
+        target = self.target_difficulty(topic)
+        coverage = self._bank.coverage(domain)
+        for level in sorted(range(len(DIFFICULTIES)), key=lambda level: (abs(level - target), level)):
+            # None means the topic is not in the skill trees; keep the target
+            if coverage.has_questions(domain, topic, DIFFICULTIES[level]) is not False:
+                return level
+        return target
+
+    def _utility(self, key: BucketKey) -> tuple:
+        domain, topic, difficulty = key
+        level = DIFFICULTIES.index(difficulty) if difficulty in DIFFICULTIES else 1
+        return (
+            self.tier(topic),
+            topic in self.covered,
+            abs(level - self._reachable_target(domain, topic)),
+            -self.weakness(topic),
+        )
+
+    def _push(self, key: BucketKey):
+        bucket = self._buckets[key]
+        if bucket.remaining:
+            heapq.heappush(self._heap, (self._utility(key), next(self._counter), key, bucket.version))
+
+    def _refresh(self, topic: str):
+        for key in self._topic_buckets.get(topic, []):
+            self._buckets[key].version += 1
+            self._push(key)
+
+    def _match_topics(self, texts: List[str], count: int) -> Set[str]:
+        """Map free-text areas onto bank topics via lexical question search."""
+        topics = set()
+        for text in texts:
+            for domain in self.domains:
+                for q in self._bank.search(domain, text, count):
+                    if q.get("topic") is not None:
+                        topics.add(q["topic"])
+        return topics
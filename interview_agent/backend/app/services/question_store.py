@@ -0,0 +1,270 @@
+import hashlib
+import json
+import mmap
+import struct
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence
+
+import numpy as np
+
+
+MAGIC = b"QBNK"
+FORMAT_VERSION = 1
+
+# magic, version, reserved, row count, label count, source content hash
+HEADER = struct.Struct("<4sHHII32s")
+SECTION = struct.Struct("<QQ")  # offset, length in bytes
+SECTIONS = (
+    "label_offsets",    # uint32[n_labels + 1] into label_blob
+    "label_blob",       # utf-8 interned strings (domain, topic, subtopic, difficulty)
+    "id_offsets",       # uint32[n + 1] into id_blob
+    "id_blob",          # utf-8 question ids, in row order
+    "id_order",         # uint32[n] rows sorted by id, for binary search
+    "labels",           # uint32[n, 4] label indices: domain, topic, subtopic, difficulty
+    "payload_offsets",  # uint64[n + 1] into payload_blob
+    "payload_blob",     # utf-8 JSON of each full question
+)
+LABEL_FIELDS = ("domain", "topic", "subtopic", "difficulty")
+NULL_LABEL = 0xFFFFFFFF
+
+
+def source_hash(paths: Sequence[Path]) -> bytes:
+    """SHA-256 over the names and bytes of the source files, in order."""
+    digest = hashlib.sha256()
+    for path in paths:
+        digest.update(path.name.encode())
+        digest.update(b"\0")
+        digest.update(path.read_bytes())
+        digest.update(b"\0")
+    return digest.digest()
+
+
+def _string_table(strings: Sequence[str]):
+    encoded = [s.encode("utf-8") for s in strings]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.uint32)
+    np.cumsum([len(e) for e in encoded], out=offsets[1:])
+    return offsets, b"".join(encoded)
+
+
+def compile_question_bank(questions: Sequence[dict], output_path: Path, content_hash: bytes):
+    """
+    Write questions to the compact columnar binary format.
+
+    Labels are interned into one string table and referenced by fixed-width
+    uint32 columns; full questions are kept as JSON payloads addressed by an
+    offset column so they can be decoded one at a time.
+    """
+    label_ids: Dict[str, int] = {}
+    labels = np.full((len(questions), len(LABEL_FIELDS)), NULL_LABEL, dtype=np.uint32)
+    for row, q in enumerate(questions):
+        for col, name in enumerate(LABEL_FIELDS):
+            value = q.get(name)
+            if value is not None:
+                labels[row, col] = label_ids.setdefault(value, len(label_ids))
+
+    ids = [str(q.get("id", "")) for q in questions]
+    label_offsets, label_blob = _string_table(list(label_ids))
+    id_offsets, id_blob = _string_table(ids)
+    id_order = np.asarray(sorted(range(len(ids)), key=ids.__getitem__), dtype=np.uint32)
+
+    payloads = [json.dumps(q, separators=(",", ":")).encode("utf-8") for q in questions]
+    payload_offsets = np.zeros(len(payloads) + 1, dtype=np.uint64)
+    np.cumsum([len(p) for p in payloads], out=payload_offsets[1:])
+
+    sections = [
+        label_offsets.tobytes(), label_blob,
+        id_offsets.tobytes(), id_blob,
+        id_order.tobytes(),
+        labels.tobytes(),
+        payload_offsets.tobytes(), b"".join(payloads),
+    ]
+
+    position = HEADER.size + SECTION.size * len(SECTIONS)
+    table = []
+    for data in sections:
+        position += -position % 8  # keep numeric columns 8-byte aligned
+        table.append((position, len(data)))
+        position += len(data)
+
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = output_path.with_suffix(output_path.suffix + ".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, FORMAT_VERSION, 0, len(questions), len(label_ids), content_hash))
+        for offset, length in table:
+            f.write(SECTION.pack(offset, length))
+        for (offset, _), data in zip(table, sections):
+            f.write(b"\0" * (offset - f.tell()))
+            f.write(data)
+    # Atomic replace so a running server never maps a half-written file
+    tmp_path.replace(output_path)
+
+
+class CompiledQuestionStore:
+    """
+    Read-only, memory-mapped view of a compiled question bank.
+
+    Opening the file only parses the header: columns are zero-copy NumPy
+    views over the mapping, strings are decoded on access and question
+    payloads are JSON-decoded one row at a time.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, _, count, n_labels, content_hash = HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise ValueError(f"{path} is not a version {FORMAT_VERSION} compiled question bank")
+        self.count = count
+        self.content_hash = content_hash
+
+        sections = {}
+        for i, name in enumerate(SECTIONS):
+            sections[name] = SECTION.unpack_from(self._mmap, HEADER.size + i * SECTION.size)
+
+        def column(name, dtype, shape=None):
+            offset, length = sections[name]
+            array = np.frombuffer(self._mmap, dtype=dtype, count=length // np.dtype(dtype).itemsize, offset=offset)
+            return array.reshape(shape) if shape else array
+
+        self._label_offsets = column("label_offsets", np.uint32)
+        self._label_blob = sections["label_blob"][0]
+        self._id_offsets = column("id_offsets", np.uint32)
+        self._id_blob = sections["id_blob"][0]
+        self._id_order = column("id_order", np.uint32)
+        self.labels = column("labels", np.uint32, (count, len(LABEL_FIELDS)))
+        self._payload_offsets = column("payload_offsets", np.uint64)
+        self._payload_blob = sections["payload_blob"][0]
+
+        self._label_strings: Optional[List[str]] = None
+        self._label_index: Optional[Dict[str, int]] = None
+        self._n_labels = n_labels
+
+    @classmethod
+    def open_if_current(cls, path: Path, content_hash: bytes) -> Optional["CompiledQuestionStore"]:
+        """Open the store if it exists and was compiled from content_hash."""
+        if not path.exists():
+            return None
+        try:
+            store = cls(path)
+        except (ValueError, struct.error):
+            return None
+        return store if store.content_hash == content_hash else None
+
+    def __len__(self) -> int:
+        return self.count
+
+    def label_strings(self) -> List[str]:
+        """Interned label strings (small: distinct domains/topics/difficulties)."""
+        if self._label_strings is None:
+            offsets = self._label_offsets
+            self._label_strings = [
+                bytes(self._mmap[self._label_blob + offsets[i]:self._label_blob + offsets[i + 1]]).decode("utf-8")
+                for i in range(self._n_labels)
+            ]
+            self._label_index = {s: i for i, s in enumerate(self._label_strings)}
+        return self._label_strings
+
+    def label(self, row: int, field: str) -> Optional[str]:
+        value = int(self.labels[row, LABEL_FIELDS.index(field)])
+        return None if value == NULL_LABEL else self.label_strings()[value]
+
+    def question_id(self, row: int) -> str:
+        start = self._id_blob + int(self._id_offsets[row])
+        end = self._id_blob + int(self._id_offsets[row + 1])
+        return bytes(self._mmap[start:end]).decode("utf-8")
+
+    def payload(self, row: int) -> dict:
+        start = self._payload_blob + int(self._payload_offsets[row])
+        end = self._payload_blob + int(self._payload_offsets[row + 1])
+        return json.loads(self._mmap[start:end])
+
+    def find(self, question_id: str) -> Optional[int]:
+        """Row of a question id by binary search over the sorted id order."""
+        lo, hi = 0, self.count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self.question_id(int(self._id_order[mid])) < question_id:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < self.count:
+            row = int(self._id_order[lo])
+            if self.question_id(row) == question_id:
+                return row
+        return None
+
+    def filter(self, **filters: Optional[str]) -> np.ndarray:
+        """Rows whose labels equal every given non-None filter value."""
+        self.label_strings()
+        mask = np.ones(self.count, dtype=bool)
+        for field, value in filters.items():
+            if value is None:
+                continue
+            label = self._label_index.get(value)
+            if label is None:
+                return np.empty(0, dtype=np.int64)
+            mask &= self.labels[:, LABEL_FIELDS.index(field)] == label
+        return np.flatnonzero(mask)
+
+
+class CompiledQuestion(Mapping):
+    """
+    Question backed by a compiled store row.
+
+    Label fields come straight from the columns; the first access to any
+    other field decodes the row's JSON payload.
+    """
+
+    __slots__ = ("_store", "_row", "_data")
+
+    def __init__(self, store: CompiledQuestionStore, row: int):
+        self._store = store
+        self._row = row
+        self._data = None
+
+    def _payload(self) -> dict:
+        if self._data is None:
+            self._data = self._store.payload(self._row)
+        return self._data
+
+    def __getitem__(self, key):
+        if self._data is None:
+            if key == "id":
+                return self._store.question_id(self._row)
+            if key in LABEL_FIELDS:
+                value = self._store.label(self._row, key)
+                if value is not None:
+                    return value
+        return self._payload()[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._payload())
+
+    def __len__(self) -> int:
+        return len(self._payload())
+
+    def __repr__(self):
+        return f"<CompiledQuestion(id={self['id']})>"
+
+
+class CompiledIdMap(Mapping):
+    """Question id -> CompiledQuestion, resolved by binary search."""
+
+    def __init__(self, store: CompiledQuestionStore, questions: List[CompiledQuestion]):
+        self._store = store
+        self._questions = questions
+
+    def __getitem__(self, question_id: str) -> CompiledQuestion:
+        row = self._store.find(question_id)
+        if row is None:
+            raise KeyError(question_id)
+        return self._questions[row]
+
+    def __iter__(self) -> Iterator[str]:
+        return (self._store.question_id(row) for row in range(len(self._store)))
+
+    def __len__(self) -> int:
+        return len(self._store)
@@ -0,0 +1,299 @@
+import hashlib
+import json
+import zlib
+from pathlib import Path
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.services.question_search import question_document, tokenize
+
+
+# Rows scored per matrix product; bounds the float32 temporaries to
+# SCAN_CHUNK_ROWS x dim regardless of bank size.
+SCAN_CHUNK_ROWS = 65536
+
+# Banks at least this large get IVF partitioning by default
+IVF_MIN_QUESTIONS = 50000
+
+
+class HashedNgramEncoder:
+    """
+    Network-free text encoder using hashed character n-grams.
+
+    Each n-gram of the normalised text is hashed (CRC32, stable across
+    processes) into one of dim buckets with a hash-derived sign. Counts are
+    log-scaled and the vector is L2-normalised, so a dot product is cosine
+    similarity. Robust to inflections ("memoize" vs "memoization") where
+    exact-token search misses.
+    """
+
+    def __init__(self, dim: int = 256, ngram_range: Tuple[int, int] = (3, 5)):
+        self.dim = dim
+        self.ngram_range = ngram_range
+
+    def encode(self, texts: Sequence[str]) -> np.ndarray:
+        """Encode texts into an (n, dim) float32 matrix of unit vectors."""
+        matrix = np.zeros((len(texts), self.dim), dtype=np.float32)
+        min_n, max_n = self.ngram_range
+
+        for row, text in enumerate(texts):
+            normalised = f" {' '.join(tokenize(text))} "
+            hashes = [
+                zlib.crc32(normalised[i:i + n].encode())
+                for n in range(min_n, max_n + 1)
+                for i in range(len(normalised) - n + 1)
+            ]
+            if not hashes:
+                continue
+            hashes = np.asarray(hashes, dtype=np.uint32)
+            signs = np.where(hashes >> 31, 1.0, -1.0)
+            matrix[row] = np.bincount(hashes % self.dim, weights=signs, minlength=self.dim)
+
+        matrix = np.sign(matrix) * np.log1p(np.abs(matrix))
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        return matrix / np.maximum(norms, 1e-12)
+
+    def to_meta(self) -> dict:
+        return {"dim": self.dim, "ngram_range": list(self.ngram_range)}
+
+    @classmethod
+    def from_meta(cls, meta: dict) -> "HashedNgramEncoder":
+        return cls(dim=meta["dim"], ngram_range=tuple(meta["ngram_range"]))
+
+
+def _spherical_kmeans(vectors: np.ndarray, n_lists: int, iterations: int = 10, seed: int = 0) -> np.ndarray:
+    """Cluster unit vectors by cosine similarity; returns unit centroids."""
+    rng = np.random.default_rng(seed)
+    sample = vectors[rng.choice(len(vectors), size=min(len(vectors), n_lists * 64), replace=False)]
+    sample = np.asarray(sample, dtype=np.float32)
+    centroids = sample[rng.choice(len(sample), size=n_lists, replace=False)]
+
+    for _ in range(iterations):
+        assignment = np.argmax(sample @ centroids.T, axis=1)
+        for c in range(n_lists):
+            members = sample[assignment == c]
+            if len(members):
+                centroids[c] = members.sum(axis=0)
+        centroids /= np.maximum(np.linalg.norm(centroids, axis=1, keepdims=True), 1e-12)
+
+    return centroids
+
+
+def _assign(vectors: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+    assignment = np.empty(len(vectors), dtype=np.int32)
+    for start in range(0, len(vectors), SCAN_CHUNK_ROWS):
+        chunk = np.asarray(vectors[start:start + SCAN_CHUNK_ROWS], dtype=np.float32)
+        assignment[start:start + len(chunk)] = np.argmax(chunk @ centroids.T, axis=1)
+    return assignment
+
+
+def _sidecar_path(index_dir: Path, name: str, build: str, part: str) -> Path:
+    """Array file of one build of an index; the build id is part of its name."""
+    return index_dir / f"{name}.{build}.{part}.npy"
+
+
+def _save_atomic(path: Path, array: np.ndarray):
+    """np.save to a temporary file, then swap it in, so readers never map a partial file."""
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp_path, "wb") as f:
+        np.save(f, array)
+    tmp_path.replace(path)
+
+
+def write_vector_index(
+    output_dir: Path,
+    name: str,
+    ids: Sequence[str],
+    vectors: np.ndarray,
+    encoder: HashedNgramEncoder,
+    n_lists: Optional[int] = None
+):
+    """
+    Persist a vector index as {name}.meta.json plus {name}.{build}.vectors.npy,
+    .ids.npy and (with IVF) .centroids.npy.
+
+    build is a content hash of the arrays, recorded in the metadata and in
+    every array file's name, so a reader always opens the arrays of the
+    metadata it read and never pairs files of two builds. With IVF, rows
+    are reordered so each inverted list is a contiguous slice of the
+    memory-mapped matrix; list boundaries are stored in the metadata.
+    """
+    output_dir.mkdir(parents=True, exist_ok=True)
+    ids = np.asarray(ids, dtype=str)
+    if n_lists is None:
+        n_lists = int(np.sqrt(len(ids))) if len(ids) >= IVF_MIN_QUESTIONS else 0
+    # k-means seeds each list with a distinct question
+    n_lists = min(n_lists, len(ids))
+
+    meta = {"encoder": encoder.to_meta(), "count": len(ids), "ivf": None}
+    arrays = {}
+    if n_lists:
+        centroids = _spherical_kmeans(vectors, n_lists)
+        assignment = _assign(vectors, centroids)
+        order = np.argsort(assignment, kind="stable")
+        vectors = vectors[order]
+        ids = ids[order]
+        offsets = np.searchsorted(assignment[order], np.arange(n_lists + 1))
+        arrays["centroids"] = centroids.astype(np.float32)
+        meta["ivf"] = {"n_lists": n_lists, "offsets": offsets.tolist()}
+    arrays["vectors"] = np.asarray(vectors, dtype=np.float16)
+    arrays["ids"] = ids
+
+    digest = hashlib.sha256(json.dumps(meta, sort_keys=True).encode())
+    for part in sorted(arrays):
+        digest.update(np.ascontiguousarray(arrays[part]).tobytes())
+    meta["build"] = build = digest.hexdigest()[:16]
+
+    # Array files are written under new names (or replaced atomically by
+    # identical content): running servers keep their mapping of the old
+    # build instead of seeing it truncated under them
+    for part, array in arrays.items():
+        _save_atomic(_sidecar_path(output_dir, name, build, part), array)
+    # Metadata last: swapping it in switches readers to the new build
+    meta_path = output_dir / f"{name}.meta.json"
+    tmp_path = meta_path.with_suffix(".json.tmp")
+    with open(tmp_path, "w") as f:
+        json.dump(meta, f)
+    tmp_path.replace(meta_path)
+
+    # Drop older builds' arrays (and unversioned ones from before builds had
+    # ids); processes that mapped them keep their pages until they reload
+    for path in output_dir.glob(f"{name}.*.npy"):
+        if path.name.split(".")[1] != build:
+            path.unlink(missing_ok=True)
+
+
+def build_question_vectors(
+    questions: List[dict],
+    output_dir: Path,
+    domain: str,
+    encoder: Optional[HashedNgramEncoder] = None,
+    n_lists: Optional[int] = None
+):
+    """Embed a domain's questions and write its vector index."""
+    encoder = encoder or HashedNgramEncoder()
+    texts = [" ".join(question_document(q)) for q in questions]
+    write_vector_index(
+        output_dir,
+        domain,
+        [q["id"] for q in questions],
+        encoder.encode(texts),
+        encoder,
+        n_lists
+    )
+
+
+class VectorIndex:
+    """
+    Read-only cosine-similarity index over a memory-mapped float16 matrix.
+
+    The matrix and id column are opened with np.load(mmap_mode="r"), so
+    loading is O(1) and every worker process shares the same pages through
+    the OS page cache.
+    """
+
+    def __init__(
+        self,
+        vectors: np.ndarray,
+        ids: np.ndarray,
+        encoder: HashedNgramEncoder,
+        centroids: Optional[np.ndarray] = None,
+        offsets: Optional[List[int]] = None
+    ):
+        self.vectors = vectors
+        self.ids = ids
+        self.encoder = encoder
+        self.centroids = centroids
+        self.offsets = offsets
+
+    @classmethod
+    def load(cls, index_dir: Path, name: str) -> Optional["VectorIndex"]:
+        """
+        Open a vector index, or return None if it has not been built (or was
+        built before indexes had build ids).
+
+        Raises OSError if the metadata's array files are gone (a newer build
+        replaced them after the metadata was read) and ValueError if they do
+        not match it.
+        """
+        meta_path = index_dir / f"{name}.meta.json"
+        if not meta_path.exists():
+            return None
+
+        with open(meta_path) as f:
+            meta = json.load(f)
+        build = meta.get("build")
+        if build is None:
+            return None
+
+        encoder = HashedNgramEncoder.from_meta(meta["encoder"])
+        centroids = offsets = None
+        if meta.get("ivf"):
+            centroids = np.load(_sidecar_path(index_dir, name, build, "centroids"))
+            offsets = meta["ivf"]["offsets"]
+            if len(centroids) != meta["ivf"]["n_lists"] or offsets[-1] != meta["count"]:
+                raise ValueError(f"IVF lists of vector index {name} do not match its metadata")
+
+        vectors = np.load(_sidecar_path(index_dir, name, build, "vectors"), mmap_mode="r")
+        ids = np.load(_sidecar_path(index_dir, name, build, "ids"), mmap_mode="r")
+        if not len(vectors) == len(ids) == meta["count"] or vectors.shape[1] != encoder.dim:
+            raise ValueError(f"Arrays of vector index {name} do not match its metadata")
+
+        return cls(
+            vectors=vectors,
+            ids=ids,
+            encoder=encoder,
+            centroids=centroids,
+            offsets=offsets
+        )
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def search(self, query: str, k: int, nprobe: int = 8) -> List[str]:
+        """Ids of the k most similar questions, best first."""
+        return self.search_batch([query], k, nprobe)[0]
+
+    def search_batch(self, queries: Sequence[str], k: int, nprobe: int = 8) -> List[List[str]]:
+        """
+        Top-k ids for several queries with one pass over the scanned rows.
+
+        With IVF, only the nprobe lists closest to each query are scanned
+        (the union across the batch, each query scoring the same rows).
+        """
+        if not queries or k <= 0 or len(self) == 0:
+            return [[] for _ in queries]
+
+        encoded = self.encoder.encode(queries)
+        if self.centroids is not None:
+            probes = np.argsort(-(encoded @ self.centroids.T), axis=1)[:, :nprobe]
+            ranges = [(self.offsets[c], self.offsets[c + 1]) for c in np.unique(probes)]
+        else:
+            ranges = [(0, len(self))]
+
+        best_scores = np.full((len(queries), 0), -np.inf, dtype=np.float32)
+        best_rows = np.zeros((len(queries), 0), dtype=np.int64)
+        for range_start, range_end in ranges:
+            for start in range(range_start, range_end, SCAN_CHUNK_ROWS):
+                end = min(start + SCAN_CHUNK_ROWS, range_end)
+                chunk = np.asarray(self.vectors[start:end], dtype=np.float32)
+                scores = encoded @ chunk.T
+                rows = np.broadcast_to(np.arange(start, end), scores.shape)
+                best_scores, best_rows = _merge_topk(best_scores, best_rows, scores, rows, k)
+
+        results = []
+        for scores, rows in zip(best_scores, best_rows):
+            order = np.argsort(-scores, kind="stable")
+            results.append([str(self.ids[r]) for r, s in zip(rows[order], scores[order]) if s > 0])
+        return results
+
+
+def _merge_topk(best_scores, best_rows, scores, rows, k):
+    """Keep the k highest scores per row across the running and new block."""
+    scores = np.concatenate([best_scores, scores], axis=1)
+    rows = np.concatenate([best_rows, rows], axis=1)
+    if scores.shape[1] <= k:
+        return scores, rows
+    top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+    return np.take_along_axis(scores, top, axis=1), np.take_along_axis(rows, top, axis=1)
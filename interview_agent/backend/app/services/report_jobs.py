@@ -0,0 +1,266 @@
+from dataclasses import asdict
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional, Tuple
+import asyncio
+import logging
+
+from sqlalchemy import and_, or_, select, update
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.orm import Session
+
+from app.config import get_settings
+from app.database import SessionLocal
+from app.models.report import ReportJob
+from app.models.session import InterviewSession, SessionContent
+from app.services.evaluation import SessionEvaluation, evaluation_service
+from app.services.feedback import feedback_generator
+from app.services.rescoring import stored_transcript
+from app.services.session_manager import SessionState, session_manager
+from app.services.skill_profile import upsert_skill_scores
+from app.services.turn_segmenter import TurnSegmenter
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+# Job fencing token: (job id, session id, attempt)
+Claim = Tuple[int, int, int]
+
+
+class ReportJobQueue:
+    """
+    Durable queue of end-of-session report jobs, run in-process.
+
+    Jobs live in the report_jobs table, so one queued by a process that
+    then dies is picked up by the next one to start (or by another
+    worker process once its lease expires). Worker coroutines share the
+    event loop with the judge's HTTP client; claiming, evaluation, report
+    rendering and writes all run in threads, off the event loop.
+
+    The live SessionState of a session ended in this process is kept in
+    memory for its job, so the running evaluation is finalized rather
+    than redone. A job without it (claimed after a restart or by another
+    process) re-evaluates the session from its stored structured
+    transcript, question tags included, as re-scoring does; signals only
+    observed live are masked out then. A session with no transcript at all
+    (nothing was said, or the process holding it went away before it was
+    stored) ends its job as no_transcript, without a report.
+    """
+
+    def __init__(
+        self,
+        workers: int,
+        lease_seconds: int,
+        max_attempts: int,
+        poll_seconds: float,
+        session_factory: Callable[[], Session] = SessionLocal
+    ):
+        self.workers = workers
+        self.lease = timedelta(seconds=lease_seconds)
+        self.max_attempts = max_attempts
+        self.poll_seconds = poll_seconds
+        self._session_factory = session_factory
+        self._states: Dict[int, SessionState] = {}
+        self._wakeup: Optional[asyncio.Event] = None
+        self._tasks: List[asyncio.Task] = []
+
+    def enqueue(self, db: Session, session_id: int, state: Optional[SessionState] = None) -> ReportJob:
+        """
+        Queue a session's report, or return the job it already has.
+
+        The caller owns the transaction, and calls notify() once it has
+        committed so an idle worker picks the job up immediately.
+        """
+        if state is not None:
+            self._states[session_id] = state
+        db.execute(insert(ReportJob).values(
+            session_id=session_id, status="queued", attempts=0, created_at=datetime.utcnow()
+        ).on_conflict_do_nothing(index_elements=["session_id"]))
+        return db.query(ReportJob).filter(ReportJob.session_id == session_id).one()
+
+    def notify(self):
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    def start(self):
+        """Start the worker coroutines on the running event loop."""
+        self._wakeup = asyncio.Event()
+        self._tasks = [asyncio.create_task(self._work()) for _ in range(self.workers)]
+
+    async def stop(self):
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def drain(self):
+        """Run jobs until none is claimable (without started workers, e.g. offline)."""
+        while True:
+            claim = await asyncio.to_thread(self.claim)
+            if claim is None:
+                return
+            await self.run(claim)
+
+    async def _work(self):
+        while True:
+            # Cleared before claiming, so a notify during the claim is not lost
+            self._wakeup.clear()
+            claim = await asyncio.to_thread(self.claim)
+            if claim is None:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), self.poll_seconds)
+                except asyncio.TimeoutError:
+                    pass  # Poll for jobs queued by other processes
+                continue
+            await self.run(claim)
+
+    def claim(self) -> Optional[Claim]:
+        """Atomically take the oldest queued job, or one whose lease expired."""
+        now = datetime.utcnow()
+        db = self._session_factory()
+        try:
+            oldest = select(ReportJob.id).where(or_(
+                ReportJob.status == "queued",
+                and_(ReportJob.status == "running", ReportJob.lease_expires_at < now)
+            )).order_by(ReportJob.id).limit(1).scalar_subquery()
+            row = db.execute(update(ReportJob).where(ReportJob.id == oldest).values(
+                status="running",
+                attempts=ReportJob.attempts + 1,
+                lease_expires_at=now + self.lease
+            ).returning(ReportJob.id, ReportJob.session_id, ReportJob.attempts)).first()
+            db.commit()
+        finally:
+            db.close()
+        return tuple(row) if row is not None else None
+
+    async def run(self, claim: Claim):
+        """Evaluate the session, render its report and write both with the job's outcome."""
+        _, session_id, attempt = claim
+        try:
+            if attempt > self.max_attempts:
+                raise RuntimeError(f"Gave up after {self.max_attempts} attempts")
+            session = await asyncio.to_thread(self._load_session, session_id)
+            evaluation = await self._evaluate(session, self._states.get(session_id))
+            report = None
+            if evaluation is not None:
+                report = await asyncio.to_thread(
+                    feedback_generator.generate_report,
+                    evaluation,
+                    persona=session["persona"],
+                    depth_mode=session["depth_mode"],
+                    declared_weak_areas=session["declared_weak_areas"] or [],
+                    transcript_summary=session["transcript_summary"],
+                    resume_provided=bool(session["resume_provided"])
+                )
+            await asyncio.to_thread(self._complete, claim, session, evaluation, report)
+        except asyncio.CancelledError:
+            # Shutting down: hand the job back without counting the attempt
+            self._release(claim, error=None, requeue=True, refund=True)
+            raise
+        except Exception as e:
+            requeue = attempt < self.max_attempts
+            logger.exception(
+                "Report job for session %s failed on attempt %s%s",
+                session_id, attempt, ", requeued" if requeue else ""
+            )
+            await asyncio.to_thread(self._release, claim, error=f"{type(e).__name__}: {e}", requeue=requeue)
+            if not requeue:
+                self._states.pop(session_id, None)
+        else:
+            self._states.pop(session_id, None)
+
+    async def _evaluate(self, session: dict, state: Optional[SessionState]) -> Optional[SessionEvaluation]:
+        declared_weak_areas = session["declared_weak_areas"] or []
+        if state is not None:
+            return await session_manager.finalize_evaluation(
+                state, declared_weak_areas, session["domains"], session["depth_mode"]
+            )
+
+        transcript = stored_transcript(session)
+        if not transcript:
+            return None  # Nothing recorded to evaluate: no report
+        segmenter = await asyncio.to_thread(TurnSegmenter(session["domains"]).feed_all, transcript)
+        verdicts = await evaluation_service.judge_exchanges(segmenter.exchanges)
+        return await asyncio.to_thread(
+            evaluation_service.evaluate_session,
+            session["id"], transcript, declared_weak_areas, session["domains"], session["depth_mode"],
+            session_state={"exchanges": segmenter}, verdicts=verdicts
+        )
+
+    def _load_session(self, session_id: int) -> dict:
+        db = self._session_factory()
+        try:
+            row = db.query(
+                InterviewSession.id,
+                InterviewSession.user_id,
+                InterviewSession.persona,
+                InterviewSession.depth_mode,
+                InterviewSession.domains,
+                InterviewSession.declared_weak_areas,
+                InterviewSession.ended_at,
+                SessionContent.transcript,
+                SessionContent.transcript_summary,
+                SessionContent.resume_text.isnot(None).label("resume_provided")
+            ).outerjoin(SessionContent).filter(InterviewSession.id == session_id).one()
+        finally:
+            db.close()
+        return row._asdict()
+
+    def _complete(
+        self,
+        claim: Claim,
+        session: dict,
+        evaluation: Optional[SessionEvaluation],
+        report: Optional[str]
+    ):
+        """Mark the job finished and write its results in one transaction, unless it was reclaimed."""
+        job_id, _, attempt = claim
+        db = self._session_factory()
+        try:
+            finished = db.query(ReportJob).filter(
+                ReportJob.id == job_id, ReportJob.status == "running", ReportJob.attempts == attempt
+            ).update(
+                {"status": "done" if evaluation is not None else "no_transcript", "error": None, "lease_expires_at": None, "finished_at": datetime.utcnow()},
+                synchronize_session=False
+            )
+            if not finished:
+                db.rollback()
+                return
+            if evaluation is not None:
+                content = db.get(SessionContent, session["id"])
+                if content is None:
+                    content = SessionContent(session_id=session["id"])
+                    db.add(content)
+                content.feedback_report = report
+                db.query(InterviewSession).filter(InterviewSession.id == session["id"]).update(
+                    {"scores": asdict(evaluation)}, synchronize_session=False
+                )
+                upsert_skill_scores(db, session["user_id"], evaluation, observed_at=session["ended_at"])
+            db.commit()
+        finally:
+            db.close()
+
+    def _release(self, claim: Claim, error: Optional[str], requeue: bool, refund: bool = False):
+        """Requeue a job that did not complete, or fail it for good."""
+        db = self._session_factory()
+        try:
+            job_id, _, attempt = claim
+            values = {"status": "queued" if requeue else "failed", "error": error, "lease_expires_at": None}
+            if refund:
+                values["attempts"] = attempt - 1
+            if not requeue:
+                values["finished_at"] = datetime.utcnow()
+            db.query(ReportJob).filter(
+                ReportJob.id == job_id, ReportJob.status == "running", ReportJob.attempts == attempt
+            ).update(values, synchronize_session=False)
+            db.commit()
+        finally:
+            db.close()
+
+
+# Global report job queue instance
+report_jobs = ReportJobQueue(
+    workers=settings.report_workers,
+    lease_seconds=settings.report_job_lease_seconds,
+    max_attempts=settings.report_job_max_attempts,
+    poll_seconds=settings.report_job_poll_seconds
+)
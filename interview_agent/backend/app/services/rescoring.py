@@ -0,0 +1,340 @@
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from typing import Callable, Deque, Iterator, List, Optional, Tuple, Union
+import asyncio
+import json
+import multiprocessing
+import os
+import time
+
+from sqlalchemy import func, update
+from sqlalchemy.orm import Session
+
+from app.config import get_settings
+from app.database import SessionLocal
+from app.models.session import InterviewSession, SessionContent
+from app.models.skill import SkillObservation, SkillTrend, UserSkill
+from app.services.evaluation import evaluation_service, session_evaluation_from_dict
+from app.services.feedback import feedback_generator
+from app.services.llm_judge import TokenBucket
+from app.services.session_manager import TranscriptEntry, load_transcript
+from app.services.skill_profile import upsert_skill_scores
+from app.services.turn_segmenter import TurnSegmenter
+
+settings = get_settings()
+
+# Speaker prefixes written by SessionManager.get_transcript_summary
+TRANSCRIPT_ROLES = {"Candidate": "user", "Interviewer": "assistant"}
+
+# Fields of a session row the workers need
+WORKER_FIELDS = (
+    "id", "persona", "depth_mode", "domains", "declared_weak_areas",
+    "transcript", "transcript_summary", "resume_provided"
+)
+
+# Per-process event loop for the judge's HTTP client (see _event_loop)
+_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def parse_transcript_summary(summary: str) -> List[dict]:
+    """
+    Transcript entries back from a stored transcript summary.
+
+    The summary is one "Candidate: ..." or "Interviewer: ..." block per
+    entry, separated by blank lines; a block without a known prefix
+    continues the previous entry.
+    """
+    entries: List[dict] = []
+    for block in summary.split("\n\n"):
+        prefix, _, content = block.partition(": ")
+        if prefix in TRANSCRIPT_ROLES:
+            entries.append({"role": TRANSCRIPT_ROLES[prefix], "content": content})
+        elif entries:
+            entries[-1]["content"] += "\n\n" + block
+    return entries
+
+
+def stored_transcript(session: dict) -> List[Union[TranscriptEntry, dict]]:
+    """
+    A session's transcript as stored: the structured one when present.
+
+    Sessions stored before the structured transcript existed only have the
+    summary, which carries no question tags, so questions the interviewer
+    reworded are not matched to the bank when it is re-segmented.
+    """
+    if session["transcript"]:
+        return load_transcript(session["transcript"])
+    return parse_transcript_summary(session["transcript_summary"] or "")
+
+
+@dataclass
+class RescoreProgress:
+    users: int = 0
+    sessions: int = 0  # re-evaluated from their transcript
+    kept: int = 0  # nothing to re-evaluate: existing scores replayed into skills as is
+    total: int = 0  # scored sessions overall, including kept ones
+    resumed: int = 0  # sessions already done by earlier runs (from the checkpoint)
+    last_user_id: Optional[int] = None
+    elapsed_seconds: float = 0.0  # this run only
+
+    @property
+    def done(self) -> int:
+        return self.sessions + self.kept
+
+    @property
+    def sessions_per_second(self) -> float:
+        """Throughput of this run, not counting sessions done before a resume."""
+        return (self.done - self.resumed) / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+
+def load_checkpoint(path: str) -> Optional[dict]:
+    if not os.path.exists(path):
+        return None
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_checkpoint(path: str, progress: RescoreProgress):
+    """Write the checkpoint atomically, so a crash leaves the previous one intact."""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump({
+            "last_user_id": progress.last_user_id,
+            "users": progress.users,
+            "sessions": progress.sessions,
+            "kept": progress.kept,
+        }, f)
+    os.replace(tmp_path, path)
+
+
+def count_scored_sessions(db: Session, after_user_id: Optional[int] = None) -> int:
+    query = db.query(func.count(InterviewSession.id)).filter(InterviewSession.scores.isnot(None))
+    if after_user_id is not None:
+        query = query.filter(InterviewSession.user_id > after_user_id)
+    return query.scalar()
+
+
+def iter_user_chunks(
+    users_per_chunk: int,
+    after_user_id: Optional[int] = None,
+    session_factory: Callable[[], Session] = SessionLocal
+) -> Iterator[List[dict]]:
+    """
+    Stream scored sessions, users_per_chunk whole users at a time.
+
+    Users are paged by id (keyset), and each chunk holds all their scored
+    sessions in the order they happened, so skill profiles can be rebuilt
+    chunk by chunk. Every page is read in its own short transaction.
+    """
+    while True:
+        db = session_factory()
+        try:
+            query = db.query(InterviewSession.user_id).filter(InterviewSession.scores.isnot(None))
+            if after_user_id is not None:
+                query = query.filter(InterviewSession.user_id > after_user_id)
+            user_ids = [
+                user_id for user_id, in
+                query.distinct().order_by(InterviewSession.user_id).limit(users_per_chunk)
+            ]
+            if not user_ids:
+                return
+            rows = db.query(
+                InterviewSession.id,
+                InterviewSession.user_id,
+                InterviewSession.persona,
+                InterviewSession.depth_mode,
+                InterviewSession.domains,
+                InterviewSession.declared_weak_areas,
+                InterviewSession.scores,
+                InterviewSession.started_at,
+                InterviewSession.ended_at,
+                SessionContent.transcript,
+                SessionContent.transcript_summary,
+                SessionContent.resume_text.isnot(None).label("resume_provided")
+            ).outerjoin(SessionContent).filter(
+                InterviewSession.user_id.in_(user_ids),
+                InterviewSession.scores.isnot(None)
+            ).order_by(
+                InterviewSession.user_id, InterviewSession.started_at, InterviewSession.id
+            ).all()
+        finally:
+            db.close()
+
+        yield [row._asdict() for row in rows if row.scores]
+        after_user_id = user_ids[-1]
+
+
+def _event_loop() -> asyncio.AbstractEventLoop:
+    """One loop per process: the judge's HTTP client must stay on the loop it was first used on."""
+    global _loop
+    if _loop is None:
+        _loop = asyncio.new_event_loop()
+    return _loop
+
+
+def _init_worker(workers: int):
+    """Give each worker an equal share of the judge's rate and concurrency limits."""
+    judge = evaluation_service.judge
+    judge.rate_limiter = TokenBucket(
+        settings.judge_requests_per_second / workers, max(1, settings.judge_burst // workers)
+    )
+    judge.max_concurrency = max(1, judge.max_concurrency // workers)
+
+
+def rescore_chunk(sessions: List[dict]) -> List[Optional[dict]]:
+    """
+    Re-evaluate sessions from their stored transcripts (runs in a worker).
+
+    Transcripts are re-segmented and a chunk's answers are judged in one
+    batch, so answers repeated across its sessions are judged once. Signals
+    only observed live (answer latency) are not stored with the session and
+    are masked out of the fused scores.
+
+    Returns:
+        Per session, {"scores", "feedback_report"}; None when it has no
+        stored transcript to re-evaluate, or none of its exchanges maps to
+        a bank question (its stored scores are kept rather than emptied)
+    """
+    parsed = [stored_transcript(s) for s in sessions]
+    segmented = []
+    for session, transcript in zip(sessions, parsed):
+        segmenter = TurnSegmenter(session["domains"]).feed_all(transcript) if transcript else None
+        if segmenter is not None and not any(exchange.topic for exchange in segmenter.exchanges):
+            segmenter = None
+        segmented.append(segmenter)
+
+    verdicts = iter(_event_loop().run_until_complete(evaluation_service.judge_sessions(
+        [segmenter.exchanges for segmenter in segmented if segmenter is not None]
+    )))
+    results = []
+    for session, transcript, segmenter in zip(sessions, parsed, segmented):
+        if segmenter is None:
+            results.append(None)
+            continue
+        declared_weak_areas = session["declared_weak_areas"] or []
+        evaluation = evaluation_service.evaluate_session(
+            session["id"], transcript, declared_weak_areas, session["domains"], session["depth_mode"],
+            session_state={"exchanges": segmenter}, verdicts=next(verdicts)
+        )
+        results.append({
+            "scores": asdict(evaluation),
+            "feedback_report": feedback_generator.generate_report(
+                evaluation,
+                persona=session["persona"],
+                depth_mode=session["depth_mode"],
+                declared_weak_areas=declared_weak_areas,
+                transcript_summary=session["transcript_summary"],
+                resume_provided=bool(session["resume_provided"])
+            )
+        })
+    return results
+
+
+def write_chunk(db: Session, sessions: List[dict], results: List[Optional[dict]]):
+    """
+    Write a chunk's new scores and rebuild its users' skill profiles.
+
+    Scores and reports are bulk-updated by primary key. Each user's
+    UserSkill rows, skill observations and weekly trends are then deleted
+    and rebuilt by replaying their sessions in order through
+    upsert_skill_scores, so running averages, inferred shifts and trends
+    come out as if the new scores had been recorded live. The caller owns
+    the transaction.
+    """
+    rescored = [(s, r) for s, r in zip(sessions, results) if r is not None]
+    if rescored:
+        db.execute(update(InterviewSession), [{"id": s["id"], "scores": r["scores"]} for s, r in rescored])
+        db.execute(update(SessionContent), [
+            {"session_id": s["id"], "feedback_report": r["feedback_report"]} for s, r in rescored
+        ])
+
+    user_ids = list(dict.fromkeys(s["user_id"] for s in sessions))
+    for model in (UserSkill, SkillObservation, SkillTrend):
+        db.query(model).filter(model.user_id.in_(user_ids)).delete(synchronize_session=False)
+    for session, result in zip(sessions, results):
+        scores = result["scores"] if result is not None else session["scores"]
+        upsert_skill_scores(
+            db, session["user_id"], session_evaluation_from_dict(scores),
+            observed_at=session["ended_at"] or session["started_at"]
+        )
+
+
+def rescore_sessions(
+    workers: int = os.cpu_count() or 1,
+    users_per_chunk: int = 50,
+    checkpoint_path: Optional[str] = None,
+    restart: bool = False,
+    on_progress: Optional[Callable[[RescoreProgress], None]] = None,
+    session_factory: Callable[[], Session] = SessionLocal
+) -> RescoreProgress:
+    """
+    Recompute stored scores, reports and skill profiles for every scored session.
+
+    Chunks of users are streamed from the database and re-evaluated on a
+    pool of worker processes (in-process when workers is 0), with up to two
+    chunks per worker in flight. Results are written back in submission
+    order, one transaction per chunk, and the checkpoint records the last
+    user written, so an interrupted run resumes after it. The checkpoint is
+    removed once the run completes.
+    """
+    checkpoint = load_checkpoint(checkpoint_path) if checkpoint_path and not restart else None
+    progress = RescoreProgress()
+    if checkpoint:
+        progress.last_user_id = checkpoint["last_user_id"]
+        progress.users, progress.sessions, progress.kept = checkpoint["users"], checkpoint["sessions"], checkpoint["kept"]
+        progress.resumed = progress.done
+
+    db = session_factory()
+    try:
+        progress.total = progress.done + count_scored_sessions(db, progress.last_user_id)
+    finally:
+        db.close()
+
+    start = time.perf_counter()
+
+    def finish(sessions: List[dict], results: List[Optional[dict]]):
+        db = session_factory()
+        try:
+            write_chunk(db, sessions, results)
+            db.commit()
+        finally:
+            db.close()
+        progress.users += len({s["user_id"] for s in sessions})
+        progress.sessions += sum(r is not None for r in results)
+        progress.kept += sum(r is None for r in results)
+        progress.last_user_id = sessions[-1]["user_id"]
+        progress.elapsed_seconds = time.perf_counter() - start
+        if checkpoint_path:
+            save_checkpoint(checkpoint_path, progress)
+        if on_progress is not None:
+            on_progress(progress)
+
+    chunks = iter_user_chunks(users_per_chunk, progress.last_user_id, session_factory)
+    payload = lambda chunk: [{name: s[name] for name in WORKER_FIELDS} for s in chunk]
+    if workers <= 0:
+        for chunk in chunks:
+            finish(chunk, rescore_chunk(payload(chunk)))
+    else:
+        # Spawned workers import the app afresh instead of inheriting this process's connections
+        in_flight: Deque[Tuple[List[dict], Future]] = deque()
+        pool = ProcessPoolExecutor(
+            workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(workers,)
+        )
+        with pool:
+            for chunk in chunks:
+                in_flight.append((chunk, pool.submit(rescore_chunk, payload(chunk))))
+                if len(in_flight) >= 2 * workers:
+                    sessions, future = in_flight.popleft()
+                    finish(sessions, future.result())
+            while in_flight:
+                sessions, future = in_flight.popleft()
+                finish(sessions, future.result())
+
+    progress.elapsed_seconds = time.perf_counter() - start
+    if checkpoint_path and os.path.exists(checkpoint_path):
+        os.remove(checkpoint_path)
+    return progress
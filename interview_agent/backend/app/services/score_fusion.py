@@ -0,0 +1,114 @@
+from dataclasses import dataclass
+from typing import Mapping, Optional, Tuple
+
+import numpy as np
+
+
+SIGNALS = ("semantic", "follow_up", "verbal_cues", "latency")
+SIGNAL_INDEX = {name: i for i, name in enumerate(SIGNALS)}
+
+# Score given to a topic or domain with no evidence at all
+NEUTRAL_SCORE = 0.5
+
+
+def signal_weights(weights: Mapping[str, float]) -> np.ndarray:
+    """Weight vector in SIGNALS order; signals without a weight get 0."""
+    return np.array([weights.get(name, 0.0) for name in SIGNALS], dtype=np.float64)
+
+
+def fuse_topic_scores(
+    signals: np.ndarray,
+    weights: np.ndarray,
+    confidence: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Weighted fusion of per-topic signals, ignoring missing ones.
+
+    Args:
+        signals: (topics, len(SIGNALS)) scores in 0.0-1.0, NaN where a
+            signal was not observed for the topic
+        weights: (len(SIGNALS),) signal weights
+        confidence: (topics,) confidence in each topic's evidence
+
+    Returns:
+        (scores, confidence): each row's score is the weighted mean of its
+        observed signals (weights renormalised over them), NEUTRAL_SCORE if
+        none were observed. Confidence is scaled by the fraction of the
+        total weight actually observed.
+    """
+    observed = ~np.isnan(signals)
+    present_weight = observed @ weights
+    weighted = np.where(observed, signals, 0.0) @ weights
+    has_signal = present_weight > 0
+    scores = np.full(len(signals), NEUTRAL_SCORE)
+    np.divide(weighted, present_weight, out=scores, where=has_signal)
+    return scores, confidence * (present_weight / weights.sum())
+
+
+def segment_weighted_mean(
+    values: np.ndarray,
+    weights: np.ndarray,
+    segments: np.ndarray,
+    num_segments: int,
+    default: float = NEUTRAL_SCORE
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Weighted mean of values per segment id (segments need not be sorted).
+
+    Returns:
+        (means, total weights) per segment; segments with no weight get default
+    """
+    totals = np.bincount(segments, weights=weights, minlength=num_segments)
+    sums = np.bincount(segments, weights=values * weights, minlength=num_segments)
+    means = np.full(num_segments, default)
+    np.divide(sums, totals, out=means, where=totals > 0)
+    return means, totals
+
+
+@dataclass
+class FusedScores:
+    topic_scores: np.ndarray  # (topics,)
+    topic_confidence: np.ndarray  # (topics,)
+    domain_scores: np.ndarray  # (domains,)
+    domain_confidence: np.ndarray  # (domains,) summed topic confidence
+    overall_scores: np.ndarray  # (groups,)
+
+
+def fuse_scores(
+    signals: np.ndarray,
+    confidence: np.ndarray,
+    topic_domains: np.ndarray,
+    num_domains: int,
+    weights: np.ndarray,
+    domain_groups: Optional[np.ndarray] = None,
+    num_groups: int = 1
+) -> FusedScores:
+    """
+    Fuse topic signals and roll them up to domains and overall scores.
+
+    Topic scores come from fuse_topic_scores. A domain's score is the
+    confidence-weighted mean of its topics; an overall score is the plain
+    mean of its domains, so every requested domain counts equally. Both
+    roll-ups are segment reductions, so one call can score a single session
+    or a whole history of sessions.
+
+    Args:
+        signals: (topics, len(SIGNALS)) with NaN for missing signals
+        confidence: (topics,) evidence confidence per topic
+        topic_domains: (topics,) domain segment id of each topic
+        num_domains: number of domain segments
+        weights: (len(SIGNALS),) signal weights
+        domain_groups: (num_domains,) group (e.g. session) of each domain
+            segment; all domains form one group when omitted
+        num_groups: number of groups
+    """
+    topic_scores, topic_confidence = fuse_topic_scores(signals, weights, confidence)
+    domain_scores, domain_confidence = segment_weighted_mean(
+        topic_scores, topic_confidence, topic_domains, num_domains
+    )
+    if domain_groups is None:
+        domain_groups = np.zeros(num_domains, dtype=np.int64)
+    overall_scores, _ = segment_weighted_mean(
+        domain_scores, np.ones(num_domains), domain_groups, num_groups
+    )
+    return FusedScores(topic_scores, topic_confidence, domain_scores, domain_confidence, overall_scores)
@@ -1,8 +1,14 @@
-from typing import Dict, Optional, List
+from typing import Dict, Optional, List, Set
 from dataclasses import dataclass, field
 from datetime import datetime
 import asyncio
 
+from app.services.evaluation import EvaluationAccumulator, SessionEvaluation, evaluation_service
+from app.services.latency_stats import latency_stats
+from app.services.question_selector import QuestionSelector
+from app.services.skill_graph import skill_graph
+from app.services.turn_segmenter import Exchange, TurnSegmenter
+
 
 @dataclass
 class TranscriptEntry:
@@ -10,12 +16,40 @@ class TranscriptEntry:
     content: str
     timestamp: datetime
     audio_duration_ms: Optional[int] = None
+    question_id: Optional[str] = None  # bank question this interviewer turn asks
+
+
+def dump_transcript(entries: List[TranscriptEntry]) -> List[dict]:
+    """Transcript entries as JSON-ready dicts, for storing with the session."""
+    return [
+        {
+            "role": entry.role,
+            "content": entry.content,
+            "timestamp": entry.timestamp.isoformat() if entry.timestamp else None,
+            "question_id": entry.question_id,
+        }
+        for entry in entries
+    ]
+
+
+def load_transcript(records: List[dict]) -> List[TranscriptEntry]:
+    """Transcript entries back from dump_transcript output."""
+    return [
+        TranscriptEntry(
+            role=record["role"],
+            content=record["content"],
+            timestamp=datetime.fromisoformat(record["timestamp"]) if record.get("timestamp") else None,
+            question_id=record.get("question_id")
+        )
+        for record in records
+    ]
 
 
 @dataclass
 class SessionState:
     session_id: int
     user_id: int
+    persona: Optional[str] = None
     created_at: datetime = field(default_factory=datetime.utcnow)
 
     # Real-time state
@@ -23,9 +57,13 @@ class SessionState:
     is_speaking: bool = False
     current_topic: Optional[str] = None
     current_domain: Optional[str] = None
+    current_difficulty: Optional[str] = None
+    awaiting_answer_since: Optional[datetime] = None  # end of the last interviewer turn
 
-    # Transcript
+    # Transcript, and its segmentation into question exchanges
     transcript: List[TranscriptEntry] = field(default_factory=list)
+    exchanges: TurnSegmenter = field(default_factory=TurnSegmenter)
+    pending_question_id: Optional[str] = None  # served, not yet spoken
 
     # Evaluation signals
     follow_up_failures: int = 0
@@ -36,6 +74,14 @@ class SessionState:
     # Topic tracking
     topics_covered: List[str] = field(default_factory=list)
     weak_signals: Dict[str, float] = field(default_factory=dict)  # topic -> weakness score
+    inferred_signals: Dict[str, float] = field(default_factory=dict)  # via prerequisite graph
+
+    # Next-question selection, kept in step with the signals above
+    selector: Optional[QuestionSelector] = None
+
+    # Incremental evaluation: exchanges are judged as they close
+    evaluation: EvaluationAccumulator = field(default_factory=EvaluationAccumulator)
+    judge_tasks: Set[asyncio.Task] = field(default_factory=set)
 
 
 class SessionManager:
@@ -46,9 +92,19 @@ class SessionManager:
         self._user_sessions: Dict[int, int] = {}  # user_id -> session_id
         self._lock = asyncio.Lock()
 
-    def create_session(self, session_id: int, user_id: int) -> SessionState:
+    def create_session(
+        self,
+        session_id: int,
+        user_id: int,
+        domains: Optional[List[str]] = None,
+        declared_weak_areas: Optional[List[str]] = None,
+        persona: Optional[str] = None
+    ) -> SessionState:
         """Create a new session state."""
-        state = SessionState(session_id=session_id, user_id=user_id)
+        state = SessionState(session_id=session_id, user_id=user_id, persona=persona)
+        state.exchanges = TurnSegmenter(domains)
+        if domains:
+            state.selector = QuestionSelector(domains, declared_weak_areas)
         self._sessions[session_id] = state
         self._user_sessions[user_id] = session_id
         return state
@@ -87,7 +143,73 @@ class SessionManager:
                 timestamp=datetime.utcnow(),
                 audio_duration_ms=audio_duration_ms
             )
+            # The first interviewer turn after a question is served asks it
+            if role == "assistant" and state.pending_question_id:
+                entry.question_id = state.pending_question_id
+                state.pending_question_id = None
             state.transcript.append(entry)
+            # Answer latency runs from the end of an interviewer turn until
+            # the candidate starts speaking (mark_answer_started)
+            state.awaiting_answer_since = entry.timestamp if role == "assistant" else None
+            opened = len(state.exchanges.exchanges)
+            state.exchanges.feed(entry)
+            # A new exchange opening closes the previous one
+            if opened and len(state.exchanges.exchanges) > opened:
+                self._judge_in_background(state, state.exchanges.exchanges[opened - 1])
+
+    def _judge_in_background(self, state: SessionState, exchange: Exchange):
+        """Judge a closed exchange and fold it into the session's evaluation."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return  # No event loop (offline use): judged at finalize instead
+        if exchange.domain is None or exchange.topic is None:
+            # No bank question to score against: the verdict would be discarded
+            state.evaluation.add(exchange)
+            return
+
+        async def judge():
+            verdicts = await evaluation_service.judge_exchanges([exchange])
+            verdict = verdicts.get(exchange.index)
+            state.evaluation.add(exchange, verdict)
+            if verdict is not None:
+                # Weakness drives the choice of the next questions
+                self.update_weak_signal(state.session_id, exchange.topic, 1.0 - verdict.normalized_score)
+
+        task = loop.create_task(judge())
+        state.judge_tasks.add(task)
+        task.add_done_callback(state.judge_tasks.discard)
+
+    async def finalize_evaluation(
+        self,
+        state: SessionState,
+        declared_weak_areas: List[str],
+        domains: List[str],
+        depth_mode: str
+    ) -> SessionEvaluation:
+        """
+        Evaluate a session from its running accumulators.
+
+        Waits for judging already in flight, judges whatever has not been
+        folded in yet (normally just the exchange still open), then builds
+        the SessionEvaluation. Works the same for a completed session and a
+        mid-session exit, which gets partial feedback for what was covered.
+        The evaluation itself runs in a thread, off the event loop.
+        """
+        if state.judge_tasks:
+            await asyncio.gather(*state.judge_tasks, return_exceptions=True)
+        pending = state.evaluation.pending(state.exchanges.exchanges)
+        verdicts = await evaluation_service.judge_exchanges(pending) if pending else {}
+        return await asyncio.to_thread(
+            evaluation_service.evaluate_session,
+            session_id=state.session_id,
+            transcript=state.transcript,
+            declared_weak_areas=declared_weak_areas,
+            domains=domains,
+            depth_mode=depth_mode,
+            session_state=vars(state),
+            verdicts=verdicts
+        )
 
     def update_speaking_state(self, session_id: int, is_speaking: bool):
         """Update whether the user is currently speaking."""
@@ -109,11 +231,31 @@ class SessionManager:
             if not success:
                 state.follow_up_failures += 1
 
+    def mark_answer_started(self, session_id: int):
+        """The candidate started speaking: record the latency since the last interviewer turn."""
+        state = self._sessions.get(session_id)
+        if state and state.awaiting_answer_since is not None:
+            elapsed = datetime.utcnow() - state.awaiting_answer_since
+            state.awaiting_answer_since = None
+            self.record_response_latency(session_id, int(elapsed.total_seconds() * 1000))
+
     def record_response_latency(self, session_id: int, latency_ms: int):
-        """Record response latency."""
+        """
+        Record response latency.
+
+        The latency is scored as a percentile of the population for the
+        current domain, difficulty and persona (before adding it), then
+        added to that population.
+        """
         state = self._sessions.get(session_id)
         if state:
             state.response_latencies.append(latency_ms)
+            score = evaluation_service.latency_score(
+                latency_ms, state.current_domain, state.current_difficulty, state.persona
+            )
+            latency_stats.record(latency_ms, state.current_domain, state.current_difficulty, state.persona)
+            if score is not None and state.current_domain and state.current_topic:
+                state.evaluation.add_latency(state.current_domain, state.current_topic, score)
 
     def update_weak_signal(self, session_id: int, topic: str, score: float):
         """Update weakness signal for a topic."""
@@ -122,12 +264,50 @@ class SessionManager:
             # Use exponential moving average
             current = state.weak_signals.get(topic, 0.5)
             state.weak_signals[topic] = 0.7 * score + 0.3 * current
+            state.inferred_signals = skill_graph.infer_topic_signals(state.weak_signals)
+            if state.selector:
+                state.selector.update_weak_signal(topic, state.weak_signals[topic])
+                state.selector.update_inferred_signals(state.inferred_signals)
 
     def mark_topic_covered(self, session_id: int, topic: str):
         """Mark a topic as covered."""
         state = self._sessions.get(session_id)
         if state and topic not in state.topics_covered:
             state.topics_covered.append(topic)
+            if state.selector:
+                state.selector.mark_topic_covered(topic)
+
+    def set_resume_text(self, session_id: int, resume_text: str):
+        """Feed parsed resume text to question selection as risk areas."""
+        state = self._sessions.get(session_id)
+        if state and state.selector:
+            state.selector.set_resume_text(resume_text)
+
+    def next_question(self, session_id: int) -> Optional[dict]:
+        """
+        Pick the next question for the session and make it current.
+
+        The interviewer asks it next (see AzureRealtimeClient's
+        next_question tool): that turn is tagged with the question id, and
+        answer latencies are attributed to its domain, topic and difficulty.
+        """
+        state = self._sessions.get(session_id)
+        if not state or not state.selector:
+            return None
+        question = state.selector.next_question()
+        if question:
+            state.current_domain = question.get("domain")
+            state.current_topic = question.get("topic")
+            state.current_difficulty = question.get("difficulty")
+            state.pending_question_id = question.get("id")
+            if state.current_topic:
+                self.mark_topic_covered(session_id, state.current_topic)
+        return question
+
+    def get_transcript(self, session_id: int) -> List[dict]:
+        """The structured transcript, question tags included (see dump_transcript)."""
+        state = self._sessions.get(session_id)
+        return dump_transcript(state.transcript) if state else []
 
     def get_transcript_summary(self, session_id: int) -> str:
         """Get a summary of the transcript."""
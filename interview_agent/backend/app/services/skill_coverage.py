@@ -0,0 +1,114 @@
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.skill_trees import SKILL_INDEX, SkillIndex, SkillNode
+
+
+DIFFICULTIES = ["easy", "medium", "hard"]
+DIFFICULTY_INDEX = {name: i for i, name in enumerate(DIFFICULTIES)}
+
+
+class SkillCoverage:
+    """
+    Which questions exercise each skill at each difficulty.
+
+    Questions are tagged with a topic and usually a subtopic, so a question
+    covers every skill under the deepest skill-tree node it names. The
+    skills x difficulties -> question mapping is stored CSR-style: the
+    questions of cell (skill_id, difficulty) are
+    question_rows[indptr[c]:indptr[c + 1]] with c = skill_id * 3 + difficulty.
+    Per-node counts (num_nodes x 3) answer "any questions under this
+    topic/subtopic at this difficulty?" with one array read.
+    """
+
+    def __init__(self, questions: Sequence[dict], index: SkillIndex = SKILL_INDEX):
+        self.index = index
+        self.questions = questions
+        num_cells = index.num_skills * len(DIFFICULTIES)
+
+        node_ids = np.full(len(questions), -1, dtype=np.int64)
+        difficulty = np.full(len(questions), -1, dtype=np.int64)
+        for row, q in enumerate(questions):
+            node = index.find(q.get("domain"), q.get("topic"), q.get("subtopic"))
+            if node is None:
+                # Unknown subtopic: fall back to the topic if that exists
+                node = index.find(q.get("domain"), q.get("topic"))
+            if node is not None:
+                node_ids[row] = node.node_id
+            difficulty[row] = DIFFICULTY_INDEX.get(q.get("difficulty"), -1)
+
+        mapped = (node_ids >= 0) & (difficulty >= 0)
+        self.unmapped_rows = np.flatnonzero(~mapped)
+        rows = np.flatnonzero(mapped)
+
+        # Expand each question to the skill range under its node
+        ranges = np.asarray([index.node(i).skill_range for i in range(len(index.nodes))], dtype=np.int64)
+        starts, ends = ranges[node_ids[rows], 0], ranges[node_ids[rows], 1]
+        spans = ends - starts
+        expanded_rows = np.repeat(rows, spans)
+        skill_ids = np.repeat(starts - np.cumsum(spans) + spans, spans) + np.arange(int(spans.sum()))
+        cells = skill_ids * len(DIFFICULTIES) + difficulty[expanded_rows]
+
+        order = np.argsort(cells, kind="stable")
+        self.question_rows = expanded_rows[order].astype(np.int32)
+        self.indptr = np.zeros(num_cells + 1, dtype=np.int64)
+        np.cumsum(np.bincount(cells, minlength=num_cells), out=self.indptr[1:])
+        self.counts = np.diff(self.indptr).reshape(index.num_skills, len(DIFFICULTIES)).astype(np.int32)
+
+        # Questions tagged at each node, then rolled up into ancestors; nodes
+        # are depth-first, so every child comes after its parent
+        self.node_counts = np.zeros((len(index.nodes), len(DIFFICULTIES)), dtype=np.int32)
+        np.add.at(self.node_counts, (node_ids[rows], difficulty[rows]), 1)
+        for node in reversed(index.nodes):
+            if node.parent_id is not None:
+                self.node_counts[node.parent_id] += self.node_counts[node.node_id]
+
+    def count(self, skill_id: int, difficulty: str) -> int:
+        """Questions covering a skill at a difficulty."""
+        return int(self.counts[skill_id, DIFFICULTY_INDEX[difficulty]])
+
+    def question_ids(self, skill_id: int, difficulty: str) -> List[str]:
+        """Ids of the questions covering a skill at a difficulty."""
+        cell = skill_id * len(DIFFICULTIES) + DIFFICULTY_INDEX[difficulty]
+        rows = self.question_rows[self.indptr[cell]:self.indptr[cell + 1]]
+        return [self.questions[row].get("id") for row in rows.tolist()]
+
+    def has_questions(
+        self,
+        domain: str,
+        topic: Optional[str],
+        difficulty: str,
+        subtopic: Optional[str] = None
+    ) -> Optional[bool]:
+        """
+        Whether any question sits under a domain/topic/subtopic at a difficulty.
+
+        Returns None when the node is not in the skill trees, so callers
+        can fall back to the question bank itself.
+        """
+        node = self.index.find(domain, topic, subtopic)
+        if node is None or difficulty not in DIFFICULTY_INDEX:
+            return None
+        return bool(self.node_counts[node.node_id, DIFFICULTY_INDEX[difficulty]])
+
+    def gaps(self, domain: Optional[str] = None) -> List[Tuple[SkillNode, str]]:
+        """(skill, difficulty) cells with no questions, in skill order."""
+        skill_ids, difficulty = np.nonzero(self.counts == 0)
+        gaps = []
+        for skill_id, level in zip(skill_ids.tolist(), difficulty.tolist()):
+            skill = self.index.skill(skill_id)
+            if domain is None or skill.domain == domain:
+                gaps.append((skill, DIFFICULTIES[level]))
+        return gaps
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """Per-domain fraction of skills with at least one question, by difficulty."""
+        result = {}
+        for node in self.index.nodes:
+            if node.kind != "domain":
+                continue
+            start, end = node.skill_range
+            covered = (self.counts[start:end] > 0).mean(axis=0) if end > start else np.zeros(len(DIFFICULTIES))
+            result[node.domain] = {name: float(covered[i]) for i, name in enumerate(DIFFICULTIES)}
+        return result
@@ -0,0 +1,165 @@
+from typing import Dict, Iterable, Optional, Tuple
+
+import numpy as np
+
+from app.skill_trees import SKILL_INDEX, SkillIndex
+from app.skill_trees.prerequisites import PREREQUISITE_EDGES
+
+
+# Fraction of a node's (normalised) evidence passed on per hop
+DAMPING = 0.5
+HOPS = 3
+
+# Inferred deviations smaller than this are dropped
+MIN_INFERRED = 1e-3
+
+
+class SkillGraph:
+    """
+    Prerequisite DAG over skill-tree nodes as a sparse matrix.
+
+    Edges may connect nodes at any level; each edge is lifted to every tree
+    level both endpoints reach (topic -> topic, subtopic -> subtopic, ...),
+    so evidence recorded per topic (live session signals) and per subtopic
+    (UserSkill rows) both propagate. Weights into each dependent are
+    normalised to sum to at most 1 and stored CSR-style
+    (indptr / indices / data, rows = dependents).
+
+    Propagation of an evidence vector e (deviation from neutral per node)
+    is  r = sum_{k=1..hops} (damping * W)^k e,  computed as a few sparse
+    matrix-vector products.
+    """
+
+    def __init__(
+        self,
+        edges: Iterable[Tuple[str, str, float]] = PREREQUISITE_EDGES,
+        index: SkillIndex = SKILL_INDEX,
+        damping: float = DAMPING,
+        hops: int = HOPS
+    ):
+        self.index = index
+        self.damping = damping
+        self.hops = hops
+        self.size = len(index.nodes)
+
+        weights: Dict[Tuple[int, int], float] = {}
+        for prerequisite, dependent, weight in edges:
+            source, target = index.find_path(prerequisite), index.find_path(dependent)
+            if source is None or target is None:
+                raise ValueError(f"Unknown skill in prerequisite edge {prerequisite} -> {dependent}")
+            source_chain = index.ancestors(source)[1:] + (source,)
+            target_chain = index.ancestors(target)[1:] + (target,)
+            for lifted_source, lifted_target in zip(source_chain, target_chain):
+                if lifted_source.node_id != lifted_target.node_id:
+                    key = (lifted_target.node_id, lifted_source.node_id)
+                    weights[key] = max(weights.get(key, 0.0), weight)
+
+        rows = np.fromiter((row for row, _ in weights), dtype=np.int64, count=len(weights))
+        cols = np.fromiter((col for _, col in weights), dtype=np.int64, count=len(weights))
+        data = np.fromiter(weights.values(), dtype=np.float64, count=len(weights))
+        self._set_matrix(rows, cols, data)
+
+        # Topic keys are unique across domains; live signals are keyed by topic
+        self._topic_nodes = {
+            node.topic: node.node_id for node in index.nodes if node.kind == "topic"
+        }
+
+    def _set_matrix(self, rows: np.ndarray, cols: np.ndarray, data: np.ndarray):
+        incoming = np.bincount(rows, weights=data, minlength=self.size)
+        data = data / np.maximum(incoming[rows], 1.0)
+        order = np.lexsort((cols, rows))
+        self.rows, self.indices, self.data = rows[order], cols[order], data[order]
+        self.indptr = np.zeros(self.size + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=self.size), out=self.indptr[1:])
+
+    @classmethod
+    def from_arrays(cls, size: int, sources: np.ndarray, targets: np.ndarray, weights: np.ndarray,
+                    damping: float = DAMPING, hops: int = HOPS) -> "SkillGraph":
+        """Graph over size anonymous nodes from edge arrays (benchmarks, tests)."""
+        graph = cls.__new__(cls)
+        graph.index = None
+        graph.damping = damping
+        graph.hops = hops
+        graph.size = size
+        graph._topic_nodes = {}
+        graph._set_matrix(np.asarray(targets, dtype=np.int64), np.asarray(sources, dtype=np.int64),
+                          np.asarray(weights, dtype=np.float64))
+        return graph
+
+    def matvec(self, x: np.ndarray) -> np.ndarray:
+        """W @ x for the normalised dependent <- prerequisite matrix."""
+        return np.bincount(self.rows, weights=self.data * x[self.indices], minlength=self.size)
+
+    def propagate(self, evidence: np.ndarray) -> np.ndarray:
+        """Inferred deviation per node from a dense evidence vector."""
+        inferred = np.zeros(self.size)
+        frontier = evidence
+        for _ in range(self.hops):
+            frontier = self.damping * self.matvec(frontier)
+            if not frontier.any():
+                break
+            inferred += frontier
+        return inferred
+
+    def infer(self, evidence: Dict[int, float]) -> Dict[int, float]:
+        """Inferred deviations for nodes without evidence of their own."""
+        vector = np.zeros(self.size)
+        for node_id, value in evidence.items():
+            vector[node_id] = value
+        inferred = self.propagate(vector)
+        inferred[list(evidence)] = 0.0
+        nodes = np.flatnonzero(np.abs(inferred) >= MIN_INFERRED)
+        return dict(zip(nodes.tolist(), inferred[nodes].tolist()))
+
+    def infer_topic_signals(self, weak_signals: Dict[str, float], neutral: float = 0.5) -> Dict[str, float]:
+        """
+        Weakness implied for other topics by live per-topic weak signals.
+
+        Args:
+            weak_signals: topic -> weakness score (0-1, higher = weaker)
+            neutral: score meaning "no evidence"
+
+        Returns:
+            topic -> inferred weakness score for topics with no signal of their own
+        """
+        evidence = {
+            self._topic_nodes[topic]: score - neutral
+            for topic, score in weak_signals.items()
+            if topic in self._topic_nodes
+        }
+        return {
+            self.index.node(node_id).topic: min(1.0, max(0.0, neutral + value))
+            for node_id, value in self.infer(evidence).items()
+            if self.index.node(node_id).kind == "topic"
+        }
+
+    def infer_skill_scores(
+        self,
+        scores: Dict[Tuple[str, str, Optional[str]], float],
+        neutral: float = 0.5
+    ) -> Dict[Tuple[str, str, Optional[str]], float]:
+        """
+        Score shifts implied for other (domain, topic, subtopic) skills.
+
+        Args:
+            scores: (domain, topic, subtopic) -> proficiency score (0-1)
+
+        Returns:
+            (domain, topic, subtopic) -> inferred shift from the current score,
+            for topic and subtopic nodes with no score of their own
+        """
+        evidence = {}
+        for (domain, topic, subtopic), score in scores.items():
+            node = self.index.find(domain, topic, subtopic)
+            if node is not None:
+                evidence[node.node_id] = score - neutral
+        shifts = {}
+        for node_id, value in self.infer(evidence).items():
+            node = self.index.node(node_id)
+            if node.kind in ("topic", "subtopic"):
+                shifts[(node.domain, node.topic, node.subtopic)] = value
+        return shifts
+
+
+# Global prerequisite graph instance
+skill_graph = SkillGraph()
@@ -0,0 +1,370 @@
+from typing import Dict, List, Optional, Tuple
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+
+from sqlalchemy import bindparam, case, func, literal_column, select
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.orm import Session, aliased
+
+from app.models.skill import SkillObservation, SkillTrend, UserSkill, SKILL_KEY_ELEMENTS, TREND_KEY_ELEMENTS
+from app.services.evaluation import SessionEvaluation, SkillStatus
+from app.services.skill_graph import skill_graph
+
+
+# Score thresholds used to derive UserSkill.status
+WEAK_THRESHOLD = 0.5
+STRONG_THRESHOLD = 0.75
+
+# Score assumed for a skill with no assessment; inferred shifts apply around it
+NEUTRAL_SCORE = 0.5
+
+# Weight of the newest observation in a skill trend's moving average
+TREND_EMA_ALPHA = 0.3
+
+SkillKey = Tuple[str, str, Optional[str]]
+
+
+def collect_skill_scores(evaluation: SessionEvaluation) -> Dict[SkillKey, Tuple[float, float]]:
+    """
+    Flatten an evaluation into {(domain, topic, subtopic): (score, confidence)}.
+
+    A skill scored more than once in the same session is merged into a
+    confidence-weighted mean so each skill appears once in the upsert.
+    Topics with no evidence at all (confidence 0) are left out.
+    """
+    merged: Dict[SkillKey, List[float]] = {}
+
+    for domain_score in evaluation.domain_scores:
+        for topic_score in domain_score.topic_scores:
+            if topic_score.confidence <= 0:
+                continue
+            key = (domain_score.domain, topic_score.topic, topic_score.subtopic)
+            weight = max(topic_score.confidence, 1e-6)
+            acc = merged.setdefault(key, [0.0, 0.0, 0.0, 0])
+            acc[0] += topic_score.score * weight
+            acc[1] += weight
+            acc[2] += topic_score.confidence
+            acc[3] += 1
+
+    return {
+        key: (weighted / total_weight, confidence / count)
+        for key, (weighted, total_weight, confidence, count) in merged.items()
+    }
+
+
+def upsert_skill_scores(
+    db: Session,
+    user_id: int,
+    evaluation: SessionEvaluation,
+    observed_at: Optional[datetime] = None
+) -> int:
+    """
+    Merge every topic score from a session into the user's skill profile.
+
+    All skills are written by one prepared INSERT ... ON CONFLICT DO UPDATE
+    statement executed over the batch of rows.
+    Existing rows are folded in with an incremental running average:
+
+        n' = n + 1
+        score' = score + (new_score - score) / n'
+        confidence' = confidence + (new_confidence - confidence) / n'
+
+    Each score is also appended to the skill's history and folded into its
+    weekly trend rollup (see record_skill_observations), observed at
+    observed_at (default now). Skills never assessed directly then get a
+    prior inferred from the user's whole assessed profile through the
+    prerequisite graph; see apply_inferred_shifts.
+
+    That is six statements per session, each over its whole batch: the
+    skill upsert, the observation insert, the trend upsert, reading back
+    the assessed profile, and replacing the priors (delete, insert). The
+    skill scores themselves still take a single statement.
+
+    The caller owns the transaction; this function does not commit.
+
+    Returns:
+        Number of skills written
+    """
+    skill_scores = collect_skill_scores(evaluation)
+    if not skill_scores:
+        return 0
+
+    now = datetime.utcnow()
+    rows = [
+        {
+            "user_id": user_id,
+            "domain": domain,
+            "topic": topic,
+            "subtopic": subtopic,
+            "score": score,
+            "status": skill_status(score).value,
+            "confidence": confidence,
+            "times_assessed": 1,
+            "last_session_id": evaluation.session_id,
+            "created_at": now,
+            "updated_at": now,
+        }
+        for (domain, topic, subtopic), (score, confidence) in skill_scores.items()
+    ]
+
+    # Core executemany: the statement is compiled once and cached, instead
+    # of compiling a fresh multi-row VALUES clause for every session.
+    db.connection().execute(_upsert_statement(), rows)
+    record_skill_observations(db, user_id, skill_scores, evaluation.session_id, observed_at or now)
+
+    # Priors are recomputed from every directly assessed skill, not
+    # accumulated session by session, so repeated sessions cannot drift them
+    assessed = db.query(UserSkill.domain, UserSkill.topic, UserSkill.subtopic, UserSkill.score).filter(
+        UserSkill.user_id == user_id,
+        UserSkill.times_assessed > 0
+    ).all()
+    shifts = skill_graph.infer_skill_scores(
+        {(domain, topic, subtopic): score for domain, topic, subtopic, score in assessed}, neutral=NEUTRAL_SCORE
+    )
+    apply_inferred_shifts(db, user_id, shifts, evaluation.session_id)
+    return len(rows)
+
+
+def apply_inferred_shifts(
+    db: Session,
+    user_id: int,
+    shifts: Dict[SkillKey, float],
+    session_id: Optional[int] = None
+) -> int:
+    """
+    Replace the inferred priors of skills not assessed directly.
+
+    The user's previous priors are deleted and the new set inserted, so a
+    skill whose shift no longer qualifies loses its prior. A prior is
+    absolute, NEUTRAL_SCORE + shift (clamped to 0-1). Rows with a direct
+    assessment are left alone, so their running average only ever reflects
+    assessments. Inferred rows have zero confidence, zero assessments and
+    status unknown, and are not listed as assessments (GET /me/skills);
+    the first direct assessment replaces the prior outright.
+
+    Returns:
+        Number of skills shifted
+    """
+    db.query(UserSkill).filter(
+        UserSkill.user_id == user_id,
+        func.coalesce(UserSkill.times_assessed, 0) == 0
+    ).delete(synchronize_session=False)
+    if not shifts:
+        return 0
+
+    now = datetime.utcnow()
+    rows = []
+    for (domain, topic, subtopic), shift in shifts.items():
+        score = min(1.0, max(0.0, NEUTRAL_SCORE + shift))
+        rows.append({
+            "user_id": user_id,
+            "domain": domain,
+            "topic": topic,
+            "subtopic": subtopic,
+            "score": score,
+            "status": SkillStatus.UNKNOWN.value,
+            "confidence": 0.0,
+            "times_assessed": 0,
+            "last_session_id": session_id,
+            "created_at": now,
+            "updated_at": now,
+        })
+    db.connection().execute(_shift_statement(), rows)
+    return len(rows)
+
+
+def week_start(moment: datetime) -> date:
+    """Monday of the week a moment falls in."""
+    day = moment.date()
+    return day - timedelta(days=day.weekday())
+
+
+def record_skill_observations(
+    db: Session,
+    user_id: int,
+    skill_scores: Dict[SkillKey, Tuple[float, float]],
+    session_id: Optional[int],
+    observed_at: datetime
+) -> int:
+    """
+    Append a session's skill scores to skill_observations and roll them up.
+
+    Each skill's rollup row for the observation's week is upserted in the
+    same batch: count and mean update incrementally, last_score is
+    replaced, and ema moves TREND_EMA_ALPHA of the way to the new score,
+    starting from the skill's latest earlier week (or from the score
+    itself for a first observation). Observations must arrive in time
+    order, as they do live and when the history is replayed.
+
+    The caller owns the transaction; this function does not commit.
+
+    Returns:
+        Number of observations written
+    """
+    if not skill_scores:
+        return 0
+
+    week = week_start(observed_at)
+    connection = db.connection()
+    connection.execute(insert(SkillObservation), [
+        {
+            "user_id": user_id,
+            "session_id": session_id,
+            "domain": domain,
+            "topic": topic,
+            "subtopic": subtopic,
+            "score": score,
+            "confidence": confidence,
+            "observed_at": observed_at,
+        }
+        for (domain, topic, subtopic), (score, confidence) in skill_scores.items()
+    ])
+    connection.execute(_trend_statement(), [
+        {
+            "p_user_id": user_id,
+            "p_domain": domain,
+            "p_topic": topic,
+            "p_subtopic": subtopic,
+            "p_week_start": week,
+            "p_score": score,
+            "p_updated_at": observed_at,
+        }
+        for (domain, topic, subtopic), (score, _) in skill_scores.items()
+    ])
+    return len(skill_scores)
+
+
+@lru_cache(maxsize=1)
+def _upsert_statement():
+    """Build the skill upsert statement."""
+    stmt = insert(UserSkill)
+    excluded = stmt.excluded
+    times_assessed = func.coalesce(UserSkill.times_assessed, 0) + 1
+    new_score = case(
+        (UserSkill.score.is_(None), excluded.score),
+        else_=UserSkill.score + (excluded.score - UserSkill.score) / times_assessed
+    )
+    new_confidence = (
+        func.coalesce(UserSkill.confidence, 0.0)
+        + (excluded.confidence - func.coalesce(UserSkill.confidence, 0.0)) / times_assessed
+    )
+
+    stmt = stmt.on_conflict_do_update(
+        index_elements=list(SKILL_KEY_ELEMENTS),
+        set_={
+            "score": new_score,
+            "status": case(
+                (new_score < WEAK_THRESHOLD, SkillStatus.WEAK.value),
+                (new_score < STRONG_THRESHOLD, SkillStatus.IMPROVING.value),
+                else_=SkillStatus.STRONG.value
+            ),
+            "confidence": new_confidence,
+            "times_assessed": times_assessed,
+            "last_session_id": excluded.last_session_id,
+            "updated_at": excluded.updated_at,
+        }
+    )
+    return stmt
+
+
+@lru_cache(maxsize=1)
+def _shift_statement():
+    """Build the inferred-prior insert statement."""
+    # Directly assessed skills keep their running average
+    return insert(UserSkill).on_conflict_do_nothing(index_elements=list(SKILL_KEY_ELEMENTS))
+
+
+@lru_cache(maxsize=1)
+def _trend_statement():
+    """Build the weekly trend rollup upsert statement."""
+    score = bindparam("p_score")
+    subtopic = bindparam("p_subtopic")
+    week = bindparam("p_week_start")
+
+    # A new week's moving average continues from the latest earlier week
+    earlier = aliased(SkillTrend)
+    previous_ema = select(earlier.ema).where(
+        earlier.user_id == bindparam("p_user_id"),
+        earlier.domain == bindparam("p_domain"),
+        earlier.topic == bindparam("p_topic"),
+        func.coalesce(earlier.subtopic, literal_column("''")) == func.coalesce(subtopic, literal_column("''")),
+        earlier.week_start < week
+    ).order_by(earlier.week_start.desc()).limit(1).scalar_subquery()
+
+    stmt = insert(SkillTrend).values(
+        user_id=bindparam("p_user_id"),
+        domain=bindparam("p_domain"),
+        topic=bindparam("p_topic"),
+        subtopic=subtopic,
+        week_start=week,
+        count=1,
+        mean=score,
+        ema=func.coalesce(previous_ema + TREND_EMA_ALPHA * (score - previous_ema), score),
+        last_score=score,
+        updated_at=bindparam("p_updated_at")
+    )
+    excluded = stmt.excluded
+    count = SkillTrend.count + 1
+
+    return stmt.on_conflict_do_update(
+        index_elements=list(TREND_KEY_ELEMENTS),
+        set_={
+            "count": count,
+            "mean": SkillTrend.mean + (excluded.last_score - SkillTrend.mean) / count,
+            "ema": SkillTrend.ema + TREND_EMA_ALPHA * (excluded.last_score - SkillTrend.ema),
+            "last_score": excluded.last_score,
+            "updated_at": excluded.updated_at,
+        }
+    )
+
+
+def skill_trends(
+    db: Session,
+    user_id: int,
+    weeks: int,
+    domain: Optional[str] = None,
+    today: Optional[date] = None
+) -> List[dict]:
+    """
+    A user's weekly skill trends over the last weeks weeks, from the rollups.
+
+    Reads one precomputed row per skill and week (never the raw
+    observations), grouped per skill with its weeks in order.
+
+    Returns:
+        Per skill, {"domain", "topic", "subtopic", "ema", "change", "points"}
+    """
+    today = today or datetime.utcnow().date()
+    cutoff = today - timedelta(days=today.weekday(), weeks=weeks - 1)
+    query = db.query(SkillTrend).filter(SkillTrend.user_id == user_id, SkillTrend.week_start >= cutoff)
+    if domain is not None:
+        query = query.filter(SkillTrend.domain == domain)
+    rows = query.order_by(
+        SkillTrend.domain, SkillTrend.topic, SkillTrend.subtopic, SkillTrend.week_start
+    ).all()
+
+    trends: Dict[SkillKey, List[SkillTrend]] = {}
+    for row in rows:
+        trends.setdefault((row.domain, row.topic, row.subtopic), []).append(row)
+    return [
+        {
+            "domain": domain,
+            "topic": topic,
+            "subtopic": subtopic,
+            "ema": points[-1].ema,
+            "change": points[-1].ema - points[0].ema if len(points) > 1 else None,
+            "points": points,
+        }
+        for (domain, topic, subtopic), points in trends.items()
+    ]
+
+
+def skill_status(score: Optional[float]) -> SkillStatus:
+    """Map a 0-1 skill score to a SkillStatus."""
+    if score is None:
+        return SkillStatus.UNKNOWN
+    if score < WEAK_THRESHOLD:
+        return SkillStatus.WEAK
+    if score < STRONG_THRESHOLD:
+        return SkillStatus.IMPROVING
+    return SkillStatus.STRONG
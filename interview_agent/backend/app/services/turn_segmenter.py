@@ -0,0 +1,159 @@
+import re
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from app.services.question_bank import QuestionBank, question_bank
+from app.services.question_search import tokenize
+
+
+SENTENCE_BREAK = re.compile(r"(?<=[.?!])\s+")
+
+TopicKey = Tuple[Optional[str], Optional[str]]  # (domain, topic)
+
+
+@dataclass
+class Probe:
+    """One interviewer prompt (main question or follow-up) and the answers to it."""
+    prompt: str
+    entry_index: int
+    answers: List[str] = field(default_factory=list)
+
+
+@dataclass
+class Exchange:
+    """A bank question, the candidate's answer and any follow-ups on it."""
+    index: int
+    question_id: Optional[str]
+    domain: Optional[str]
+    topic: Optional[str]
+    subtopic: Optional[str]
+    difficulty: Optional[str]
+    probes: List[Probe] = field(default_factory=list)
+    started_at: Optional[datetime] = None
+    ended_at: Optional[datetime] = None
+
+    @property
+    def question(self) -> Probe:
+        return self.probes[0]
+
+    @property
+    def follow_ups(self) -> List[Probe]:
+        return self.probes[1:]
+
+    @property
+    def answer(self) -> str:
+        """The candidate's answer to the main question."""
+        return " ".join(self.probes[0].answers)
+
+
+def _field(entry, name: str, default=None):
+    """Read a transcript field from a TranscriptEntry or a plain dict."""
+    if isinstance(entry, dict):
+        return entry.get(name, default)
+    return getattr(entry, name, default)
+
+
+class TurnSegmenter:
+    """
+    Streaming segmentation of a transcript into question exchanges.
+
+    Entries are fed one at a time, in order. An interviewer turn opens a new
+    exchange when it is tagged with a question_id (set when the question was
+    served by the selector) or when one of its trailing sentence spans
+    matches a bank question's text exactly after normalisation; any other
+    interviewer turn after an answer is a follow-up on the open exchange.
+    Candidate turns attach to the latest prompt.
+
+    Exchanges are indexed by (domain, topic), domain and question id as they
+    open, so per-topic access during evaluation is a dict lookup and the
+    index is always current.
+    """
+
+    def __init__(self, domains: Optional[Iterable[str]] = None, bank: QuestionBank = question_bank):
+        self.domains = list(domains) if domains else None
+        self._bank = bank
+        self.exchanges: List[Exchange] = []
+        self.by_topic: Dict[TopicKey, List[Exchange]] = {}
+        self.by_domain: Dict[Optional[str], List[Exchange]] = {}
+        self.by_question: Dict[str, List[Exchange]] = {}
+        self.unassigned: List[str] = []  # candidate turns before any question
+        self._entries_seen = 0
+
+    def feed(self, entry) -> Optional[Exchange]:
+        """Consume one transcript entry; returns the exchange it joined, if any."""
+        entry_index = self._entries_seen
+        self._entries_seen += 1
+        role = _field(entry, "role")
+        content = _field(entry, "content") or ""
+        timestamp = _field(entry, "timestamp")
+        current = self.exchanges[-1] if self.exchanges else None
+
+        if role == "assistant":
+            question = self._tagged_question(entry) or self._match_question(content)
+            if question is not None or current is None:
+                current = self._open(question, content, entry_index, timestamp)
+            elif current.probes[-1].answers:
+                current.probes.append(Probe(prompt=content, entry_index=entry_index))
+            else:
+                # Interviewer spoke twice in a row: same prompt, continued
+                current.probes[-1].prompt = f"{current.probes[-1].prompt} {content}"
+        elif current is not None:
+            current.probes[-1].answers.append(content)
+        else:
+            self.unassigned.append(content)
+            return None
+
+        if timestamp is not None:
+            current.ended_at = timestamp
+        return current
+
+    def feed_all(self, entries: Iterable) -> "TurnSegmenter":
+        for entry in entries:
+            self.feed(entry)
+        return self
+
+    def for_topic(self, domain: Optional[str], topic: Optional[str]) -> List[Exchange]:
+        return self.by_topic.get((domain, topic), [])
+
+    def for_domain(self, domain: Optional[str]) -> List[Exchange]:
+        return self.by_domain.get(domain, [])
+
+    def for_question(self, question_id: str) -> List[Exchange]:
+        return self.by_question.get(question_id, [])
+
+    def _open(self, question: Optional[dict], content: str, entry_index: int, timestamp) -> Exchange:
+        question = question or {}
+        exchange = Exchange(
+            index=len(self.exchanges),
+            question_id=question.get("id"),
+            domain=question.get("domain"),
+            topic=question.get("topic"),
+            subtopic=question.get("subtopic"),
+            difficulty=question.get("difficulty"),
+            probes=[Probe(prompt=content, entry_index=entry_index)],
+            started_at=timestamp,
+            ended_at=timestamp
+        )
+        self.exchanges.append(exchange)
+        self.by_topic.setdefault((exchange.domain, exchange.topic), []).append(exchange)
+        self.by_domain.setdefault(exchange.domain, []).append(exchange)
+        if exchange.question_id is not None:
+            self.by_question.setdefault(exchange.question_id, []).append(exchange)
+        return exchange
+
+    def _tagged_question(self, entry) -> Optional[dict]:
+        question_id = _field(entry, "question_id")
+        return self._bank.get(question_id) if question_id else None
+
+    def _match_question(self, content: str) -> Optional[dict]:
+        """Bank question whose normalised text equals a trailing span of the turn."""
+        sentences = SENTENCE_BREAK.split(content.strip())
+        for start in range(len(sentences)):
+            key = " ".join(tokenize(" ".join(sentences[start:])))
+            if not key:
+                continue
+            question = self._bank.find_text(key, self.domains)
+            if question is not None:
+                return question
+        return None
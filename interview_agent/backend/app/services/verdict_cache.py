@@ -0,0 +1,158 @@
+from collections import OrderedDict
+from typing import Callable, Dict, Iterable, Optional, Sequence, Tuple
+import hashlib
+import json
+import threading
+import unicodedata
+
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.orm import Session
+
+from app.config import get_settings
+from app.database import SessionLocal
+from app.models.judge import JudgeVerdictRecord
+
+settings = get_settings()
+
+# (key, question_id, judge_model, verdict)
+VerdictRecord = Tuple[str, Optional[str], str, dict]
+
+
+def normalize_answer(text: str) -> str:
+    """Answer text as cached: NFKC, case-folded, whitespace collapsed."""
+    return " ".join(unicodedata.normalize("NFKC", text).casefold().split())
+
+
+def rubric_version(rubric: Dict[str, str]) -> str:
+    """Content hash of a rubric; any edit to a dimension yields a new version."""
+    canonical = json.dumps(rubric, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode()).hexdigest()[:16]
+
+
+def verdict_key(
+    question_id: Optional[str],
+    question: str,
+    answer: str,
+    rubric: Dict[str, str],
+    judge_model: str,
+    prompt_version: str
+) -> str:
+    """
+    Content address of a verdict.
+
+    Bank questions are identified by id; ad-hoc questions (no id) by their
+    normalised text.
+    """
+    parts = [
+        question_id or f"text:{normalize_answer(question)}",
+        normalize_answer(answer),
+        rubric_version(rubric),
+        judge_model,
+        prompt_version
+    ]
+    return hashlib.sha256("\x1f".join(parts).encode()).hexdigest()
+
+
+class VerdictCache:
+    """
+    Two-tier cache of LLM judge verdicts.
+
+    A bounded in-memory LRU sits in front of the judge_verdicts table, so
+    verdicts survive restarts and are shared by every worker on the same
+    database. Keys are content addresses (verdict_key), so entries never go
+    stale: a changed answer, rubric, model or prompt is simply a new key.
+    Lookups and writes are batched per evaluation run.
+    """
+
+    def __init__(self, max_entries: int, session_factory: Callable[[], Session] = SessionLocal):
+        self.max_entries = max_entries
+        self._session_factory = session_factory
+        self._entries: "OrderedDict[str, dict]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.memory_hits = 0
+        self.db_hits = 0
+        self.misses = 0
+        self.writes = 0
+
+    def get_many(self, keys: Sequence[str]) -> Dict[str, dict]:
+        """Cached verdicts for the keys that have one."""
+        found: Dict[str, dict] = {}
+        with self._lock:
+            for key in keys:
+                verdict = self._entries.get(key)
+                if verdict is not None:
+                    self._entries.move_to_end(key)
+                    found[key] = verdict
+            self.memory_hits += len(found)
+
+        missing = [key for key in dict.fromkeys(keys) if key not in found]
+        if missing:
+            db = self._session_factory()
+            try:
+                rows = db.query(JudgeVerdictRecord.key, JudgeVerdictRecord.verdict).filter(
+                    JudgeVerdictRecord.key.in_(missing)
+                ).all()
+            finally:
+                db.close()
+            with self._lock:
+                for key, verdict in rows:
+                    found[key] = verdict
+                    self._remember(key, verdict)
+                self.db_hits += len(rows)
+                self.misses += len(missing) - len(rows)
+        return found
+
+    def put_many(self, records: Iterable[VerdictRecord]):
+        """Store verdicts in both tiers; keys already stored are left as they are."""
+        records = list({record[0]: record for record in records}.values())
+        if not records:
+            return
+        with self._lock:
+            for key, _, _, verdict in records:
+                self._remember(key, verdict)
+
+        stmt = insert(JudgeVerdictRecord).on_conflict_do_nothing(index_elements=["key"])
+        db = self._session_factory()
+        try:
+            db.execute(stmt, [
+                {"key": key, "question_id": question_id, "judge_model": judge_model, "verdict": verdict}
+                for key, question_id, judge_model, verdict in records
+            ])
+            db.commit()
+        finally:
+            db.close()
+        with self._lock:
+            self.writes += len(records)
+
+    def metrics(self) -> dict:
+        """Hit counts and hit rate since startup."""
+        with self._lock:
+            lookups = self.memory_hits + self.db_hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "memory_hits": self.memory_hits,
+                "db_hits": self.db_hits,
+                "misses": self.misses,
+                "writes": self.writes,
+                "hit_rate": (self.memory_hits + self.db_hits) / lookups if lookups else 0.0
+            }
+
+    def clear(self):
+        """Drop the memory tier (the table is left alone)."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _remember(self, key: str, verdict: dict):
+        if self.max_entries <= 0:
+            return
+        self._entries[key] = verdict
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+# Global verdict cache instance
+verdict_cache = VerdictCache(max_entries=settings.judge_cache_max_entries)
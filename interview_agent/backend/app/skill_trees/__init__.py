@@ -1,6 +1,7 @@
 from app.skill_trees.coding import CODING_SKILL_TREE
 from app.skill_trees.system_design import SYSTEM_DESIGN_SKILL_TREE
 from app.skill_trees.ml import ML_SKILL_TREE
+from app.skill_trees.index import SkillIndex, SkillNode
 
 
 SKILL_TREES = {
@@ -9,6 +10,9 @@ SKILL_TREES = {
     "ml": ML_SKILL_TREE
 }
 
+# Flattened index over all trees, built once at import
+SKILL_INDEX = SkillIndex(SKILL_TREES)
+
 
 def get_skill_tree(domain: str) -> dict:
     """Get the skill tree for a given domain."""
@@ -17,31 +21,14 @@ def get_skill_tree(domain: str) -> dict:
 
 def get_all_skills(domain: str) -> list:
     """Get a flat list of all skills in a domain."""
-    tree = get_skill_tree(domain)
-    skills = []
-
-    def traverse(node, path=""):
-        if isinstance(node, dict):
-            for key, value in node.items():
-                new_path = f"{path}/{key}" if path else key
-                if isinstance(value, dict) and "skills" in value:
-                    # Leaf node with skills
-                    for skill in value["skills"]:
-                        skills.append({
-                            "domain": domain,
-                            "topic": path.split("/")[0] if "/" in path else key,
-                            "subtopic": key if "/" in new_path else None,
-                            "skill": skill
-                        })
-                else:
-                    traverse(value, new_path)
-
-    traverse(tree)
-    return skills
+    return [dict(skill) for skill in SKILL_INDEX.domain_skills(domain)]
 
 
 __all__ = [
     "SKILL_TREES",
+    "SKILL_INDEX",
+    "SkillIndex",
+    "SkillNode",
     "get_skill_tree",
     "get_all_skills",
     "CODING_SKILL_TREE",
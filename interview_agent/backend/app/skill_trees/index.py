@@ -0,0 +1,166 @@
+from dataclasses import dataclass, replace
+from types import MappingProxyType
+from typing import Dict, Iterator, List, Mapping, Optional, Tuple
+
+
+DOMAIN = "domain"
+TOPIC = "topic"
+SUBTOPIC = "subtopic"
+SKILL = "skill"
+
+
+@dataclass(frozen=True)
+class SkillNode:
+    """
+    One node of a skill tree: a domain, topic, subtopic or skill.
+
+    node_id is the node's position in the index. Skills also carry a dense
+    skill_id (0..num_skills-1) for indexing score arrays; nodes are laid out
+    depth-first, so the skills under any node form the contiguous range
+    skill_range.
+    """
+    node_id: int
+    kind: str
+    domain: str
+    topic: Optional[str]
+    subtopic: Optional[str]
+    skill: Optional[str]
+    name: str
+    parent_id: Optional[int]
+    depth: int
+    skill_id: Optional[int]
+    skill_range: Tuple[int, int]
+
+    @property
+    def path(self) -> str:
+        """Slash-joined domain/topic/subtopic/skill keys down to this node."""
+        return "/".join(part for part in (self.domain, self.topic, self.subtopic, self.skill) if part)
+
+    def as_dict(self) -> dict:
+        return {
+            "domain": self.domain,
+            "topic": self.topic,
+            "subtopic": self.subtopic,
+            "skill": self.skill
+        }
+
+
+class SkillIndex:
+    """
+    Immutable, precomputed index over the skill trees.
+
+    Built once from the nested {topic: {"topics": {subtopic: {"skills": [...]}}}}
+    dicts. Every lookup (by id, path, parent, ancestors, skill id) is a
+    tuple index or dict get.
+    """
+
+    def __init__(self, trees: Mapping[str, dict]):
+        nodes: List[SkillNode] = []
+        skill_nodes: List[SkillNode] = []
+        children: Dict[int, List[int]] = {}
+
+        def add(kind, domain, topic, subtopic, skill, name, parent_id, depth) -> int:
+            node_id = len(nodes)
+            skill_id = len(skill_nodes) if kind == SKILL else None
+            node = SkillNode(
+                node_id=node_id, kind=kind, domain=domain, topic=topic, subtopic=subtopic,
+                skill=skill, name=name, parent_id=parent_id, depth=depth,
+                skill_id=skill_id, skill_range=(len(skill_nodes), len(skill_nodes))
+            )
+            nodes.append(node)
+            if kind == SKILL:
+                skill_nodes.append(node)
+            if parent_id is not None:
+                children.setdefault(parent_id, []).append(node_id)
+            return node_id
+
+        def close(node_id: int):
+            # Skills added since the node was opened are its subtree's skills
+            node = nodes[node_id]
+            nodes[node_id] = replace(node, skill_range=(node.skill_range[0], len(skill_nodes)))
+
+        for domain, tree in trees.items():
+            domain_id = add(DOMAIN, domain, None, None, None, domain, None, 0)
+            for topic, topic_node in tree.items():
+                topic_id = add(TOPIC, domain, topic, None, None, topic_node.get("name", topic), domain_id, 1)
+                for subtopic, subtopic_node in topic_node.get("topics", {}).items():
+                    subtopic_id = add(
+                        SUBTOPIC, domain, topic, subtopic, None,
+                        subtopic_node.get("name", subtopic), topic_id, 2
+                    )
+                    for skill in subtopic_node.get("skills", []):
+                        add(SKILL, domain, topic, subtopic, skill, skill, subtopic_id, 3)
+                        close(len(nodes) - 1)
+                    close(subtopic_id)
+                close(topic_id)
+            close(domain_id)
+
+        self.nodes: Tuple[SkillNode, ...] = tuple(nodes)
+        self._skill_node_ids: Tuple[int, ...] = tuple(node.node_id for node in skill_nodes)
+        self._children: Dict[int, Tuple[int, ...]] = {k: tuple(v) for k, v in children.items()}
+        self._by_path: Mapping[str, int] = MappingProxyType({node.path: node.node_id for node in self.nodes})
+        self._by_skill: Mapping[Tuple[str, str], int] = MappingProxyType({
+            (node.domain, node.skill): node.node_id for node in self.nodes if node.kind == SKILL
+        })
+
+        ancestors = []
+        for node in self.nodes:
+            chain = () if node.parent_id is None else ancestors[node.parent_id] + (node.parent_id,)
+            ancestors.append(chain)
+        self._ancestors: Tuple[Tuple[int, ...], ...] = tuple(ancestors)
+
+        self._domain_skill_dicts: Mapping[str, Tuple[dict, ...]] = MappingProxyType({
+            node.domain: tuple(self.skill(i).as_dict() for i in range(*node.skill_range))
+            for node in self.nodes if node.kind == DOMAIN
+        })
+
+    @property
+    def num_skills(self) -> int:
+        return len(self._skill_node_ids)
+
+    def node(self, node_id: int) -> SkillNode:
+        return self.nodes[node_id]
+
+    def skill(self, skill_id: int) -> SkillNode:
+        """Skill node by dense skill id."""
+        return self.nodes[self._skill_node_ids[skill_id]]
+
+    def find(
+        self,
+        domain: str,
+        topic: Optional[str] = None,
+        subtopic: Optional[str] = None,
+        skill: Optional[str] = None
+    ) -> Optional[SkillNode]:
+        """Node at the given domain/topic/subtopic/skill path."""
+        path = "/".join(part for part in (domain, topic, subtopic, skill) if part)
+        node_id = self._by_path.get(path)
+        return None if node_id is None else self.nodes[node_id]
+
+    def find_path(self, path: str) -> Optional[SkillNode]:
+        """Node for a slash-joined path, e.g. "coding/arrays_strings/two_pointers"."""
+        node_id = self._by_path.get(path)
+        return None if node_id is None else self.nodes[node_id]
+
+    def find_skill(self, domain: str, skill: str) -> Optional[SkillNode]:
+        """Skill node by domain and skill key (skill keys are unique per domain)."""
+        node_id = self._by_skill.get((domain, skill))
+        return None if node_id is None else self.nodes[node_id]
+
+    def parent(self, node: SkillNode) -> Optional[SkillNode]:
+        return None if node.parent_id is None else self.nodes[node.parent_id]
+
+    def ancestors(self, node: SkillNode) -> Tuple[SkillNode, ...]:
+        """Ancestors from the domain root down to the node's parent."""
+        return tuple(self.nodes[i] for i in self._ancestors[node.node_id])
+
+    def children(self, node: SkillNode) -> Tuple[SkillNode, ...]:
+        return tuple(self.nodes[i] for i in self._children.get(node.node_id, ()))
+
+    def skills_under(self, node: SkillNode) -> Iterator[SkillNode]:
+        """Skills in the subtree rooted at node, in skill id order."""
+        return (self.skill(i) for i in range(*node.skill_range))
+
+    def domain_skills(self, domain: str) -> Tuple[dict, ...]:
+        """Flat skill dicts for a domain, precomputed."""
+        return self._domain_skill_dicts.get(domain, ())
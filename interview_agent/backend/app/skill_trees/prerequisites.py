@@ -0,0 +1,53 @@
+# Prerequisite overlay on the skill trees: (prerequisite, dependent, weight).
+# Endpoints are skill-tree paths at topic, subtopic or skill level; weakness
+# in the prerequisite is evidence of risk in the dependent.
+PREREQUISITE_EDGES = [
+    # Coding
+    ("coding/recursion_backtracking", "coding/dynamic_programming", 1.0),
+    ("coding/recursion_backtracking/recursion", "coding/recursion_backtracking/backtracking", 1.0),
+    ("coding/recursion_backtracking/recursion", "coding/trees_graphs/tree_traversals", 0.7),
+    ("coding/dynamic_programming/1d_dp", "coding/dynamic_programming/2d_dp", 1.0),
+    ("coding/dynamic_programming/1d_dp", "coding/dynamic_programming/knapsack", 0.8),
+    ("coding/dynamic_programming/2d_dp", "coding/dynamic_programming/state_machine_dp", 0.6),
+    ("coding/trees_graphs/tree_traversals", "coding/trees_graphs/graph_search", 1.0),
+    ("coding/trees_graphs/tree_traversals", "coding/trees_graphs/binary_search_trees", 0.8),
+    ("coding/trees_graphs/graph_search", "coding/trees_graphs/shortest_paths", 1.0),
+    ("coding/trees_graphs/graph_search", "coding/trees_graphs/advanced_graphs", 1.0),
+    ("coding/sorting_searching/binary_search", "coding/trees_graphs/binary_search_trees", 0.6),
+    ("coding/arrays_strings/two_pointers", "coding/arrays_strings/sliding_window", 0.8),
+    ("coding/arrays_strings", "coding/sorting_searching", 0.5),
+    ("coding/system_coding/testing", "coding/system_coding/debugging", 0.5),
+
+    # System design
+    ("system_design/scaling/horizontal_vertical", "system_design/scaling/load_balancing", 1.0),
+    ("system_design/scaling/horizontal_vertical", "system_design/data_storage/sharding", 0.7),
+    ("system_design/data_storage/sql_nosql", "system_design/data_storage/indexing", 0.6),
+    ("system_design/data_storage/sql_nosql", "system_design/data_storage/sharding", 0.8),
+    ("system_design/data_storage/replication", "system_design/consistency_availability", 1.0),
+    ("system_design/consistency_availability/cap_theorem", "system_design/consistency_availability/eventual_consistency", 1.0),
+    ("system_design/consistency_availability/eventual_consistency", "system_design/consistency_availability/consensus", 0.8),
+    ("system_design/scaling/caching", "system_design/consistency_availability/eventual_consistency", 0.5),
+    ("system_design/reliability/fault_tolerance", "system_design/reliability/circuit_breakers", 0.8),
+    ("system_design/communication/protocols", "system_design/communication/api_design", 0.6),
+    ("system_design/communication/messaging", "system_design/consistency_availability/eventual_consistency", 0.5),
+    ("system_design/security/authentication", "system_design/security/authorization", 1.0),
+    ("system_design/scaling", "system_design/reliability", 0.5),
+
+    # ML
+    ("ml/fundamentals", "ml/classical_ml", 1.0),
+    ("ml/fundamentals/evaluation_metrics", "ml/mlops/monitoring", 0.6),
+    ("ml/classical_ml/linear_models", "ml/deep_learning/neural_networks", 1.0),
+    ("ml/classical_ml/linear_models", "ml/classical_ml/svm", 0.6),
+    ("ml/deep_learning/neural_networks", "ml/deep_learning/optimization", 1.0),
+    ("ml/deep_learning/neural_networks", "ml/deep_learning/regularization", 0.8),
+    ("ml/deep_learning", "ml/nlp", 0.8),
+    ("ml/deep_learning", "ml/computer_vision", 0.8),
+    ("ml/nlp/text_preprocessing", "ml/nlp/embeddings", 0.8),
+    ("ml/nlp/embeddings", "ml/nlp/transformers", 1.0),
+    ("ml/nlp/transformers", "ml/nlp/llms", 1.0),
+    ("ml/computer_vision/cnns", "ml/computer_vision/object_detection", 1.0),
+    ("ml/computer_vision/cnns", "ml/computer_vision/image_segmentation", 1.0),
+    ("ml/mlops/pipelines", "ml/mlops/model_serving", 0.6),
+    ("ml/mlops/versioning", "ml/mlops/pipelines", 0.6),
+    ("ml/deep_learning/neural_networks/backpropagation", "ml/deep_learning/optimization/gradient_descent_variants", 1.0),
+]
@@ -0,0 +1 @@
+# Interview Agent Benchmarks
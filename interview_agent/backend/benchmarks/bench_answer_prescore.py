@@ -0,0 +1,184 @@
+"""
+Judge-call reduction and agreement of the local answer pre-scorer.
+
+Runs the pre-scorer over a labeled corpus of answers to bank questions,
+each labeled 1-5 like an overall judge score. Reports how many answers it
+decides locally (LLM calls saved), how often its decision agrees with the
+label band (1-2 low, 4-5 high; a decided 3 counts as a disagreement), the
+mean absolute error of its local overall score, and its per-answer cost.
+
+The default corpus is synthetic and deterministic: non-answers, answers
+to another domain's question, filler-heavy rambling, short partial answers
+behind a hedge ("Not sure if this is optimal, but ..."), and answers
+covering half, most or all of the rubric with words dropped and inflected.
+Pass --corpus with a JSONL file of {"question_id", "answer", "label"}
+lines (e.g. human-labeled transcripts) to measure on real answers instead.
+
+Usage (from the backend directory):
+    python -m benchmarks.bench_answer_prescore --per-question 21
+    python -m benchmarks.bench_answer_prescore --corpus labeled_answers.jsonl
+"""
+import argparse
+import json
+import random
+import time
+from collections import Counter
+
+from app.services.answer_prescore import AnswerPrescorer
+from app.services.llm_judge import JudgeRequest
+from app.services.question_bank import DOMAINS, question_bank
+
+NON_ANSWERS = [
+    "",
+    "I don't know.",
+    "Um, I'm not sure, sorry.",
+    "I haven't worked with this before, I don't know.",
+    "Can we skip this one?",
+    "No idea, honestly.",
+]
+LEADS = [
+    "First, I would", "The key point is that it", "So my approach", "I think it",
+    "Then I'd make sure it", "Another thing:", "On top of that,", "For this part,",
+]
+FILLER = [
+    "um", "uh", "like", "you know", "basically", "I mean", "sort of", "actually",
+]
+HEDGES = [
+    "I don't know the exact details", "Not sure if this is optimal", "I haven't used it in production",
+    "I don't remember the name", "I'm not sure this is right",
+]
+GENERIC = [
+    "Let me think about this for a second.",
+    "I would probably want to look at it from a few angles.",
+    "It depends on the situation really.",
+    "I have seen something similar at work before.",
+]
+
+
+def paraphrase(criterion: str, rng: random.Random) -> str:
+    """Criterion text with some words dropped or inflected, behind a lead-in."""
+    words = []
+    for word in criterion.replace("/", " ").split():
+        roll = rng.random()
+        if roll < 0.2:
+            continue
+        if roll < 0.35 and word.isalpha() and len(word) > 3:
+            word += rng.choice(["s", "ing", "ed"])
+        words.append(word)
+    return f"{rng.choice(LEADS)} {' '.join(words).lower()}."
+
+
+def covering_answer(question: dict, fraction: float, rng: random.Random) -> str:
+    criteria = list(question["rubric"].values())
+    covered = rng.sample(criteria, max(1, round(len(criteria) * fraction)))
+    sentences = [paraphrase(c, rng) for c in covered]
+    sentences += rng.sample(GENERIC, rng.randrange(1, 3))
+    rng.shuffle(sentences)
+    return " ".join(sentences)
+
+
+def hedged_answer(question: dict, rng: random.Random) -> str:
+    """A short answer covering one criterion behind a hedge (not a non-answer)."""
+    criterion = rng.choice(list(question["rubric"].values()))
+    return f"{rng.choice(HEDGES)}, but {paraphrase(criterion, rng)}"
+
+
+def rambling_answer(question: dict, rng: random.Random) -> str:
+    topic_words = question["question"].split()[:rng.randrange(3, 7)]
+    words = []
+    for word in topic_words + rng.sample(GENERIC, 2)[0].split():
+        words.append(word)
+        if rng.random() < 0.6:
+            words.append(rng.choice(FILLER) + ",")
+    return " ".join(words).lower()
+
+
+def labeled_corpus(per_question: int, rng: random.Random):
+    """Deterministic synthetic (question, answer, label) triples."""
+    questions = {d: [q for q in question_bank.questions(d) if q.get("rubric")] for d in DOMAINS}
+    kinds = [
+        ("non_answer", 1), ("off_topic", 1), ("rambling", 2),
+        ("partial", 3), ("hedged", 3), ("most", 4), ("complete", 5),
+    ]
+    corpus = []
+    for domain in DOMAINS:
+        others = [q for d in DOMAINS if d != domain for q in questions[d]]
+        for question in questions[domain]:
+            for i in range(per_question):
+                kind, label = kinds[i % len(kinds)]
+                if kind == "non_answer":
+                    answer = rng.choice(NON_ANSWERS)
+                elif kind == "off_topic":
+                    answer = covering_answer(rng.choice(others), 1.0, rng)
+                elif kind == "rambling":
+                    answer = rambling_answer(question, rng)
+                elif kind == "hedged":
+                    answer = hedged_answer(question, rng)
+                else:
+                    fraction = {"partial": 0.5, "most": 0.75, "complete": 1.0}[kind]
+                    answer = covering_answer(question, fraction, rng)
+                corpus.append((question, answer, label, kind))
+    return corpus
+
+
+def load_corpus(path: str):
+    corpus = []
+    with open(path) as f:
+        for line in f:
+            if line.strip():
+                item = json.loads(line)
+                question = question_bank.get(item["question_id"])
+                if question is not None:
+                    corpus.append((question, item["answer"], int(item["label"]), item.get("kind", "labeled")))
+    return corpus
+
+
+def band(label: int):
+    return "low" if label <= 2 else "high" if label >= 4 else None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--per-question", type=int, default=28)
+    parser.add_argument("--corpus", help="JSONL of question_id, answer, label")
+    parser.add_argument("--min-confidence", type=float, default=0.8)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    corpus = load_corpus(args.corpus) if args.corpus else labeled_corpus(args.per_question, random.Random(args.seed))
+    requests = [
+        JudgeRequest(key=i, question=q["question"], answer=answer, rubric=q["rubric"], question_id=q["id"])
+        for i, (q, answer, _, _) in enumerate(corpus)
+    ]
+    prescorer = AnswerPrescorer(
+        min_confidence=args.min_confidence,
+        reference_rubrics=question_bank.rubrics
+    )
+    prescorer.prescore_many(requests[:1])  # Build the reference criteria once
+
+    start = time.perf_counter()
+    prescores = prescorer.prescore_many(requests)
+    elapsed = time.perf_counter() - start
+
+    decided = [(p, label, kind) for p, (_, _, label, kind) in zip(prescores, corpus) if p.decision]
+    agreed = sum(p.decision == band(label) for p, label, _ in decided)
+    abs_error = sum(abs(p.verdict.overall_score - label) for p, label, _ in decided)
+
+    print(f"{len(corpus)} labeled answers, min confidence {args.min_confidence}")
+    print(f"{'decided locally (LLM calls saved)':<36} {len(decided):6d}  {len(decided) / len(corpus):6.1%}")
+    print(f"{'escalated to the LLM judge':<36} {len(corpus) - len(decided):6d}")
+    if decided:
+        print(f"{'agreement with label band':<36} {agreed:6d}  {agreed / len(decided):6.1%}")
+        print(f"{'mean abs error of local score':<36} {abs_error / len(decided):6.2f}")
+    print(f"{'prescore cost':<36} {elapsed / len(corpus) * 1e6:6.1f} us/answer")
+
+    totals = Counter(kind for _, _, _, kind in corpus)
+    local = Counter((kind, p.decision) for p, _, kind in decided)
+    print(f"\n{'kind':<12} {'answers':>8} {'low':>6} {'high':>6} {'escalated':>10}")
+    for kind, total in totals.items():
+        low, high = local[(kind, "low")], local[(kind, "high")]
+        print(f"{kind:<12} {total:8d} {low:6d} {high:6d} {total - low - high:10d}")
+
+
+if __name__ == "__main__":
+    main()
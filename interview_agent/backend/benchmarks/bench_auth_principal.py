@@ -0,0 +1,69 @@
+"""
+Throughput benchmark for authenticated requests.
+
+Issues GET /v1/users/me and GET /v1/sessions with real JWTs for a pool of
+users, with the principal cache enabled and disabled.
+
+Usage (from the backend directory):
+    python -m benchmarks.bench_auth_principal --requests 2000
+"""
+import argparse
+import os
+import time
+
+from benchmarks.utils import use_temp_database
+
+DB_PATH = use_temp_database()
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from app.database import SessionLocal, engine, init_db  # noqa: E402
+from app.main import app  # noqa: E402
+from app.models.user import User  # noqa: E402
+from app.services.auth import create_access_token  # noqa: E402
+from app.services.principal_cache import principal_cache  # noqa: E402
+
+
+def run(client: TestClient, headers: list, path: str, num_requests: int) -> float:
+    """Return requests per second for num_requests sequential calls."""
+    start = time.perf_counter()
+    for i in range(num_requests):
+        response = client.get(path, headers=headers[i % len(headers)])
+        assert response.status_code == 200, response.text
+    return num_requests / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--users", type=int, default=50)
+    args = parser.parse_args()
+
+    init_db()
+    db = SessionLocal()
+    users = [User(email=f"user{i}@example.com", password_hash="-") for i in range(args.users)]
+    db.add_all(users)
+    db.commit()
+    headers = [
+        {"Authorization": f"Bearer {create_access_token({'sub': str(u.id)})}"}
+        for u in users
+    ]
+    db.close()
+
+    client = TestClient(app)
+    ttl = principal_cache.ttl_seconds or 60
+    print(f"{args.requests} requests across {args.users} users")
+    for path in ["/v1/users/me", "/v1/sessions"]:
+        for label, cache_ttl in [("cache off", 0), ("cache on", ttl)]:
+            principal_cache.ttl_seconds = cache_ttl
+            principal_cache.clear()
+            run(client, headers, path, min(200, args.requests))  # warm up
+            rps = run(client, headers, path, args.requests)
+            print(f"{'GET ' + path + ', ' + label:<40} {rps:9.0f} req/s")
+
+    engine.dispose()
+    os.remove(DB_PATH)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,254 @@
+"""
+Golden-transcript benchmarks for the evaluation and feedback pipeline.
+
+Replays a fixed corpus of synthetic transcripts (10 to 2,000 turns, bank
+questions from all three domains) through each stage of the session path
+and measures wall time, allocations and peak memory per stage:
+
+- record: every turn through SessionManager.add_transcript_entry (live,
+  spread over the session)
+- summary: SessionManager.get_transcript_summary
+- evaluate: EvaluationService.evaluate_session with every exchange still
+  pending (its worst case: the judge never caught up during the session)
+- report: FeedbackReportGenerator.generate_report
+
+summary + evaluate + report is what end_session waits for, and must stay
+within --budget-ms for every transcript. Judge verdicts are synthesized
+deterministically so no judge is involved.
+
+Results are compared with the stored baseline: a stage regresses when
+its best-of-rounds wall time (the least noisy estimate) or its peak
+memory grows by more than --threshold, and by more than a small absolute
+noise floor. The run exits non-zero on a
+regression or a budget overrun. --save-baseline records the current run
+instead; the baseline notes the corpus digest, so a changed corpus is
+reported rather than compared.
+
+Usage (from the backend directory):
+    python -m benchmarks.bench_evaluation_pipeline
+    python -m benchmarks.bench_evaluation_pipeline --save-baseline
+"""
+import argparse
+import hashlib
+import json
+import platform
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+import zlib
+from pathlib import Path
+
+from benchmarks.bench_turn_segmenter import synthetic_transcript
+from app.services.evaluation import evaluation_service
+from app.services.feedback import feedback_generator
+from app.services.llm_judge import DimensionScore, JudgeVerdict
+from app.services.question_bank import DOMAINS, question_bank
+from app.services.session_manager import session_manager
+
+GOLDEN_SIZES = (10, 50, 200, 1000, 2000)
+GOLDEN_SEED = 48
+BASELINE_PATH = Path(__file__).parent / "baselines" / "evaluation_pipeline.json"
+END_OF_SESSION_STAGES = ("summary", "evaluate", "report")
+
+# Differences below these are noise, whatever the relative change
+NOISE_FLOOR_MS = 0.5
+NOISE_FLOOR_KIB = 64.0
+
+
+def golden_corpus():
+    """{turns: transcript} for every golden size, identical on every run."""
+    rng = random.Random(GOLDEN_SEED)
+    return {turns: synthetic_transcript(turns, rng) for turns in GOLDEN_SIZES}
+
+
+def corpus_digest(corpus) -> str:
+    data = json.dumps({str(turns): transcript for turns, transcript in corpus.items()}, sort_keys=True)
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()[:16]
+
+
+def synthetic_verdicts(exchanges):
+    """A deterministic verdict per answered exchange, scored from a hash of the answer."""
+    verdicts = {}
+    for exchange in exchanges:
+        if not exchange.answer.strip():
+            continue
+        question = question_bank.get(exchange.question_id) if exchange.question_id else None
+        rubric = (question or {}).get("rubric") or {"overall": ""}
+        seed = zlib.crc32(exchange.answer.encode("utf-8"))
+        scores = {
+            dimension: DimensionScore(score=1 + (seed >> i) % 5, evidence="synthetic")
+            for i, dimension in enumerate(rubric)
+        }
+        verdicts[exchange.index] = JudgeVerdict(
+            scores=scores,
+            overall_score=round(statistics.fmean(s.score for s in scores.values()), 1),
+            strengths=[],
+            areas_for_improvement=[]
+        )
+    return verdicts
+
+
+def record(session_id: int, transcript):
+    """Play a transcript into a new live session and return its state."""
+    state = session_manager.create_session(session_id, user_id=session_id, domains=DOMAINS, persona="neutral")
+    for entry in transcript:
+        if entry.get("question_id"):
+            state.pending_question_id = entry["question_id"]
+        session_manager.add_transcript_entry(session_id, entry["role"], entry["content"])
+    return state
+
+
+def record_and_end(session_id: int, transcript):
+    state = record(session_id, transcript)
+    session_manager.end_session(session_id)
+    return state
+
+
+def measure_stage(fn, rounds: int, warmup: int) -> dict:
+    """
+    Median/min wall time over rounds, then one traced run for memory.
+
+    allocs is the number of memory blocks the stage leaves allocated
+    (its result included); peak is the most memory it had live at once.
+    """
+    for _ in range(warmup):
+        fn()
+    samples = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+
+    tracemalloc.start()
+    blocks_before = sys.getallocatedblocks()
+    current_before, _ = tracemalloc.get_traced_memory()
+    tracemalloc.reset_peak()
+    result = fn()
+    _, peak = tracemalloc.get_traced_memory()
+    allocs = sys.getallocatedblocks() - blocks_before
+    tracemalloc.stop()
+    del result
+
+    return {
+        "wall_ms": statistics.median(samples),
+        "min_ms": min(samples),
+        "stdev_ms": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        "allocs": allocs,
+        "peak_kib": (peak - current_before) / 1024,
+    }
+
+
+def run_suite(rounds: int, warmup: int):
+    corpus = golden_corpus()
+    results = {}
+    for turns, transcript in corpus.items():
+        # The live session the end-of-session stages read
+        session_id = turns
+        state = record(session_id, transcript)
+        verdicts = synthetic_verdicts(state.exchanges.exchanges)
+
+        def evaluate():
+            # No exchange folded yet: every run judges the whole session
+            session_state = dict(vars(state), evaluation=None)
+            return evaluation_service.evaluate_session(
+                session_id, state.transcript, [], DOMAINS, "interview_ready", session_state, verdicts
+            )
+
+        evaluation = evaluate()
+        summary = session_manager.get_transcript_summary(session_id)
+        stages = {
+            "record": lambda: record_and_end(10_000 + turns, transcript),
+            "summary": lambda: session_manager.get_transcript_summary(session_id),
+            "evaluate": evaluate,
+            "report": lambda: feedback_generator.generate_report(
+                evaluation, persona="neutral", depth_mode="interview_ready",
+                declared_weak_areas=[], transcript_summary=summary, resume_provided=False
+            ),
+        }
+        for stage, fn in stages.items():
+            results[f"{stage}/{turns}"] = measure_stage(fn, rounds, warmup)
+        session_manager.end_session(session_id)
+    return corpus, results
+
+
+def compare(results, baseline, threshold: float):
+    """Rows of (case, metric, baseline, current, change) that regressed."""
+    regressions = []
+    for case, current in results.items():
+        base = baseline.get(case)
+        if base is None:
+            continue
+        for metric, floor in (("min_ms", NOISE_FLOOR_MS), ("peak_kib", NOISE_FLOOR_KIB)):
+            if current[metric] > base[metric] * (1 + threshold) and current[metric] - base[metric] > floor:
+                regressions.append((case, metric, base[metric], current[metric], current[metric] / base[metric] - 1))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rounds", type=int, default=15)
+    parser.add_argument("--warmup", type=int, default=2)
+    parser.add_argument("--threshold", type=float, default=0.25, help="Allowed relative growth before a regression")
+    parser.add_argument("--budget-ms", type=float, default=100.0, help="End-of-session latency budget per transcript")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument("--save-baseline", action="store_true", help="Record this run as the baseline")
+    args = parser.parse_args()
+
+    corpus, results = run_suite(args.rounds, args.warmup)
+    digest = corpus_digest(corpus)
+    baseline = json.loads(args.baseline.read_text()) if args.baseline.exists() else None
+    comparable = baseline is not None and baseline["corpus_digest"] == digest
+    base_cases = baseline["cases"] if comparable else {}
+
+    print(f"golden corpus {digest}: {', '.join(str(t) for t in corpus)} turns, "
+          f"median of {args.rounds} rounds")
+    print(f"{'case':<16} {'median ms':>10} {'min ms':>9} {'stdev':>8} {'allocs':>9} {'peak KiB':>10} {'vs base':>8}")
+    for case, r in results.items():
+        base = base_cases.get(case)
+        change = f"{r['min_ms'] / base['min_ms'] - 1:+7.0%}" if base and base["min_ms"] else "      -"
+        print(f"{case:<16} {r['wall_ms']:10.3f} {r['min_ms']:9.3f} {r['stdev_ms']:8.3f} "
+              f"{r['allocs']:9d} {r['peak_kib']:10.1f} {change:>8}")
+
+    failed = False
+    print()
+    for turns in corpus:
+        end_of_session = sum(results[f"{stage}/{turns}"]["wall_ms"] for stage in END_OF_SESSION_STAGES)
+        over = end_of_session > args.budget_ms
+        failed = failed or over
+        print(f"end of session, {turns:5d} turns: {end_of_session:8.2f} ms "
+              f"({'OVER' if over else 'within'} {args.budget_ms:.0f} ms budget)")
+
+    if args.save_baseline:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(json.dumps({
+            "corpus_digest": digest,
+            "machine": f"{platform.machine()} {platform.python_implementation()} {platform.python_version()}",
+            "cases": {
+                case: {
+                    "wall_ms": round(r["wall_ms"], 4), "min_ms": round(r["min_ms"], 4),
+                    "peak_kib": round(r["peak_kib"], 1), "allocs": r["allocs"]
+                }
+                for case, r in results.items()
+            },
+        }, indent=2) + "\n")
+        print(f"\nbaseline saved to {args.baseline}")
+    elif baseline is None:
+        print(f"\nno baseline at {args.baseline}; run with --save-baseline to record one")
+    elif not comparable:
+        print(f"\nbaseline corpus {baseline['corpus_digest']} differs from {digest}; "
+              "re-record it with --save-baseline")
+    else:
+        regressions = compare(results, base_cases, args.threshold)
+        for case, metric, before, after, change in regressions:
+            print(f"REGRESSION {case} {metric}: {before:.3f} -> {after:.3f} ({change:+.0%})")
+        if not regressions:
+            print(f"\nno regressions beyond {args.threshold:.0%} of {baseline['machine']} baseline")
+        failed = failed or bool(regressions)
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Population latency statistics: KLL sketches vs keeping every latency.
+
+Records N synthetic answer latencies across domain/difficulty/persona
+slices, split over several simulated workers that flush into a shared
+temporary database. Reports record and percentile-lookup cost, the items
+held in memory against N, and the percentile error of the merged view
+against exact percentiles of the raw data.
+
+Usage (from the backend directory):
+    python -m benchmarks.bench_latency_stats --latencies 1000000 --workers 4
+"""
+import argparse
+import os
+import time
+
+import numpy as np
+
+from benchmarks.utils import measure, print_row, use_temp_database
+
+DB_PATH = use_temp_database()
+
+from app.database import engine, init_db  # noqa: E402
+from app.services.latency_stats import LatencyStats  # noqa: E402
+from app.services.quantile_sketch import KLLSketch  # noqa: E402
+
+DOMAINS = ["coding", "system_design", "ml"]
+DIFFICULTIES = ["easy", "medium", "hard"]
+PERSONAS = ["friendly", "neutral", "aggressive", "faang", "startup"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--latencies", type=int, default=1000000)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--k", type=int, default=200)
+    parser.add_argument("--flushes", type=int, default=5)
+    args = parser.parse_args()
+
+    init_db()
+    rng = np.random.default_rng(0)
+    domains = rng.integers(len(DOMAINS), size=args.latencies)
+    difficulties = rng.integers(len(DIFFICULTIES), size=args.latencies)
+    personas = rng.integers(len(PERSONAS), size=args.latencies)
+    # Harder questions and tougher personas take longer to answer
+    latencies = rng.lognormal(7.0 + 0.3 * difficulties + 0.1 * (personas == 3), 0.6)
+
+    workers = [LatencyStats(k=args.k, min_samples=50) for _ in range(args.workers)]
+    rows = list(zip(latencies.tolist(), domains.tolist(), difficulties.tolist(), personas.tolist()))
+    flush_every = max(1, len(rows) // args.flushes)
+    start = time.perf_counter()
+    for i, (latency, d, f, p) in enumerate(rows):
+        workers[i % args.workers].record(latency, DOMAINS[d], DIFFICULTIES[f], PERSONAS[p])
+        if (i + 1) % flush_every == 0:
+            for worker in workers:
+                worker.flush()
+    record_seconds = time.perf_counter() - start
+    for worker in workers:
+        worker.flush()
+    workers[0].flush()  # Pick up what the others wrote last
+
+    stats = workers[0]
+    held = sum(len(sketch) for sketch in stats._merged.values())
+    print(f"{args.latencies} latencies over {args.workers} workers, {len(stats._merged)} slices, "
+          f"{held} sketch items held ({held * 8 / 1024:.0f} KiB) vs {args.latencies * 8 / 1024:.0f} KiB raw")
+    print(f"{'record (incl. periodic flushes)':<40} {record_seconds / args.latencies * 1e6:10.3f} us per latency")
+
+    # Accuracy of the merged view for every full slice
+    errors = []
+    for d, domain in enumerate(DOMAINS):
+        for f, difficulty in enumerate(DIFFICULTIES):
+            for p, persona in enumerate(PERSONAS):
+                exact = np.sort(latencies[(domains == d) & (difficulties == f) & (personas == p)])
+                for q in (0.05, 0.25, 0.5, 0.75, 0.95):
+                    value = exact[int(q * (len(exact) - 1))]
+                    errors.append(abs(stats.percentile(value, domain, difficulty, persona) - q))
+    print(f"{'merged percentile error':<40} max {max(errors):.4f}   mean {np.mean(errors):.4f}")
+
+    sample = float(np.median(latencies))
+    print_row("percentile lookup (sketch)", measure(
+        lambda: stats.percentile(sample, "coding", "hard", "faang"), repeat=2000))
+    raw = latencies[(domains == 0) & (difficulties == 2) & (personas == 3)]
+    print_row("percentile lookup (raw, unsorted)", measure(lambda: float(np.mean(raw <= sample)), repeat=200))
+    sketch = KLLSketch(args.k)
+    print_row("sketch update", measure(lambda: sketch.update(sample), repeat=20000))
+
+    engine.dispose()
+    os.remove(DB_PATH)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+Response-time benchmark for GET /v1/sessions.
+
+Seeds one user with many sessions carrying realistic resume, transcript and
+report text, then compares the old full-row listing against the keyset
+paginated, column-projected endpoint.
+
+Usage (from the backend directory):
+    python -m benchmarks.bench_list_sessions --sessions 10000
+"""
+import argparse
+import os
+from datetime import datetime, timedelta
+
+from benchmarks.utils import use_temp_database, measure, print_row
+
+DB_PATH = use_temp_database()
+
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlalchemy.orm import joinedload  # noqa: E402
+
+from app.database import SessionLocal, engine, init_db  # noqa: E402
+from app.dependencies import get_current_user  # noqa: E402
+from app.main import app  # noqa: E402
+from app.models.session import InterviewSession  # noqa: E402
+from app.models.user import User  # noqa: E402
+from app.schemas import SessionResponse  # noqa: E402
+
+
+def seed(num_sessions: int, text_kb: int) -> int:
+    """Create a user with num_sessions sessions and return the user id."""
+    init_db()
+    blob = "x" * (text_kb * 1024)
+    db = SessionLocal()
+    try:
+        user = User(email="bench@example.com", password_hash="-", full_name="Bench")
+        db.add(user)
+        db.commit()
+
+        base = datetime(2024, 1, 1)
+        sessions = [
+            InterviewSession(
+                user_id=user.id,
+                persona="neutral",
+                depth_mode="interview_ready",
+                domains=["coding", "ml"],
+                declared_weak_areas=["dynamic programming"],
+                status="completed",
+                started_at=base + timedelta(minutes=i),
+                ended_at=base + timedelta(minutes=i + 45),
+                resume_text=blob,
+                transcript_summary=blob,
+                feedback_report=blob,
+            )
+            for i in range(num_sessions)
+        ]
+        db.add_all(sessions)
+        db.commit()
+        return user.id
+    finally:
+        db.close()
+
+
+def legacy_list(user_id: int):
+    """The original implementation: load full rows, then serialize."""
+    db = SessionLocal()
+    try:
+        sessions = db.query(InterviewSession).options(
+            joinedload(InterviewSession.content)
+        ).filter(
+            InterviewSession.user_id == user_id
+        ).order_by(InterviewSession.started_at.desc()).all()
+        return [SessionResponse.model_validate(s) for s in sessions]
+    finally:
+        db.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sessions", type=int, default=10_000)
+    parser.add_argument("--text-kb", type=int, default=2, help="Size of each large text column")
+    parser.add_argument("--limit", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    user_id = seed(args.sessions, args.text_kb)
+    db = SessionLocal()
+    user = db.get(User, user_id)
+    db.expunge(user)
+    db.close()
+    app.dependency_overrides[get_current_user] = lambda: user
+    client = TestClient(app)
+
+    # Find a cursor deep in the listing to show that later pages stay flat
+    cursor = None
+    for _ in range(min(50, args.sessions // args.limit - 1)):
+        cursor = client.get("/v1/sessions", params={"limit": args.limit, "cursor": cursor}).headers.get("X-Next-Cursor")
+
+    print(f"{args.sessions} sessions, {args.text_kb} KB per text column, page size {args.limit}")
+    print_row("legacy: full rows, all sessions", measure(lambda: legacy_list(user_id), repeat=max(3, args.repeat // 5)))
+    print_row("GET /v1/sessions first page", measure(
+        lambda: client.get("/v1/sessions", params={"limit": args.limit}), repeat=args.repeat))
+    if cursor:
+        print_row("GET /v1/sessions deep page", measure(
+            lambda: client.get("/v1/sessions", params={"limit": args.limit, "cursor": cursor}), repeat=args.repeat))
+
+    engine.dispose()
+    os.remove(DB_PATH)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Throughput and tail-latency benchmark for the LLM judge pipeline.
+
+Starts the local stand-in judge (benchmarks/judge_server.py) on a free port
+and evaluates N answers to bank questions through the real HTTP transport:
+one at a time (what awaiting each evaluate_answer in turn costs) and then
+fanned out at several concurrency limits. The stand-in injects 503s and
+malformed verdicts, so retries show up in attempts and tail latency.
+
+Usage (from the backend directory):
+    python -m benchmarks.bench_llm_judge --evaluations 60 --latency-ms 400
+"""
+import argparse
+import asyncio
+import random
+import time
+
+from benchmarks.judge_server import BackgroundServer, create_app
+from app.services.llm_judge import ChatCompletionsTransport, JudgeRequest, LLMJudge
+from app.services.question_bank import DOMAINS, question_bank
+
+
+def judge_requests(count: int, rng: random.Random):
+    questions = [q for domain in DOMAINS for q in question_bank.questions(domain)]
+    return [
+        JudgeRequest(
+            key=i,
+            question=q["question"],
+            answer="I would start by clarifying the constraints and the access pattern. " * rng.randrange(1, 12),
+            rubric=q.get("rubric") or {}
+        )
+        for i, q in enumerate(rng.choices(questions, k=count))
+    ]
+
+
+async def run(base_url: str, requests, concurrency: int, args):
+    judge = LLMJudge(
+        transport=ChatCompletionsTransport(base_url=base_url, max_connections=concurrency),
+        max_concurrency=concurrency,
+        requests_per_second=args.rps,
+        burst=max(1, concurrency),
+        timeout_seconds=args.timeout,
+        max_attempts=args.attempts,
+        backoff_seconds=args.backoff
+    )
+    start = time.perf_counter()
+    results = await judge.evaluate_many(requests)
+    wall = time.perf_counter() - start
+    await judge.aclose()
+    return wall, results
+
+
+def report(label: str, wall: float, results):
+    latencies = sorted(r.latency_ms for r in results)
+    pct = lambda p: latencies[min(len(latencies) - 1, int(len(latencies) * p))]
+    failed = sum(r.verdict is None for r in results)
+    attempts = sum(r.attempts for r in results)
+    print(f"{label:<24} wall {wall:7.2f} s   {len(results) / wall:7.1f} eval/s   "
+          f"p50 {pct(0.5):7.0f} ms   p95 {pct(0.95):7.0f} ms   p99 {pct(0.99):7.0f} ms   "
+          f"attempts {attempts:4d}   failed {failed}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--evaluations", type=int, default=60)
+    parser.add_argument("--latency-ms", type=float, default=400.0)
+    parser.add_argument("--error-rate", type=float, default=0.03)
+    parser.add_argument("--malformed-rate", type=float, default=0.02)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[4, 8, 16, 32])
+    parser.add_argument("--rps", type=float, default=0.0, help="Token-bucket rate (0: unlimited)")
+    parser.add_argument("--timeout", type=float, default=5.0)
+    parser.add_argument("--attempts", type=int, default=3)
+    parser.add_argument("--backoff", type=float, default=0.1)
+    parser.add_argument("--skip-sequential", action="store_true")
+    args = parser.parse_args()
+
+    requests = judge_requests(args.evaluations, random.Random(0))
+    app = create_app(args.latency_ms, error_rate=args.error_rate, malformed_rate=args.malformed_rate)
+    with BackgroundServer(app) as base_url:
+        print(f"{args.evaluations} evaluations against stand-in judge at {base_url} "
+              f"(median {args.latency_ms:.0f} ms, {args.error_rate:.0%} 503s, "
+              f"{args.malformed_rate:.0%} malformed)")
+        if not args.skip_sequential:
+            report("sequential", *asyncio.run(run(base_url, requests, 1, args)))
+        for concurrency in args.concurrency:
+            report(f"pipeline, concurrency {concurrency}", *asyncio.run(run(base_url, requests, concurrency, args)))
+        print(f"stand-in calls: {app.state.stats}")
+
+
+if __name__ == "__main__":
+    main()
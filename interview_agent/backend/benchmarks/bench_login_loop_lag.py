@@ -0,0 +1,100 @@
+"""
+Event-loop lag benchmark for concurrent logins.
+
+Fires N concurrent POST /v1/auth/login requests through the ASGI app while a
+ticker task measures how late the event loop wakes it up. Compares bcrypt
+running inline on the loop (the old behaviour) with the bounded hashing pool,
+and shows admission control shedding load with 503s.
+
+Usage (from the backend directory):
+    python -m benchmarks.bench_login_loop_lag --logins 50
+"""
+import argparse
+import asyncio
+import os
+import time
+
+from benchmarks.utils import use_temp_database
+
+DB_PATH = use_temp_database()
+
+import httpx  # noqa: E402
+
+from app.database import SessionLocal, engine, init_db  # noqa: E402
+from app.main import app  # noqa: E402
+from app.models.user import User  # noqa: E402
+from app.services import auth  # noqa: E402
+
+TICK_SECONDS = 0.005
+PASSWORD = "correct horse battery staple"
+
+
+async def inline_verify_and_update(plain_password, hashed_password):
+    """Old behaviour: bcrypt runs directly on the event loop."""
+    return auth.pwd_context.verify_and_update(plain_password, hashed_password)
+
+
+async def measure_lag(num_logins: int):
+    """Run concurrent logins and return (max lag ms, mean lag ms, status counts)."""
+    lags = []
+    done = asyncio.Event()
+
+    async def ticker():
+        while not done.is_set():
+            start = time.perf_counter()
+            await asyncio.sleep(TICK_SECONDS)
+            lags.append((time.perf_counter() - start - TICK_SECONDS) * 1000)
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        tick_task = asyncio.create_task(ticker())
+        await asyncio.sleep(TICK_SECONDS * 4)
+        responses = await asyncio.gather(*[
+            client.post("/v1/auth/login", json={"email": f"user{i}@example.com", "password": PASSWORD})
+            for i in range(num_logins)
+        ])
+        done.set()
+        await tick_task
+
+    statuses = {}
+    for response in responses:
+        statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+    return max(lags), sum(lags) / len(lags), statuses
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--logins", type=int, default=50)
+    args = parser.parse_args()
+
+    init_db()
+    password_hash = auth.hash_password(PASSWORD)
+    db = SessionLocal()
+    db.add_all(User(email=f"user{i}@example.com", password_hash=password_hash) for i in range(args.logins))
+    db.commit()
+    db.close()
+
+    hasher = auth.password_hasher
+    print(f"{args.logins} concurrent logins, bcrypt cost {auth.settings.bcrypt_rounds}, "
+          f"{hasher._executor._max_workers} hashing threads")
+
+    pooled = hasher.verify_and_update
+    hasher.verify_and_update = inline_verify_and_update
+    max_lag, mean_lag, statuses = asyncio.run(measure_lag(args.logins))
+    print(f"{'inline bcrypt':<32} max lag {max_lag:8.1f} ms   mean lag {mean_lag:7.1f} ms   {statuses}")
+
+    hasher.verify_and_update = pooled
+    max_lag, mean_lag, statuses = asyncio.run(measure_lag(args.logins))
+    print(f"{'hashing pool':<32} max lag {max_lag:8.1f} ms   mean lag {mean_lag:7.1f} ms   {statuses}")
+
+    hasher.max_pending = max(1, args.logins // 4)
+    max_lag, mean_lag, statuses = asyncio.run(measure_lag(args.logins))
+    label = f"hashing pool, max_pending={hasher.max_pending}"
+    print(f"{label:<32} max lag {max_lag:8.1f} ms   mean lag {mean_lag:7.1f} ms   {statuses}")
+
+    engine.dispose()
+    os.remove(DB_PATH)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""
+Micro-benchmark for question bank lookups.
+
+Compares the indexed in-memory QuestionBank against the previous
+implementation, which re-read and linearly scanned the JSON files on every
+call. Optionally inflates the bank with synthetic copies of the curated
+questions.
+
+Usage (from the backend directory):
+    python -m benchmarks.bench_question_bank --questions 5000
+"""
+import argparse
+import json
+import random
+import shutil
+import tempfile
+from pathlib import Path
+from typing import List, Optional
+
+from benchmarks.utils import measure, print_row
+from app.services.question_bank import DOMAINS, QUESTIONS_DIR, QuestionBank
+
+
+def build_bank(target_dir: Path, questions_per_domain: int):
+    """Write question files with questions_per_domain entries per domain."""
+    for domain in DOMAINS:
+        with open(QUESTIONS_DIR / f"{domain}.json") as f:
+            seed = json.load(f)
+        questions = []
+        for i in range(max(questions_per_domain, len(seed))):
+            q = dict(seed[i % len(seed)])
+            if i >= len(seed):
+                q["id"] = f"{q['id']}_{i}"
+            questions.append(q)
+        with open(target_dir / f"{domain}.json", "w") as f:
+            json.dump(questions, f)
+
+
+# Previous implementation, kept here for comparison
+def legacy_load_questions(questions_dir: Path, domain: str) -> List[dict]:
+    with open(questions_dir / f"{domain}.json", "r") as f:
+        return json.load(f)
+
+
+def legacy_get_question(questions_dir: Path, domain: str, topic=None, subtopic=None,
+                        difficulty=None, exclude_ids=None) -> Optional[dict]:
+    exclude_ids = exclude_ids or []
+    candidates = []
+    for q in legacy_load_questions(questions_dir, domain):
+        if q.get("id") in exclude_ids:
+            continue
+        if topic and q.get("topic") != topic:
+            continue
+        if subtopic and q.get("subtopic") != subtopic:
+            continue
+        if difficulty and q.get("difficulty") != difficulty:
+            continue
+        candidates.append(q)
+    return random.choice(candidates) if candidates else None
+
+
+def legacy_get_rubric(questions_dir: Path, question_id: str):
+    for domain in DOMAINS:
+        for q in legacy_load_questions(questions_dir, domain):
+            if q.get("id") == question_id:
+                return q.get("rubric")
+    return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--questions", type=int, default=1000, help="Questions per domain")
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    bank_dir = Path(tempfile.mkdtemp(prefix="question_bank_"))
+    try:
+        build_bank(bank_dir, args.questions)
+        bank = QuestionBank(bank_dir)
+        bank.reload()
+
+        last_ml_id = bank.questions("ml")[-1]["id"]
+        exclude = [q["id"] for q in bank.questions("coding")[:20]]
+        topic, difficulty = bank.questions("coding")[0]["topic"], bank.questions("coding")[0]["difficulty"]
+
+        def indexed_get_question():
+            excluded = set(exclude)
+            candidates = [q for q in bank.candidates("coding", topic=topic, difficulty=difficulty)
+                          if q["id"] not in excluded]
+            return random.choice(candidates) if candidates else None
+        rounds = args.repeat
+
+        print(f"{args.questions} questions per domain, {len(DOMAINS)} domains")
+        print_row("legacy get_question", measure(
+            lambda: legacy_get_question(bank_dir, "coding", topic=topic,
+                                        difficulty=difficulty, exclude_ids=exclude), rounds))
+        print_row("indexed get_question", measure(indexed_get_question, rounds))
+        print_row("legacy get_rubric (last ml id)", measure(
+            lambda: legacy_get_rubric(bank_dir, last_ml_id), rounds))
+        print_row("QuestionBank.get (last ml id)", measure(
+            lambda: bank.get(last_ml_id)["rubric"], rounds))
+        print_row("QuestionBank.reload", measure(bank.reload, max(3, rounds // 10)))
+    finally:
+        shutil.rmtree(bank_dir)
+
+
+if __name__ == "__main__":
+    main()
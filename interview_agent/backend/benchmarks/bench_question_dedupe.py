@@ -0,0 +1,67 @@
+"""
+Scaling benchmark for near-duplicate detection in the bank build.
+
+Generates synthetic questions from a shared vocabulary and plants one-word
+edits of random originals, then times find_near_duplicates at each size
+and reports how many planted pairs were clustered together.
+
+Usage (from the backend directory):
+    python -m benchmarks.bench_question_dedupe --sizes 10000 100000 --planted 500
+"""
+import argparse
+import random
+import time
+
+from app.services.question_dedupe import find_near_duplicates
+
+WORDS = (
+    "array graph tree node cache latency shard replica model gradient loss token queue "
+    "stream index hash heap sort search window partition consensus embedding batch"
+).split()
+
+
+def synthetic_bank(count: int, planted: int, rng: random.Random):
+    questions = [
+        {
+            "id": f"q_{i}",
+            "question": " ".join(f"{rng.choice(WORDS)}{rng.randrange(1000)}" for _ in range(30)),
+            "follow_ups": ["What are the tradeoffs?", "How would you test it?"],
+        }
+        for i in range(count)
+    ]
+    pairs = []
+    for j in range(planted):
+        original = questions[rng.randrange(count)]
+        words = original["question"].split()
+        words[rng.randrange(len(words))] = "edited"
+        duplicate = dict(original, id=f"dup_{j}", question=" ".join(words))
+        questions.append(duplicate)
+        pairs.append((original["id"], duplicate["id"]))
+    return questions, pairs
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000])
+    parser.add_argument("--planted", type=int, default=500)
+    parser.add_argument("--threshold", type=float, default=0.7)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    for size in args.sizes:
+        questions, pairs = synthetic_bank(size, args.planted, rng)
+        start = time.perf_counter()
+        clusters = find_near_duplicates(questions, threshold=args.threshold)
+        elapsed = time.perf_counter() - start
+
+        cluster_of = {qid: n for n, cluster in enumerate(clusters) for qid, _ in cluster}
+        found = sum(
+            1 for original, duplicate in pairs
+            if original in cluster_of and cluster_of.get(original) == cluster_of.get(duplicate)
+        )
+        print(f"{len(questions):>8} questions: {elapsed:8.2f} s, {len(clusters)} clusters, "
+              f"planted pairs found {found}/{len(pairs)}")
+
+
+if __name__ == "__main__":
+    main()
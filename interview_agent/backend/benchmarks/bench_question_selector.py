@@ -0,0 +1,84 @@
+"""
+Latency benchmark for adaptive next-question selection.
+
+Simulates a session that asks a question, updates the topic's weak signal
+and marks it covered, over a bank inflated to --questions per domain.
+Compares QuestionSelector against filtering candidates and excluding
+already-asked ids on every call, the way get_question is used without it.
+
+Usage (from the backend directory):
+    python -m benchmarks.bench_question_selector --questions 20000 --turns 200
+"""
+import argparse
+import random
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.bench_question_bank import build_bank
+from benchmarks.utils import print_row
+from app.services.question_bank import QuestionBank
+from app.services.question_selector import QuestionSelector
+
+
+def run_turns(next_question, on_answer, turns: int):
+    samples = []
+    for _ in range(turns):
+        start = time.perf_counter()
+        question = next_question()
+        samples.append((time.perf_counter() - start) * 1000)
+        if question is None:
+            break
+        on_answer(question)
+    samples.sort()
+    return {
+        "mean_ms": sum(samples) / len(samples),
+        "p50_ms": samples[len(samples) // 2],
+        "p95_ms": samples[min(len(samples) - 1, int(len(samples) * 0.95))],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--questions", type=int, default=20000, help="Questions per domain")
+    parser.add_argument("--turns", type=int, default=200)
+    args = parser.parse_args()
+
+    bank_dir = Path(tempfile.mkdtemp(prefix="question_selector_"))
+    try:
+        build_bank(bank_dir, args.questions)
+        bank = QuestionBank(questions_dir=bank_dir, index_dir=bank_dir / "index")
+        domains = ["coding", "ml"]
+        bank.buckets("coding")
+        bank.buckets("ml")
+        rng = random.Random(0)
+
+        start = time.perf_counter()
+        selector = QuestionSelector(domains, ["dynamic programming"], bank=bank, seed=0)
+        print(f"{'selector setup':<40} {(time.perf_counter() - start) * 1000:10.4f} ms")
+
+        def answer(question):
+            selector.update_weak_signal(question["topic"], rng.random())
+            selector.mark_topic_covered(question["topic"])
+
+        print_row("next question: QuestionSelector", run_turns(selector.next_question, answer, args.turns))
+
+        asked = []
+
+        def filter_and_exclude():
+            excluded = set(asked)
+            candidates = [
+                q for domain in domains for q in bank.candidates(domain)
+                if q.get("id") not in excluded
+            ]
+            return rng.choice(candidates) if candidates else None
+
+        print_row("next question: filter + exclude", run_turns(
+            filter_and_exclude, lambda q: asked.append(q["id"]), args.turns))
+    finally:
+        shutil.rmtree(bank_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
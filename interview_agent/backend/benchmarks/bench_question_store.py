@@ -0,0 +1,119 @@
+"""
+Cold-start benchmark for the compiled question-bank format.
+
+Writes synthetic banks at each size as JSON and as a compiled .qbank file,
+then compares json.load against opening the memory-mapped store: load time,
+time to the first served question, and resident memory after loading
+(measured in a fresh interpreter per method so allocations don't overlap).
+
+Usage (from the backend directory):
+    python -m benchmarks.bench_question_store --sizes 10000 100000 1000000
+"""
+import argparse
+import json
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+from benchmarks.utils import measure, print_row
+from app.services.question_store import CompiledQuestionStore, compile_question_bank, source_hash
+
+TOPICS = ["arrays", "graphs", "dynamic_programming", "trees", "strings", "heaps", "sorting", "hashing"]
+DIFFICULTIES = ["easy", "medium", "hard"]
+
+# Run in a child interpreter: load with the given method and report RSS in MB
+RSS_PROBE = """
+import json, sys
+from pathlib import Path
+
+def rss_mb():
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1]) * 4096 / 2**20
+
+from app.services.question_store import CompiledQuestionStore
+method, path = sys.argv[1], Path(sys.argv[2])
+before = rss_mb()
+if method == "json":
+    with open(path) as f:
+        bank = json.load(f)
+    first = bank[len(bank) // 2]["question"]
+else:
+    store = CompiledQuestionStore(path)
+    first = store.payload(store.find(f"q_{len(store) // 2}"))["question"]
+print(rss_mb() - before)
+"""
+
+
+def synthetic_bank(count: int, rng: random.Random) -> list:
+    return [
+        {
+            "id": f"q_{i}",
+            "topic": rng.choice(TOPICS),
+            "subtopic": f"sub_{rng.randrange(40)}",
+            "difficulty": rng.choice(DIFFICULTIES),
+            "question": f"Question {i}: explain how you would approach problem variant {rng.randrange(10**6)}.",
+            "follow_ups": [f"What is the complexity of variant {i}?", "How would you test it?"],
+            "rubric": {"correctness": "Finds a working approach", "communication": "Explains clearly"},
+        }
+        for i in range(count)
+    ]
+
+
+def rss_after_load(method: str, path: Path) -> float:
+    result = subprocess.run(
+        [sys.executable, "-c", RSS_PROBE, method, str(path)],
+        capture_output=True, text=True, check=True, cwd=Path(__file__).parent.parent
+    )
+    return float(result.stdout.strip())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000, 1000000])
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    work_dir = Path(tempfile.mkdtemp(prefix="question_store_"))
+    try:
+        for size in args.sizes:
+            questions = synthetic_bank(size, rng)
+            json_path = work_dir / "bank.json"
+            qbank_path = work_dir / "bank.qbank"
+            with open(json_path, "w") as f:
+                json.dump(questions, f)
+            compile_question_bank(questions, qbank_path, source_hash([json_path]))
+            del questions
+
+            print(f"\n{size} questions: JSON {json_path.stat().st_size / 2**20:.1f} MB, "
+                  f"compiled {qbank_path.stat().st_size / 2**20:.1f} MB")
+
+            def load_json():
+                with open(json_path) as f:
+                    return json.load(f)
+
+            target = f"q_{size // 2}"
+            repeat = max(3, args.repeat // (1 + size // 100000))
+            print_row("  load: json.load", measure(load_json, repeat, warmup=1))
+            print_row("  load: CompiledQuestionStore (mmap)", measure(
+                lambda: CompiledQuestionStore(qbank_path), args.repeat))
+            print_row("  load + source hash check", measure(
+                lambda: CompiledQuestionStore.open_if_current(qbank_path, source_hash([json_path])), repeat))
+
+            store = CompiledQuestionStore(qbank_path)
+            print_row("  lookup by id + payload decode", measure(
+                lambda: store.payload(store.find(target)), args.repeat * 10))
+            print_row("  filter topic+difficulty (columns)", measure(
+                lambda: store.filter(topic="graphs", difficulty="hard"), args.repeat))
+
+            print(f"{'  RSS after load: json.load':<40} {rss_after_load('json', json_path):10.1f} MB")
+            print(f"{'  RSS after load: compiled':<40} {rss_after_load('compiled', qbank_path):10.1f} MB")
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+"""
+End-session latency with background report jobs vs. inline generation.
+
+Plays --sessions synthetic sessions into the session manager against the
+local stand-in judge (without pacing, so the exchange still open and any
+judging in flight are left for the end). Then ends them two ways and
+reports what the request waits for:
+
+- inline: finalize the evaluation, render the report and write scores,
+  report and skills before responding (the previous end_session)
+- queued: store the transcripts and enqueue a report job, then respond;
+  the time until workers have written every report is reported too
+
+Usage (from the backend directory):
+    python -m benchmarks.bench_report_jobs --sessions 50 --turns 60 --workers 2
+"""
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import time
+from dataclasses import asdict
+from datetime import datetime
+
+from benchmarks.utils import use_temp_database
+
+DB_PATH = use_temp_database()
+
+from benchmarks.bench_turn_segmenter import synthetic_transcript  # noqa: E402
+from benchmarks.judge_server import BackgroundServer, create_app  # noqa: E402
+from app.database import SessionLocal, engine, init_db  # noqa: E402
+from app.models.report import ReportJob  # noqa: E402
+from app.models.session import InterviewSession  # noqa: E402
+from app.models.user import User  # noqa: E402
+from app.services.evaluation import evaluation_service  # noqa: E402
+from app.services.feedback import feedback_generator  # noqa: E402
+from app.services.llm_judge import ChatCompletionsTransport, LLMJudge  # noqa: E402
+from app.services.question_bank import DOMAINS  # noqa: E402
+from app.services.report_jobs import ReportJobQueue  # noqa: E402
+from app.services.session_manager import session_manager  # noqa: E402
+from app.services.skill_profile import upsert_skill_scores  # noqa: E402
+
+
+def start_sessions(db, user_id: int, count: int, turns: int, rng: random.Random):
+    """Create count active sessions and play a transcript into each."""
+    sessions = []
+    for _ in range(count):
+        session = InterviewSession(user_id=user_id, persona="neutral", depth_mode="interview_ready", domains=DOMAINS)
+        db.add(session)
+        db.commit()
+        state = session_manager.create_session(session.id, user_id, domains=DOMAINS, persona="neutral")
+        for entry in synthetic_transcript(turns, rng):
+            if entry.get("question_id"):
+                state.pending_question_id = entry["question_id"]
+            session_manager.add_transcript_entry(session.id, entry["role"], entry["content"])
+        sessions.append(session)
+    return sessions
+
+
+async def end_inline(db, session) -> float:
+    start = time.perf_counter()
+    session.status = "terminated"
+    session.ended_at = datetime.utcnow()
+    transcript_summary = session_manager.get_transcript_summary(session.id)
+    state = session_manager.end_session(session.id)
+    evaluation = await session_manager.finalize_evaluation(state, [], session.domains, session.depth_mode)
+    session.scores = asdict(evaluation)
+    session.transcript_summary = transcript_summary
+    session.feedback_report = feedback_generator.generate_report(
+        evaluation, persona=session.persona, depth_mode=session.depth_mode,
+        declared_weak_areas=[], transcript_summary=transcript_summary, resume_provided=False
+    )
+    upsert_skill_scores(db, session.user_id, evaluation)
+    db.commit()
+    return (time.perf_counter() - start) * 1000
+
+
+def end_queued(db, queue: ReportJobQueue, session) -> float:
+    start = time.perf_counter()
+    session.status = "terminated"
+    session.ended_at = datetime.utcnow()
+    transcript = session_manager.get_transcript(session.id)
+    transcript_summary = session_manager.get_transcript_summary(session.id)
+    state = session_manager.end_session(session.id)
+    session.transcript = transcript
+    session.transcript_summary = transcript_summary
+    queue.enqueue(db, session.id, state)
+    db.commit()
+    queue.notify()
+    return (time.perf_counter() - start) * 1000
+
+
+async def run(args):
+    init_db()
+    rng = random.Random(0)
+    db = SessionLocal()
+    user = User(email="bench@example.com", password_hash="-")
+    db.add(user)
+    db.commit()
+
+    sessions = start_sessions(db, user.id, args.sessions, args.turns, rng)
+    inline_ms = [await end_inline(db, session) for session in sessions]
+
+    queue = ReportJobQueue(workers=args.workers, lease_seconds=300, max_attempts=3, poll_seconds=0.5)
+    queue.start()
+    sessions = start_sessions(db, user.id, args.sessions, args.turns, rng)
+    start = time.perf_counter()
+    queued_ms = []
+    for session in sessions:
+        queued_ms.append(end_queued(db, queue, session))
+        await asyncio.sleep(0)  # Let workers run between requests, as a server would
+    while db.query(ReportJob).filter(ReportJob.status.in_(("queued", "running"))).count():
+        await asyncio.sleep(0.01)
+    drained = time.perf_counter() - start
+    await queue.stop()
+    done = db.query(ReportJob).filter(ReportJob.status == "done").count()
+    db.close()
+
+    print(f"{args.sessions} sessions x {args.turns} turns, judge median {args.latency_ms:.0f} ms")
+    for label, samples in (("inline end_session", inline_ms), ("queued end_session", queued_ms)):
+        samples.sort()
+        print(f"{label:<24} p50 {statistics.median(samples):9.2f} ms   "
+              f"p95 {samples[min(len(samples) - 1, int(len(samples) * 0.95))]:9.2f} ms")
+    print(f"{'all reports written':<24} {drained * 1000:9.0f} ms with {args.workers} workers "
+          f"({done}/{args.sessions} done)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sessions", type=int, default=50)
+    parser.add_argument("--turns", type=int, default=60)
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--latency-ms", type=float, default=200.0, help="Stand-in judge median latency")
+    args = parser.parse_args()
+
+    with BackgroundServer(create_app(args.latency_ms, error_rate=0.0, malformed_rate=0.0)) as base_url:
+        evaluation_service.judge = LLMJudge(
+            transport=ChatCompletionsTransport(base_url=base_url),
+            requests_per_second=0
+        )
+        asyncio.run(run(args))
+
+    engine.dispose()
+    os.remove(DB_PATH)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+Throughput of bulk re-scoring of historical sessions.
+
+Seeds a throwaway database with users and scored sessions whose stored
+transcripts cover bank questions, then re-scores them all against the
+local stand-in judge, in-process and on process pools of several sizes.
+The verdict cache is emptied before each run so every run judges the
+same answers.
+
+Usage (from the backend directory):
+    python -m benchmarks.bench_rescore_sessions --users 200 --sessions-per-user 10 --workers 0,2,4
+"""
+import argparse
+import os
+import random
+from datetime import datetime, timedelta
+
+from benchmarks.judge_server import BackgroundServer, create_app
+from benchmarks.utils import use_temp_database
+
+
+def seed(users: int, sessions_per_user: int, turns: int):
+    from benchmarks.bench_turn_segmenter import synthetic_transcript
+    from app.database import SessionLocal, init_db
+    from app.models.session import InterviewSession
+    from app.models.user import User
+    from app.services.question_bank import DOMAINS
+
+    init_db()
+    rng = random.Random(0)
+    placeholder = {
+        "session_id": 0, "domain_scores": [], "overall_score": 0.5,
+        "declared_vs_actual": {}, "depth_achieved": "interview_ready", "time_spent_minutes": 0.0
+    }
+    db = SessionLocal()
+    try:
+        for u in range(users):
+            user = User(email=f"bench{u}@example.com", password_hash="-")
+            db.add(user)
+            db.flush()
+            for s in range(sessions_per_user):
+                transcript = synthetic_transcript(turns, rng)
+                db.add(InterviewSession(
+                    user_id=user.id,
+                    persona="neutral",
+                    depth_mode="interview_ready",
+                    domains=DOMAINS,
+                    status="completed",
+                    started_at=datetime(2024, 1, 1) + timedelta(days=s),
+                    scores=placeholder,
+                    transcript=transcript,
+                    transcript_summary="\n\n".join(
+                        f"{'Candidate' if e['role'] == 'user' else 'Interviewer'}: {e['content']}" for e in transcript
+                    )
+                ))
+        db.commit()
+    finally:
+        db.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--users", type=int, default=200)
+    parser.add_argument("--sessions-per-user", type=int, default=10)
+    parser.add_argument("--turns", type=int, default=40, help="Transcript turns per session")
+    parser.add_argument("--workers", default="0,2,4", help="Comma-separated pool sizes (0 = in-process)")
+    parser.add_argument("--latency-ms", type=float, default=50.0, help="Stand-in judge median latency")
+    args = parser.parse_args()
+
+    # Spawned workers re-import this module, so the database and judge are
+    # configured here, through the environment they inherit, not at import
+    db_path = use_temp_database()
+    with BackgroundServer(create_app(args.latency_ms, error_rate=0.0, malformed_rate=0.0)) as base_url:
+        os.environ["JUDGE_BASE_URL"] = base_url
+        os.environ["JUDGE_REQUESTS_PER_SECOND"] = "0"  # The stand-in does not rate limit
+        from app.database import SessionLocal, engine
+        from app.models.judge import JudgeVerdictRecord
+        from app.services.rescoring import rescore_sessions
+        from app.services.verdict_cache import verdict_cache
+
+        seed(args.users, args.sessions_per_user, args.turns)
+        total = args.users * args.sessions_per_user
+        print(f"{args.users} users x {args.sessions_per_user} sessions ({args.turns} turns each), "
+              f"judge median {args.latency_ms:.0f} ms")
+
+        for workers in (int(w) for w in args.workers.split(",")):
+            db = SessionLocal()
+            db.query(JudgeVerdictRecord).delete()
+            db.commit()
+            db.close()
+            verdict_cache.clear()
+
+            progress = rescore_sessions(workers=workers, users_per_chunk=10)
+            label = f"{workers} workers" if workers else "in-process"
+            print(f"{label:<16} {progress.sessions:6d}/{total} sessions in {progress.elapsed_seconds:7.2f} s   "
+                  f"{progress.sessions_per_second:8.1f} sessions/s")
+
+    engine.dispose()
+    os.remove(db_path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+Score fusion benchmark: scalar per-topic arithmetic vs NumPy segments.
+
+Generates a history of sessions with ~100k topic rows in total, each with
+four signals of which some are missing, and fuses them into topic, domain
+and per-session overall scores: once with a Python loop over rows (the
+shape of the old per-domain arithmetic) and once with score_fusion's
+masked matrix product and segment reductions. Checks both agree.
+
+Usage (from the backend directory):
+    python -m benchmarks.bench_score_fusion --rows 100000
+"""
+import argparse
+
+import numpy as np
+
+from benchmarks.utils import measure, print_row
+from app.services.evaluation import EvaluationService
+from app.services.score_fusion import NEUTRAL_SCORE, SIGNALS, fuse_scores
+
+DOMAINS_PER_SESSION = 3
+TOPICS_PER_DOMAIN = 10
+
+
+def synthetic_history(rows: int, rng: np.random.Generator):
+    signals = rng.random((rows, len(SIGNALS)))
+    signals[rng.random(signals.shape) < 0.3] = np.nan
+    confidence = rng.random(rows)
+    topic_domains = np.arange(rows) // TOPICS_PER_DOMAIN
+    num_domains = int(topic_domains[-1]) + 1
+    domain_groups = np.arange(num_domains) // DOMAINS_PER_SESSION
+    return signals, confidence, topic_domains, num_domains, domain_groups, int(domain_groups[-1]) + 1
+
+
+def scalar_fusion(signals, confidence, topic_domains, num_domains, domain_groups, num_groups, weights):
+    """Row-at-a-time reference with the same semantics as fuse_scores."""
+    weight_list = [weights[name] for name in SIGNALS]
+    total_weight = sum(weight_list)
+    domain_sums = [0.0] * num_domains
+    domain_weights = [0.0] * num_domains
+    topic_scores = []
+    for row, values in enumerate(signals.tolist()):
+        weighted = present = 0.0
+        for value, weight in zip(values, weight_list):
+            if value == value:  # not NaN
+                weighted += value * weight
+                present += weight
+        score = weighted / present if present else NEUTRAL_SCORE
+        topic_confidence = confidence[row] * present / total_weight
+        topic_scores.append(score)
+        domain = topic_domains[row]
+        domain_sums[domain] += score * topic_confidence
+        domain_weights[domain] += topic_confidence
+
+    domain_scores = [s / w if w else NEUTRAL_SCORE for s, w in zip(domain_sums, domain_weights)]
+    group_sums = [0.0] * num_groups
+    group_counts = [0] * num_groups
+    for domain, score in enumerate(domain_scores):
+        group_sums[domain_groups[domain]] += score
+        group_counts[domain_groups[domain]] += 1
+    return topic_scores, domain_scores, [s / c for s, c in zip(group_sums, group_counts)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    history = synthetic_history(args.rows, np.random.default_rng(0))
+    signals, confidence, topic_domains, num_domains, domain_groups, num_groups = history
+    print(f"{args.rows} topic rows, {num_domains} domain scores, {num_groups} sessions")
+
+    weights = EvaluationService.WEIGHTS
+    vector = EvaluationService.WEIGHT_VECTOR
+    # The scalar loop reads plain Python values, as the old per-domain code did
+    scalar_args = (signals, confidence.tolist(), topic_domains.tolist(), num_domains,
+                   domain_groups.tolist(), num_groups, weights)
+
+    expected = scalar_fusion(*scalar_args)
+    fused = fuse_scores(signals, confidence, topic_domains, num_domains, vector, domain_groups, num_groups)
+    for name, got, want in zip(("topic", "domain", "overall"),
+                               (fused.topic_scores, fused.domain_scores, fused.overall_scores), expected):
+        assert np.allclose(got, want), f"{name} scores differ"
+
+    print_row("scalar Python loop", measure(lambda: scalar_fusion(*scalar_args), max(1, args.repeat // 5), 1))
+    print_row("numpy masked matmul + segments", measure(
+        lambda: fuse_scores(signals, confidence, topic_domains, num_domains, vector, domain_groups, num_groups),
+        args.repeat))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+End-of-session evaluation latency: batch vs incremental.
+
+Plays a synthetic session of N transcript turns through the session
+manager against the stand-in judge, pacing turns so judging can keep up as
+it would in a live interview. Then times what the candidate waits for at
+end_session: judging every exchange and evaluating from scratch (batch)
+against finalizing the running accumulators (incremental, which judges
+only the exchange still open).
+
+Usage (from the backend directory):
+    python -m benchmarks.bench_session_finalize --turns 120 --latency-ms 800
+"""
+import argparse
+import asyncio
+import random
+import time
+
+from benchmarks.bench_turn_segmenter import synthetic_transcript
+from benchmarks.judge_server import BackgroundServer, create_app
+from app.services.evaluation import evaluation_service
+from app.services.llm_judge import ChatCompletionsTransport, LLMJudge
+from app.services.session_manager import session_manager
+from app.services.question_bank import DOMAINS
+
+
+async def play_session(session_id: int, transcript, turn_seconds: float):
+    session_manager.create_session(session_id, user_id=session_id, domains=DOMAINS)
+    for entry in transcript:
+        state = session_manager.get_session(session_id)
+        if entry.get("question_id"):
+            state.pending_question_id = entry["question_id"]
+        session_manager.add_transcript_entry(session_id, entry["role"], entry["content"])
+        await asyncio.sleep(turn_seconds)
+    return session_manager.end_session(session_id)
+
+
+async def batch(state):
+    start = time.perf_counter()
+    verdicts = await evaluation_service.judge_exchanges(state.exchanges.exchanges)
+    evaluation_service.evaluate_session(
+        state.session_id, state.transcript, [], DOMAINS, "interview_ready",
+        {"exchanges": state.exchanges, "total_follow_ups": state.total_follow_ups}, verdicts
+    )
+    return (time.perf_counter() - start) * 1000
+
+
+async def incremental(state):
+    start = time.perf_counter()
+    await session_manager.finalize_evaluation(state, [], DOMAINS, "interview_ready")
+    return (time.perf_counter() - start) * 1000
+
+
+async def run(base_url: str, args):
+    evaluation_service.judge = LLMJudge(
+        transport=ChatCompletionsTransport(base_url=base_url),
+        max_concurrency=args.concurrency,
+        requests_per_second=0
+    )
+    transcript = synthetic_transcript(args.turns, random.Random(0))
+    batch_ms, incremental_ms = [], []
+    for session_id in range(1, args.sessions + 1):
+        state = await play_session(session_id, transcript, args.turn_ms / 1000)
+        batch_ms.append(await batch(state))
+        incremental_ms.append(await incremental(state))
+    await evaluation_service.judge.aclose()
+    return len(state.exchanges.exchanges), batch_ms, incremental_ms
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--turns", type=int, default=120)
+    parser.add_argument("--sessions", type=int, default=3)
+    parser.add_argument("--latency-ms", type=float, default=800.0)
+    parser.add_argument("--turn-ms", type=float, default=50.0, help="Pause between transcript turns")
+    parser.add_argument("--concurrency", type=int, default=8)
+    args = parser.parse_args()
+
+    with BackgroundServer(create_app(args.latency_ms)) as base_url:
+        exchanges, batch_ms, incremental_ms = asyncio.run(run(base_url, args))
+
+    print(f"{args.turns} turns -> {exchanges} exchanges, judge median {args.latency_ms:.0f} ms, "
+          f"concurrency {args.concurrency}")
+    for label, samples in (("batch evaluation at end_session", batch_ms),
+                           ("incremental finalize at end_session", incremental_ms)):
+        print(f"{label:<40} mean {sum(samples) / len(samples):10.1f} ms   max {max(samples):10.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
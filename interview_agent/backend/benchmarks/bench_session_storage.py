@@ -0,0 +1,138 @@
+"""
+DB-size and list-query benchmark for session content storage.
+
+Builds two SQLite databases with the same sessions: one with resume,
+transcript and report text inline in the sessions table (the old layout),
+and one with the text compressed into session_contents. Reports file size,
+an unindexed scan over sessions and the paginated listing query.
+
+Usage (from the backend directory):
+    python -m benchmarks.bench_session_storage --sessions 10000
+"""
+import argparse
+import os
+import random
+import tempfile
+from datetime import datetime, timedelta
+
+from benchmarks.utils import use_temp_database, measure, print_row
+
+DB_PATH = use_temp_database()
+
+from sqlalchemy import (  # noqa: E402
+    Column, DateTime, Index, Integer, JSON, MetaData, String, Table, Text, create_engine, func, select
+)
+
+from app.database import SessionLocal, engine, init_db  # noqa: E402
+from app.models.session import InterviewSession  # noqa: E402
+from app.models.user import User  # noqa: E402
+from app.routers.sessions import SESSION_LIST_COLUMNS  # noqa: E402
+
+WORDS = (
+    "candidate explained approach complexity tradeoff cache database shard replica "
+    "latency throughput gradient model training feature pipeline consistency queue "
+    "partition index query scaling availability interviewer follow up answer"
+).split()
+
+legacy_metadata = MetaData()
+legacy_sessions = Table(
+    "sessions", legacy_metadata,
+    Column("id", Integer, primary_key=True),
+    Column("user_id", Integer, nullable=False),
+    Column("persona", String),
+    Column("depth_mode", String),
+    Column("domains", JSON),
+    Column("resume_text", Text),
+    Column("declared_weak_areas", JSON),
+    Column("status", String),
+    Column("started_at", DateTime),
+    Column("ended_at", DateTime),
+    Column("transcript_summary", Text),
+    Column("feedback_report", Text),
+    Column("detected_weak_areas", JSON),
+    Column("scores", JSON),
+    Index("ix_sessions_user_started_id", "user_id", "started_at", "id"),
+)
+
+
+def prose(rng: random.Random, kb: int) -> str:
+    """Generate roughly kb kilobytes of word-salad text."""
+    words = []
+    size = 0
+    while size < kb * 1024:
+        word = rng.choice(WORDS)
+        words.append(word)
+        size += len(word) + 1
+    return " ".join(words)
+
+
+def make_rows(num_sessions: int, text_kb: int):
+    rng = random.Random(7)
+    base = datetime(2024, 1, 1)
+    for i in range(num_sessions):
+        yield {
+            "user_id": 1 + i % 20,
+            "persona": "neutral",
+            "depth_mode": "interview_ready",
+            "domains": ["coding"],
+            "declared_weak_areas": [],
+            "status": "completed" if i % 3 else "terminated",
+            "started_at": base + timedelta(minutes=i),
+            "ended_at": base + timedelta(minutes=i + 45),
+            "resume_text": prose(rng, text_kb),
+            "transcript_summary": prose(rng, text_kb * 4),
+            "feedback_report": prose(rng, text_kb * 2),
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sessions", type=int, default=10_000)
+    parser.add_argument("--text-kb", type=int, default=2)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    rows = list(make_rows(args.sessions, args.text_kb))
+
+    # Old layout: everything inline in sessions
+    fd, legacy_path = tempfile.mkstemp(suffix=".db")
+    os.close(fd)
+    legacy_engine = create_engine(f"sqlite:///{legacy_path}")
+    legacy_metadata.create_all(legacy_engine)
+    with legacy_engine.begin() as conn:
+        conn.execute(legacy_sessions.insert(), rows)
+
+    # New layout: text compressed into session_contents
+    init_db()
+    db = SessionLocal()
+    db.add_all(User(id=uid, email=f"u{uid}@example.com", password_hash="-") for uid in range(1, 21))
+    db.add_all(InterviewSession(**row) for row in rows)
+    db.commit()
+    db.close()
+
+    print(f"{args.sessions} sessions, ~{args.text_kb * 7} KB of text per session")
+    print(f"{'DB size, inline text':<40} {os.path.getsize(legacy_path) / 2**20:9.1f} MB")
+    print(f"{'DB size, compressed side table':<40} {os.path.getsize(DB_PATH) / 2**20:9.1f} MB")
+
+    scan_legacy = select(func.count()).select_from(legacy_sessions).where(legacy_sessions.c.status == "terminated")
+    scan_new = select(func.count()).select_from(InterviewSession).where(InterviewSession.status == "terminated")
+    list_columns = [legacy_sessions.c[c.key] for c in SESSION_LIST_COLUMNS]
+    list_legacy = select(*list_columns).where(legacy_sessions.c.user_id == 3).order_by(
+        legacy_sessions.c.started_at.desc(), legacy_sessions.c.id.desc()).limit(50)
+    list_new = select(*SESSION_LIST_COLUMNS).where(InterviewSession.user_id == 3).order_by(
+        InterviewSession.started_at.desc(), InterviewSession.id.desc()).limit(50)
+
+    with legacy_engine.connect() as legacy_conn, engine.connect() as conn:
+        print_row("status scan, inline text", measure(lambda: legacy_conn.execute(scan_legacy).all(), args.repeat))
+        print_row("status scan, side table", measure(lambda: conn.execute(scan_new).all(), args.repeat))
+        print_row("list page, inline text", measure(lambda: legacy_conn.execute(list_legacy).all(), args.repeat))
+        print_row("list page, side table", measure(lambda: conn.execute(list_new).all(), args.repeat))
+
+    legacy_engine.dispose()
+    engine.dispose()
+    os.remove(legacy_path)
+    os.remove(DB_PATH)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""
+Build and lookup benchmark for the skill coverage matrix.
+
+Inflates the bank to --questions per domain, then times building the
+skills x difficulty matrix and the O(1) bucket checks the selector makes,
+against scanning the domain's questions for a match.
+
+Usage (from the backend directory):
+    python -m benchmarks.bench_skill_coverage --questions 100000
+"""
+import argparse
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.bench_question_bank import build_bank
+from benchmarks.utils import measure, print_row
+from app.services.question_bank import QuestionBank
+from app.services.skill_coverage import SkillCoverage
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--questions", type=int, default=100000, help="Questions per domain")
+    parser.add_argument("--repeat", type=int, default=1000)
+    args = parser.parse_args()
+
+    bank_dir = Path(tempfile.mkdtemp(prefix="skill_coverage_"))
+    try:
+        build_bank(bank_dir, args.questions)
+        bank = QuestionBank(questions_dir=bank_dir, index_dir=bank_dir / "index")
+        questions = bank.questions("coding")
+
+        start = time.perf_counter()
+        coverage = SkillCoverage(questions)
+        print(f"{'build coverage (coding)':<40} {(time.perf_counter() - start) * 1000:10.4f} ms")
+
+        print_row("has_questions (matrix)", measure(
+            lambda: coverage.has_questions("coding", "recursion_backtracking", "hard"), args.repeat))
+        print_row("has_questions (scan)", measure(
+            lambda: any(
+                q.get("topic") == "recursion_backtracking" and q.get("difficulty") == "hard"
+                for q in questions
+            ), max(3, args.repeat // 100)))
+    finally:
+        shutil.rmtree(bank_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""
+Skill trend reads from the weekly rollups vs. aggregating raw observations.
+
+Seeds a throwaway database with one user's history (sessions spread over
+--weeks weeks, each scoring --skills skills) through upsert_skill_scores,
+which maintains the skill_observations log and the skill_trends rollups
+in the same transaction. Then times the trends read for a 12-week window
+both ways: from the rollups (skill_trends, one row per skill and week) and
+by scanning every observation and recomputing count, mean, EMA and last
+score per skill and week, as a rollup-less endpoint would. Also times a
+session's skill upsert, which now writes the observations and rollups.
+
+Usage (from the backend directory):
+    python -m benchmarks.bench_skill_trends --weeks 104 --sessions-per-week 5 --skills 40
+"""
+import argparse
+import os
+import random
+from datetime import datetime, timedelta
+
+from benchmarks.utils import use_temp_database, measure, print_row
+
+DB_PATH = use_temp_database()
+
+from app.database import SessionLocal, engine, init_db  # noqa: E402
+from app.models.skill import SkillObservation  # noqa: E402
+from app.models.user import User  # noqa: E402
+from app.services.evaluation import DomainScore, SessionEvaluation, TopicScore  # noqa: E402
+from app.services.skill_profile import (  # noqa: E402
+    TREND_EMA_ALPHA, skill_trends, upsert_skill_scores, week_start
+)
+
+WINDOW_WEEKS = 12
+
+
+def synthetic_evaluation(session_id: int, skills: int, rng: random.Random) -> SessionEvaluation:
+    topics = [TopicScore(f"topic{i}", None, rng.random(), 0.8, []) for i in range(skills)]
+    return SessionEvaluation(
+        session_id=session_id,
+        domain_scores=[DomainScore("coding", 0.5, topics, [], [])],
+        overall_score=0.5,
+        declared_vs_actual={},
+        depth_achieved="interview_ready",
+        time_spent_minutes=30.0
+    )
+
+
+def trends_from_observations(db, user_id: int, weeks: int, today):
+    """The same trends recomputed from the raw log (the EMA needs the full history)."""
+    cutoff = today - timedelta(days=today.weekday(), weeks=weeks - 1)
+    observations = db.query(SkillObservation).filter(
+        SkillObservation.user_id == user_id
+    ).order_by(SkillObservation.observed_at, SkillObservation.id).all()
+
+    trends = {}
+    for o in observations:
+        weekly = trends.setdefault((o.domain, o.topic, o.subtopic), {})
+        week = week_start(o.observed_at)
+        previous = weekly[max(weekly)]["ema"] if weekly else o.score
+        point = weekly.setdefault(week, {"count": 0, "mean": 0.0, "ema": previous, "last_score": o.score})
+        point["count"] += 1
+        point["mean"] += (o.score - point["mean"]) / point["count"]
+        point["ema"] += TREND_EMA_ALPHA * (o.score - point["ema"])
+        point["last_score"] = o.score
+    return {
+        key: [point for week, point in sorted(weekly.items()) if week >= cutoff]
+        for key, weekly in trends.items()
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--weeks", type=int, default=104, help="Weeks of history")
+    parser.add_argument("--sessions-per-week", type=int, default=5)
+    parser.add_argument("--skills", type=int, default=40, help="Skills scored per session")
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    init_db()
+    rng = random.Random(0)
+    db = SessionLocal()
+    user = User(email="bench@example.com", password_hash="-")
+    db.add(user)
+    db.commit()
+
+    start_at = datetime(2024, 1, 1, 9)
+    session_id = 0
+    for week in range(args.weeks):
+        for s in range(args.sessions_per_week):
+            session_id += 1
+            upsert_skill_scores(
+                db, user.id, synthetic_evaluation(session_id, args.skills, rng),
+                observed_at=start_at + timedelta(weeks=week, days=s)
+            )
+        db.commit()
+    today = (start_at + timedelta(weeks=args.weeks - 1, days=args.sessions_per_week - 1)).date()
+
+    rollup = {(t["domain"], t["topic"], t["subtopic"]): t for t in skill_trends(db, user.id, WINDOW_WEEKS, today=today)}
+    raw = trends_from_observations(db, user.id, WINDOW_WEEKS, today)
+    mismatch = max(
+        abs(point.ema - expected["ema"])
+        for key, points in raw.items()
+        for point, expected in zip(rollup[key]["points"], points)
+    )
+
+    print(f"{session_id} sessions over {args.weeks} weeks, {args.skills} skills each: "
+          f"{session_id * args.skills} observations")
+    print_row("trends from rollups", measure(
+        lambda: skill_trends(db, user.id, WINDOW_WEEKS, today=today), repeat=args.repeat
+    ))
+    print_row("trends from raw observations", measure(
+        lambda: trends_from_observations(db, user.id, WINDOW_WEEKS, today), repeat=args.repeat
+    ))
+    print(f"{'  max EMA difference':<40} {mismatch:.1e}")
+
+    def upsert():
+        nonlocal session_id
+        session_id += 1
+        upsert_skill_scores(db, user.id, synthetic_evaluation(session_id, args.skills, rng))
+        db.commit()
+
+    print_row("skill upsert incl. observations/rollups", measure(upsert, repeat=args.repeat))
+
+    db.close()
+    engine.dispose()
+    os.remove(DB_PATH)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+Benchmark for the batched UserSkill upsert.
+
+Builds a SessionEvaluation with many topic scores and compares merging it
+into the skill profile with one INSERT ... ON CONFLICT against a per-skill
+select-then-update loop. Also counts SQL statements per commit.
+
+Usage (from the backend directory):
+    python -m benchmarks.bench_skill_upsert --skills 1000
+"""
+import argparse
+import os
+import random
+
+from benchmarks.utils import use_temp_database, measure, print_row
+
+DB_PATH = use_temp_database()
+
+from sqlalchemy import event  # noqa: E402
+
+from app.database import SessionLocal, engine, init_db  # noqa: E402
+from app.models.skill import UserSkill  # noqa: E402
+from app.models.user import User  # noqa: E402
+from app.services.evaluation import DomainScore, SessionEvaluation, TopicScore  # noqa: E402
+from app.services.skill_profile import skill_status, upsert_skill_scores  # noqa: E402
+
+
+def make_evaluation(session_id: int, num_skills: int, rng: random.Random) -> SessionEvaluation:
+    domains = ["coding", "system_design", "ml"]
+    domain_scores = []
+    for d, domain in enumerate(domains):
+        topic_scores = [
+            TopicScore(
+                topic=f"topic_{i // 10}",
+                subtopic=f"subtopic_{i}" if i % 5 else None,
+                score=rng.random(),
+                confidence=rng.random(),
+                evidence=[]
+            )
+            for i in range(d, num_skills, len(domains))
+        ]
+        domain_scores.append(DomainScore(domain, 0.5, topic_scores, [], []))
+    return SessionEvaluation(session_id, domain_scores, 0.5, {}, "interview_ready", 45.0)
+
+
+def naive_upsert(db, user_id: int, evaluation: SessionEvaluation):
+    """One SELECT and one INSERT/UPDATE per skill, as an ORM loop would do."""
+    for domain_score in evaluation.domain_scores:
+        for ts in domain_score.topic_scores:
+            skill = db.query(UserSkill).filter(
+                UserSkill.user_id == user_id,
+                UserSkill.domain == domain_score.domain,
+                UserSkill.topic == ts.topic,
+                UserSkill.subtopic.is_(ts.subtopic) if ts.subtopic is None else UserSkill.subtopic == ts.subtopic
+            ).first()
+            if skill is None:
+                skill = UserSkill(user_id=user_id, domain=domain_score.domain, topic=ts.topic,
+                                  subtopic=ts.subtopic, times_assessed=0, confidence=0.0)
+                db.add(skill)
+                db.flush()
+            n = skill.times_assessed + 1
+            skill.score = ts.score if skill.score is None else skill.score + (ts.score - skill.score) / n
+            skill.confidence += (ts.confidence - skill.confidence) / n
+            skill.status = skill_status(skill.score).value
+            skill.times_assessed = n
+            skill.last_session_id = evaluation.session_id
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--skills", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    init_db()
+    db = SessionLocal()
+    db.add_all([User(id=1, email="bulk@example.com", password_hash="-"),
+                User(id=2, email="naive@example.com", password_hash="-")])
+    db.commit()
+
+    rng = random.Random(1)
+    session_ids = iter(range(1, 10_000))
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda *a: statements.append(a[2]))
+
+    def bulk():
+        upsert_skill_scores(db, 1, make_evaluation(next(session_ids), args.skills, rng))
+        db.commit()
+
+    def naive():
+        naive_upsert(db, 2, make_evaluation(next(session_ids), args.skills, rng))
+        db.commit()
+
+    print(f"{args.skills} skills per session")
+    print_row("INSERT ... ON CONFLICT", measure(bulk, repeat=args.repeat))
+    statements.clear()
+    bulk()
+    print(f"{'  statements per session':<40} {len(statements)}")
+
+    print_row("per-skill select + update", measure(naive, repeat=max(2, args.repeat // 5), warmup=1))
+    statements.clear()
+    naive()
+    print(f"{'  statements per session':<40} {len(statements)}")
+
+    rows = db.query(UserSkill).filter(UserSkill.user_id == 1).count()
+    assert rows == args.skills, rows
+    db.close()
+    engine.dispose()
+    os.remove(DB_PATH)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Throughput benchmark for transcript turn segmentation.
+
+Builds a synthetic transcript that asks curated bank questions (half tagged
+with their question id, half matched by text) with answers and follow-ups,
+then times segmenting it in one pass, the per-entry incremental cost, and
+per-topic exchange lookup against rescanning the transcript.
+
+Usage (from the backend directory):
+    python -m benchmarks.bench_turn_segmenter --turns 2000
+"""
+import argparse
+import random
+
+from benchmarks.utils import measure, print_row
+from app.services.question_bank import DOMAINS, question_bank
+from app.services.turn_segmenter import TurnSegmenter
+
+
+def synthetic_transcript(turns: int, rng: random.Random):
+    questions = [q for domain in DOMAINS for q in question_bank.questions(domain)]
+    entries = []
+    while len(entries) < turns:
+        q = rng.choice(questions)
+        tagged = rng.random() < 0.5
+        entries.append({
+            "role": "assistant",
+            "content": f"Okay, next one. {q['question']}",
+            "question_id": q["id"] if tagged else None,
+        })
+        entries.append({"role": "user", "content": "I would start by clarifying the constraints. " * 5})
+        for follow_up in q.get("follow_ups", [])[:rng.randrange(3)]:
+            entries.append({"role": "assistant", "content": follow_up})
+            entries.append({"role": "user", "content": "That depends on the access pattern. " * 3})
+    return entries[:turns]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--turns", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    transcript = synthetic_transcript(args.turns, random.Random(0))
+    segmenter = TurnSegmenter(DOMAINS).feed_all(transcript)
+    print(f"{len(transcript)} turns -> {len(segmenter.exchanges)} exchanges")
+
+    stats = measure(lambda: TurnSegmenter(DOMAINS).feed_all(transcript), args.repeat)
+    print_row("segment whole transcript", stats)
+    print(f"{'  per entry (incremental feed)':<40} {stats['mean_ms'] / len(transcript) * 1000:10.4f} us")
+
+    topic = segmenter.exchanges[0].topic
+    domain = segmenter.exchanges[0].domain
+    print_row("exchanges for a topic: index", measure(lambda: segmenter.for_topic(domain, topic), args.repeat * 100))
+    print_row("exchanges for a topic: rescan", measure(
+        lambda: [e for e in TurnSegmenter(DOMAINS).feed_all(transcript).exchanges if e.topic == topic],
+        args.repeat))
+
+
+if __name__ == "__main__":
+    main()
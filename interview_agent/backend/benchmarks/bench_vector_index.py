@@ -0,0 +1,87 @@
+"""
+Startup and query-latency benchmark for the memory-mapped vector index.
+
+Writes indexes of synthetic unit vectors (content does not affect timing)
+at each size, then measures opening them with mmap versus reading them fully,
+and single-query and batched top-k latency with and without IVF.
+
+Usage (from the backend directory):
+    python -m benchmarks.bench_vector_index --sizes 10000 100000 1000000
+"""
+import argparse
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+from benchmarks.utils import measure, print_row
+from app.services.question_vectors import HashedNgramEncoder, VectorIndex, write_vector_index
+
+QUERIES = [
+    "dynamic programming on subsequences",
+    "how would you shard a write-heavy database",
+    "bias variance tradeoff and regularization",
+    "graph traversal with cycle detection",
+]
+
+
+def synthetic_vectors(count: int, dim: int, rng: np.random.Generator) -> np.ndarray:
+    vectors = np.empty((count, dim), dtype=np.float32)
+    for start in range(0, count, 100000):
+        block = rng.standard_normal((min(100000, count - start), dim)).astype(np.float32)
+        vectors[start:start + len(block)] = block / np.linalg.norm(block, axis=1, keepdims=True)
+    return vectors
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000, 1000000])
+    parser.add_argument("--dim", type=int, default=256)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    encoder = HashedNgramEncoder(dim=args.dim)
+    rng = np.random.default_rng(0)
+    index_dir = Path(tempfile.mkdtemp(prefix="vector_index_"))
+    try:
+        for size in args.sizes:
+            vectors = synthetic_vectors(size, args.dim, rng)
+            ids = [f"q_{i}" for i in range(size)]
+            start = time.perf_counter()
+            write_vector_index(index_dir, "flat", ids, vectors, encoder, n_lists=0)
+            flat_build = time.perf_counter() - start
+            start = time.perf_counter()
+            write_vector_index(index_dir, "ivf", ids, vectors, encoder, n_lists=max(1, int(np.sqrt(size))))
+            ivf_build = time.perf_counter() - start
+            del vectors
+
+            flat_path, = index_dir.glob("flat.*.vectors.npy")
+            size_mb = flat_path.stat().st_size / 2**20
+            print(f"\n{size} questions, dim {args.dim}, float16 matrix {size_mb:.0f} MB "
+                  f"(build {flat_build:.1f}s flat, {ivf_build:.1f}s IVF)")
+
+            print_row("  startup: VectorIndex.load (mmap)", measure(
+                lambda: VectorIndex.load(index_dir, "flat"), args.repeat))
+            print_row("  startup: np.load into memory", measure(
+                lambda: np.load(flat_path), max(3, args.repeat // 5)))
+
+            flat = VectorIndex.load(index_dir, "flat")
+            ivf = VectorIndex.load(index_dir, "ivf")
+            counter = iter(range(10**9))
+            repeat = max(3, args.repeat // (1 + size // 100000))
+            print_row("  query: exact scan, top-5", measure(
+                lambda: flat.search(QUERIES[next(counter) % len(QUERIES)], 5), repeat))
+            print_row("  query: IVF nprobe=8, top-5", measure(
+                lambda: ivf.search(QUERIES[next(counter) % len(QUERIES)], 5, nprobe=8), args.repeat))
+            batch = QUERIES * 8
+            stats = measure(lambda: flat.search_batch(batch, 5), max(2, repeat // 4))
+            print_row(f"  batch of {len(batch)}: exact scan", stats)
+            print(f"{'    per query':<40} {stats['mean_ms'] / len(batch):10.4f} ms")
+    finally:
+        shutil.rmtree(index_dir)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Re-evaluation cost with the judge verdict cache.
+
+Judges N answers through the stand-in judge three times: cold (every
+answer is a judge call), again with the memory tier warm (a regrade in the
+same process), and again after dropping the memory tier (a restart, served
+from the judge_verdicts table). Reports wall time, judge calls, and cache
+hit rate, and checks the repeat verdicts are identical.
+
+Usage (from the backend directory):
+    python -m benchmarks.bench_verdict_cache --evaluations 200
+"""
+import argparse
+import asyncio
+import os
+import random
+import time
+
+from benchmarks.utils import use_temp_database
+
+DB_PATH = use_temp_database()
+
+from benchmarks.bench_llm_judge import judge_requests  # noqa: E402
+from benchmarks.judge_server import BackgroundServer, create_app  # noqa: E402
+from app.database import engine, init_db  # noqa: E402
+from app.services.llm_judge import ChatCompletionsTransport, LLMJudge  # noqa: E402
+from app.services.verdict_cache import VerdictCache  # noqa: E402
+
+
+async def run(base_url: str, requests, cache: VerdictCache, concurrency: int):
+    judge = LLMJudge(
+        transport=ChatCompletionsTransport(base_url=base_url, deployment="standin"),
+        cache=cache,
+        max_concurrency=concurrency,
+        requests_per_second=0,
+        backoff_seconds=0.05
+    )
+    start = time.perf_counter()
+    results = await judge.evaluate_many(requests)
+    wall = time.perf_counter() - start
+    await judge.aclose()
+    return wall, results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--evaluations", type=int, default=200)
+    parser.add_argument("--latency-ms", type=float, default=200.0)
+    parser.add_argument("--concurrency", type=int, default=16)
+    args = parser.parse_args()
+
+    init_db()
+    requests = judge_requests(args.evaluations, random.Random(0))
+    cache = VerdictCache(max_entries=10000)
+    app = create_app(args.latency_ms)
+    with BackgroundServer(app) as base_url:
+        print(f"{args.evaluations} evaluations, stand-in judge median {args.latency_ms:.0f} ms, "
+              f"concurrency {args.concurrency}")
+        verdicts = None
+        for label in ("cold", "warm (memory tier)", "warm (table, after restart)"):
+            if label.startswith("warm (table"):
+                cache.clear()
+            calls_before = app.state.stats["calls"]
+            wall, results = asyncio.run(run(base_url, requests, cache, args.concurrency))
+            current = [r.verdict for r in results]
+            same = "" if verdicts is None else f"   identical {current == verdicts}"
+            verdicts = verdicts or current
+            print(f"{label:<32} wall {wall * 1000:9.1f} ms   judge calls {app.state.stats['calls'] - calls_before:5d}"
+                  f"   cached {sum(r.cached for r in results):5d}{same}")
+    print(f"cache metrics: {cache.metrics()}")
+
+    engine.dispose()
+    os.remove(DB_PATH)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+Relevance and latency benchmark for weak-area question lookup.
+
+Relevance: every subtopic in the curated bank is used as a weak-area query
+(e.g. "sliding window", plus a chatty phrasing). Hit@1 and hit@3 (a question
+with that subtopic is ranked first / in the top 3) are reported for the old
+substring matcher and the BM25 index.
+
+Latency: BM25 queries over synthetic banks grown to the requested sizes.
+
+Usage (from the backend directory):
+    python -m benchmarks.bench_weak_area_search --sizes 1000 10000 100000
+"""
+import argparse
+import random
+import time
+from typing import List
+
+from benchmarks.utils import measure, print_row
+from app.services.question_bank import DOMAINS, question_bank
+from app.services.question_search import BM25Index, question_document, tokenize
+
+
+def legacy_search(questions: List[dict], weak_area: str, count: int) -> List[dict]:
+    """Previous implementation: substring match on any query word, shuffled."""
+    words = weak_area.lower().split()
+    relevant = [
+        q for q in questions
+        if any(word in f"{q.get('topic', '')} {q.get('subtopic', '')} {q.get('question', '')}".lower()
+               for word in words)
+    ]
+    random.shuffle(relevant)
+    return relevant[:count]
+
+
+def hits(results: List[dict], subtopic: str):
+    """(hit@1, hit@3) for one query."""
+    matches = [q.get("subtopic") == subtopic for q in results[:3]]
+    return float(bool(matches and matches[0])), float(any(matches))
+
+
+def relevance():
+    rng_state = random.getstate()
+    random.seed(0)
+    legacy_scores, bm25_scores = [], []
+    for domain in DOMAINS:
+        questions = question_bank.questions(domain)
+        index = BM25Index([question_document(q) for q in questions])
+        for subtopic in sorted({q["subtopic"] for q in questions if q.get("subtopic")}):
+            phrase = subtopic.replace("_", " ")
+            for query in (phrase, f"I am not confident in {phrase} and it shows in interviews"):
+                legacy_scores.append(hits(legacy_search(questions, query, 3), subtopic))
+                bm25_scores.append(hits([questions[i] for i in index.search(query, 3)], subtopic))
+    random.setstate(rng_state)
+
+    print(f"Relevance over {len(bm25_scores)} weak-area queries on the curated bank")
+    for label, scores in (("substring match", legacy_scores), ("BM25", bm25_scores)):
+        hit1 = sum(s[0] for s in scores) / len(scores)
+        hit3 = sum(s[1] for s in scores) / len(scores)
+        print(f"{'  ' + label:<40} hit@1 {hit1:.3f}   hit@3 {hit3:.3f}")
+
+
+def synthetic_bank(size: int, rng: random.Random) -> List[dict]:
+    """Curated questions re-sampled with extra vocabulary noise."""
+    seed = [q for domain in DOMAINS for q in question_bank.questions(domain)]
+    vocabulary = sorted({t for q in seed for t in tokenize(q["question"])})
+    bank = []
+    for i in range(size):
+        q = dict(seed[i % len(seed)])
+        q["id"] = f"synthetic_{i}"
+        q["question"] = q["question"] + " " + " ".join(rng.choices(vocabulary, k=12))
+        bank.append(q)
+    return bank
+
+
+def latency(sizes: List[int], repeat: int):
+    rng = random.Random(1)
+    queries = ["dynamic programming", "consistent hashing and sharding", "gradient descent",
+               "I struggle with graph search", "sliding window"]
+    for size in sizes:
+        bank = synthetic_bank(size, rng)
+        start = time.perf_counter()
+        index = BM25Index([question_document(q) for q in bank])
+        build_ms = (time.perf_counter() - start) * 1000
+        print(f"\n{size} questions (index build {build_ms:.0f} ms)")
+        counter = iter(range(10**9))
+        print_row("  BM25 top-3", measure(
+            lambda: index.search(queries[next(counter) % len(queries)], 3), repeat))
+        print_row("  substring match (old)", measure(
+            lambda: legacy_search(bank, queries[next(counter) % len(queries)], 3), max(3, repeat // 10)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    relevance()
+    latency(args.sizes, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+"""
+Local stand-in for the LLM judge, speaking the chat completions protocol.
+
+Answers POST /chat/completions (and the Azure deployment path) with a
+verdict in the documented JSON schema for the rubric in the prompt. Scores
+are derived deterministically from the answer. Latency is log-normal around
+--latency-ms, and a fraction of calls can fail with 503, return malformed
+JSON, or be throttled with 429 beyond --max-inflight concurrent requests,
+so the judge pipeline's retries and tail latency can be exercised offline.
+
+Usage (from the backend directory):
+    python -m benchmarks.judge_server --port 8089 --latency-ms 400
+    JUDGE_BASE_URL=http://127.0.0.1:8089 uvicorn app.main:app
+"""
+import argparse
+import asyncio
+import json
+import random
+import re
+import threading
+import time
+import zlib
+
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+RUBRIC_LINE = re.compile(r"^- (\w+): ", re.MULTILINE)
+ANSWER = re.compile(r"Candidate's Answer: (.*?)\n\nRubric:", re.DOTALL)
+
+
+def make_verdict(prompt: str) -> dict:
+    """Deterministic verdict for the rubric dimensions named in the prompt."""
+    rubric = prompt.split("Rubric:", 1)[-1].split("\n\nEvaluate", 1)[0]
+    dimensions = RUBRIC_LINE.findall(rubric) or ["overall"]
+    match = ANSWER.search(prompt)
+    answer = match.group(1) if match else ""
+    base = min(5, 1 + len(answer.split()) // 25)
+
+    scores = {}
+    for dimension in dimensions:
+        wobble = zlib.crc32(f"{dimension}:{answer}".encode()) % 3 - 1
+        scores[dimension] = {
+            "score": max(1, min(5, base + wobble)),
+            "evidence": f"Stand-in judgement of {dimension}"
+        }
+    overall = sum(s["score"] for s in scores.values()) / len(scores)
+    return {
+        "scores": scores,
+        "overall_score": round(overall, 1),
+        "strengths": [d for d, s in scores.items() if s["score"] >= 4],
+        "areas_for_improvement": [d for d, s in scores.items() if s["score"] <= 2]
+    }
+
+
+def create_app(
+    latency_ms: float = 400.0,
+    sigma: float = 0.5,
+    error_rate: float = 0.0,
+    malformed_rate: float = 0.0,
+    max_inflight: int = 0,
+    seed: int = 0
+) -> FastAPI:
+    app = FastAPI(title="Stand-in judge")
+    rng = random.Random(seed)
+    state = {"inflight": 0, "calls": 0, "throttled": 0, "errors": 0, "malformed": 0}
+    app.state.stats = state
+
+    async def complete(request: Request):
+        state["calls"] += 1
+        if max_inflight and state["inflight"] >= max_inflight:
+            state["throttled"] += 1
+            return JSONResponse({"error": {"code": "429", "message": "Rate limit exceeded"}}, status_code=429)
+
+        state["inflight"] += 1
+        try:
+            body = await request.json()
+            prompt = body["messages"][-1]["content"]
+            await asyncio.sleep(latency_ms / 1000 * rng.lognormvariate(0, sigma))
+            roll = rng.random()
+            if roll < error_rate:
+                state["errors"] += 1
+                return JSONResponse({"error": {"code": "503", "message": "Overloaded"}}, status_code=503)
+            if roll < error_rate + malformed_rate:
+                state["malformed"] += 1
+                content = '{"scores": {}, "overall_score": "about four"'
+            else:
+                content = json.dumps(make_verdict(prompt))
+        finally:
+            state["inflight"] -= 1
+
+        return {
+            "id": f"standin-{state['calls']}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": body.get("model") or "standin",
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": content},
+                "finish_reason": "stop"
+            }]
+        }
+
+    app.add_api_route("/chat/completions", complete, methods=["POST"])
+    app.add_api_route("/openai/deployments/{deployment}/chat/completions", complete, methods=["POST"])
+    return app
+
+
+class BackgroundServer:
+    """Runs a stand-in judge app with uvicorn on a background thread."""
+
+    def __init__(self, app: FastAPI, host: str = "127.0.0.1", port: int = 0):
+        config = uvicorn.Config(app, host=host, port=port, log_level="warning", access_log=False)
+        self.server = uvicorn.Server(config)
+        self.thread = threading.Thread(target=self.server.run, daemon=True)
+
+    def __enter__(self) -> str:
+        self.thread.start()
+        while not self.server.started:
+            time.sleep(0.01)
+        host, port = self.server.servers[0].sockets[0].getsockname()[:2]
+        return f"http://{host}:{port}"
+
+    def __exit__(self, *exc):
+        self.server.should_exit = True
+        self.thread.join()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8089)
+    parser.add_argument("--latency-ms", type=float, default=400.0, help="Median simulated completion latency")
+    parser.add_argument("--sigma", type=float, default=0.5, help="Log-normal latency spread")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of calls failing with 503")
+    parser.add_argument("--malformed-rate", type=float, default=0.0, help="Fraction of calls returning bad JSON")
+    parser.add_argument("--max-inflight", type=int, default=0, help="Concurrent calls before 429s (0: unlimited)")
+    args = parser.parse_args()
+
+    app = create_app(args.latency_ms, args.sigma, args.error_rate, args.malformed_rate, args.max_inflight)
+    uvicorn.run(app, host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""
+Shared helpers for benchmark scripts.
+
+Import this module before anything from ``app`` so that the benchmark runs
+against a throwaway SQLite database instead of the development one.
+"""
+import os
+import statistics
+import tempfile
+import time
+from typing import Callable, Dict
+
+
+def use_temp_database() -> str:
+    """Point the app at a fresh SQLite file and return its path."""
+    fd, path = tempfile.mkstemp(prefix="interview_agent_bench_", suffix=".db")
+    os.close(fd)
+    os.environ["DATABASE_URL"] = f"sqlite:///{path}"
+    return path
+
+
+def measure(fn: Callable[[], object], repeat: int = 20, warmup: int = 2) -> Dict[str, float]:
+    """Time a callable and return latency statistics in milliseconds."""
+    for _ in range(warmup):
+        fn()
+
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+
+    samples.sort()
+    return {
+        "mean_ms": statistics.fmean(samples),
+        "p50_ms": samples[len(samples) // 2],
+        "p95_ms": samples[min(len(samples) - 1, int(len(samples) * 0.95))],
+    }
+
+
+def print_row(label: str, stats: Dict[str, float]):
+    """Print a single aligned benchmark result row."""
+    print(
+        f"{label:<40} mean {stats['mean_ms']:10.4f} ms"
+        f"   p50 {stats['p50_ms']:10.4f} ms"
+        f"   p95 {stats['p95_ms']:10.4f} ms"
+    )
@@ -0,0 +1,77 @@
+"""
+Offline build step for the question bank.
+
+Reads data/questions/*.json (the source of truth) and writes derived
+artifacts to data/index/:
+- {domain}.duplicates.json: near-duplicate question clusters (MinHash/LSH)
+- {domain}.qbank: compiled, memory-mappable copy of the questions, keyed
+  by the SHA-256 of the JSON so a stale artifact is ignored at load
+- {domain}.meta.json / .{build}.vectors.npy / .{build}.ids.npy: embedding index
+  for semantic search
+
+Usage:
+    python build_question_bank.py [--ivf-lists N] [--dedupe-threshold T] [--fail-on-duplicates]
+"""
+import argparse
+import json
+import sys
+import time
+
+from app.services.question_bank import DOMAINS, INDEX_DIR, QUESTIONS_DIR
+from app.services.question_dedupe import find_near_duplicates, write_duplicate_report
+from app.services.question_store import compile_question_bank, source_hash
+from app.services.question_vectors import build_question_vectors
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build question bank artifacts")
+    parser.add_argument(
+        "--ivf-lists",
+        type=int,
+        default=None,
+        help="IVF partitions for the vector index (default: sqrt(n) for large banks, none otherwise)"
+    )
+    parser.add_argument(
+        "--dedupe-threshold",
+        type=float,
+        default=0.8,
+        help="Estimated Jaccard similarity at which questions count as near-duplicates"
+    )
+    parser.add_argument(
+        "--fail-on-duplicates",
+        action="store_true",
+        help="Exit non-zero when any near-duplicate cluster is found"
+    )
+    args = parser.parse_args()
+
+    duplicates_found = False
+    for domain in DOMAINS:
+        source = QUESTIONS_DIR / f"{domain}.json"
+        if not source.exists():
+            continue
+        with open(source, "r") as f:
+            questions = json.load(f)
+
+        start = time.perf_counter()
+        clusters = find_near_duplicates(questions, threshold=args.dedupe_threshold)
+        write_duplicate_report(INDEX_DIR / f"{domain}.duplicates.json", domain, len(questions), clusters)
+        print(f"{domain}: {len(clusters)} near-duplicate clusters "
+              f"({sum(len(c) for c in clusters)} questions) in {time.perf_counter() - start:.2f}s")
+        for cluster in clusters[:10]:
+            print("    " + ", ".join(f"{question_id} ({similarity:.2f})" for question_id, similarity in cluster))
+        duplicates_found = duplicates_found or bool(clusters)
+
+        start = time.perf_counter()
+        compile_question_bank(questions, INDEX_DIR / f"{domain}.qbank", source_hash([source]))
+        print(f"{domain}: compiled {len(questions)} questions in {time.perf_counter() - start:.2f}s")
+
+        start = time.perf_counter()
+        build_question_vectors(questions, INDEX_DIR, domain, n_lists=args.ivf_lists)
+        print(f"{domain}: embedded {len(questions)} questions in {time.perf_counter() - start:.2f}s")
+
+    if duplicates_found and args.fail_on_duplicates:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Bulk re-scoring of historical sessions.
+
+Run after changing EvaluationService.WEIGHTS, the rubrics or the judge:
+re-evaluates every scored session from its stored transcript on a pool
+of worker processes, rewrites InterviewSession.scores and the feedback
+report, and rebuilds each user's UserSkill rows from the new scores.
+Progress is checkpointed after every chunk; rerunning after an
+interruption resumes where it stopped.
+
+Usage:
+    python rescore_sessions.py [--workers N] [--users-per-chunk N] [--checkpoint PATH] [--restart]
+"""
+import argparse
+import os
+
+from app.database import init_db
+from app.services.rescoring import RescoreProgress, rescore_sessions
+
+
+def print_progress(progress: RescoreProgress):
+    rate = progress.sessions_per_second
+    remaining = progress.total - progress.done
+    eta = f"{remaining / rate:6.0f} s" if rate else "     ?"
+    print(f"users {progress.users:7d}   sessions {progress.done:8d}/{progress.total:<8d} "
+          f"({progress.kept} kept)   {rate:8.1f} sessions/s   eta {eta}", flush=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Re-score historical sessions")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Worker processes (0 evaluates in this process)"
+    )
+    parser.add_argument("--users-per-chunk", type=int, default=50, help="Users re-scored and written per transaction")
+    parser.add_argument("--checkpoint", default="rescore_checkpoint.json", help="Checkpoint file for resuming")
+    parser.add_argument("--restart", action="store_true", help="Ignore an existing checkpoint and start over")
+    args = parser.parse_args()
+
+    init_db()
+    progress = rescore_sessions(
+        workers=args.workers,
+        users_per_chunk=args.users_per_chunk,
+        checkpoint_path=args.checkpoint,
+        restart=args.restart,
+        on_progress=print_progress
+    )
+    print(f"re-scored {progress.sessions} sessions ({progress.kept} with nothing to re-evaluate kept) "
+          f"for {progress.users} users in {progress.elapsed_seconds:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+Skill coverage report for the question bank.
+
+For every skill in the skill trees, counts the questions covering it at
+each difficulty and lists the (skill, difficulty) gaps the bank cannot
+serve.
+
+Usage:
+    python skill_coverage_report.py [--domain ml] [--gaps-only] [--json]
+"""
+import argparse
+import json
+
+from app.services.question_bank import DOMAINS, question_bank
+from app.services.skill_coverage import DIFFICULTIES
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Report skill coverage of the question bank")
+    parser.add_argument("--domain", choices=DOMAINS, help="Only report this domain")
+    parser.add_argument("--gaps-only", action="store_true", help="Only list uncovered (skill, difficulty) cells")
+    parser.add_argument("--json", action="store_true", help="Emit machine-readable JSON")
+    args = parser.parse_args()
+
+    report = {}
+    for domain in [args.domain] if args.domain else DOMAINS:
+        coverage = question_bank.coverage(domain)
+        skills = []
+        for skill in coverage.index.skills_under(coverage.index.find(domain)):
+            counts = {level: coverage.count(skill.skill_id, level) for level in DIFFICULTIES}
+            if args.gaps_only and all(counts.values()):
+                continue
+            skills.append({"path": skill.path, "counts": counts})
+        report[domain] = {
+            "covered_fraction": coverage.summary()[domain],
+            "unmapped_questions": [coverage.questions[row].get("id") for row in coverage.unmapped_rows.tolist()],
+            "skills": skills,
+        }
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+
+    for domain, section in report.items():
+        fractions = ", ".join(f"{level} {section['covered_fraction'][level]:.0%}" for level in DIFFICULTIES)
+        print(f"\n{domain}: skills with questions: {fractions}")
+        if section["unmapped_questions"]:
+            print(f"  not in skill tree: {', '.join(section['unmapped_questions'])}")
+        print(f"  {'skill':<60} " + " ".join(f"{level:>6}" for level in DIFFICULTIES))
+        for skill in section["skills"]:
+            counts = " ".join(f"{skill['counts'][level] or '-':>6}" for level in DIFFICULTIES)
+            print(f"  {skill['path']:<60} {counts}")
+
+
+if __name__ == "__main__":
+    main()
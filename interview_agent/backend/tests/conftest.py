@@ -0,0 +1,58 @@
+"""
+Shared fixtures.
+
+The app is pointed at a throwaway SQLite database before anything from
+``app`` is imported, so the tests never touch the development database.
+"""
+import itertools
+import os
+import tempfile
+
+fd, DB_PATH = tempfile.mkstemp(prefix="interview_agent_test_", suffix=".db")
+os.close(fd)
+os.environ["DATABASE_URL"] = f"sqlite:///{DB_PATH}"
+
+import pytest  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+
+from app.database import SessionLocal, init_db  # noqa: E402
+from app.main import app  # noqa: E402
+from app.models.user import User  # noqa: E402
+from app.services.auth import create_access_token  # noqa: E402
+
+_emails = itertools.count()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def database():
+    init_db()
+    yield
+    os.remove(DB_PATH)
+
+
+@pytest.fixture
+def db():
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+@pytest.fixture
+def client():
+    # Not entered as a context manager: the startup hooks (report workers,
+    # periodic latency flushes) stay off unless a test starts them itself
+    return TestClient(app)
+
+
+@pytest.fixture
+def make_user(db):
+    """Create a user and return (user, Authorization headers for it)."""
+    def make(full_name: str = "Test User"):
+        user = User(email=f"user{next(_emails)}@example.com", password_hash="-", full_name=full_name)
+        db.add(user)
+        db.commit()
+        token = create_access_token({"sub": str(user.id)})
+        return user, {"Authorization": f"Bearer {token}"}
+    return make
@@ -0,0 +1,87 @@
+import pytest
+
+from app.services.answer_prescore import AnswerPrescorer, is_non_answer
+from app.services.llm_judge import JudgeRequest
+
+RUBRIC = {
+    "definition": "a hash table maps keys to buckets with a hash function",
+    "collisions": "collisions are resolved by chaining or open addressing",
+    "complexity": "lookups take constant time on average and linear time in the worst case",
+}
+OTHER_RUBRIC = {
+    "gradient": "gradient descent updates weights against the gradient of the loss",
+    "learning_rate": "the learning rate controls the step size of each update",
+    "convergence": "too large a learning rate diverges, too small converges slowly",
+}
+REFERENCES = [RUBRIC, OTHER_RUBRIC]
+
+
+def prescore(answer, rubric=RUBRIC):
+    prescorer = AnswerPrescorer(reference_rubrics=lambda: REFERENCES)
+    return prescorer.prescore(JudgeRequest(0, "How does a hash table work?", answer, rubric))
+
+
+@pytest.mark.parametrize("answer", ["", "   ", "I don't know.", "Um, no idea, sorry.", "Can we skip this one?"])
+def test_non_answers_are_decided_low(answer):
+    result = prescore(answer)
+
+    assert result.decision == "low"
+    assert result.verdict.overall_score == 1.0
+    assert set(result.verdict.scores) == set(RUBRIC)
+
+
+@pytest.mark.parametrize("answer", [
+    "I don't know the proof, but a hash function maps keys to buckets and collisions use chaining",
+    "Not sure if this is optimal, but lookups are constant time on average",
+])
+def test_hedged_answers_are_not_non_answers(answer):
+    assert not is_non_answer(answer.lower())
+    assert prescore(answer).decision != "low"
+
+
+def test_short_answers_are_escalated():
+    result = prescore("Chaining, O(1).")
+
+    assert result.decision is None
+    assert result.verdict is None
+
+
+def test_answer_covering_the_rubric_is_decided_high():
+    answer = (
+        "A hash table maps keys to buckets using a hash function. Collisions are resolved by "
+        "chaining or by open addressing. Lookups take constant time on average and linear "
+        "time in the worst case."
+    )
+
+    result = prescore(answer)
+
+    assert result.decision == "high"
+    assert result.verdict.overall_score >= 3.4
+    assert result.confidence >= 0.8
+
+
+def test_answer_to_another_question_is_decided_low():
+    answer = (
+        "Gradient descent updates the weights against the gradient of the loss. The learning "
+        "rate controls the step size of each update; too large a learning rate diverges and "
+        "too small a rate converges slowly."
+    )
+
+    result = prescore(answer)
+
+    assert result.decision == "low"
+    assert result.features["off_topic"] >= 0.45
+
+
+def test_filler_dominated_answer_is_decided_low():
+    answer = "Um, like, you know, basically it is, uh, sort of like a thing, I mean, actually, um, yeah."
+
+    assert prescore(answer).decision == "low"
+
+
+def test_plausible_answer_in_other_words_is_escalated():
+    answer = "You compute an index from the key and store the value in an array slot there, probing onwards if taken."
+
+    result = prescore(answer)
+
+    assert result.decision is None
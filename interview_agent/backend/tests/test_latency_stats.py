@@ -0,0 +1,42 @@
+import asyncio
+
+from app.database import SessionLocal
+from app.services.latency_stats import PERSISTENT_FLUSH_FAILURES, LatencyStats
+
+
+def test_flushes_converge_across_workers():
+    first, second = LatencyStats(k=100, min_samples=1), LatencyStats(k=100, min_samples=1)
+    for latency in range(100):
+        first.record(latency, domain="converge")
+        second.record(1000 + latency, domain="converge")
+
+    assert first.flush() == second.flush()
+    first.flush()
+
+    for stats in (first, second):
+        assert stats.count("converge/*/*") == 200
+        assert stats.percentile(500, domain="converge") == 0.5
+
+
+def test_failed_flush_keeps_deltas_and_reports_the_streak():
+    def unavailable():
+        raise RuntimeError("database unavailable")
+
+    stats = LatencyStats(k=100, min_samples=1, session_factory=unavailable)
+    stats.record(250, domain="unflushed")
+
+    async def run():
+        task = asyncio.create_task(stats.run_periodic_flush(0.001))
+        while stats.flush_failures < PERSISTENT_FLUSH_FAILURES:
+            await asyncio.sleep(0.001)
+        task.cancel()
+
+    asyncio.run(run())
+
+    metrics = stats.metrics()
+    assert metrics["flush_failing"]
+    assert metrics["pending_slices"] == len(stats._pending) > 0
+
+    stats._session_factory = SessionLocal
+    assert stats.flush() == metrics["pending_slices"]
+    assert stats.count("unflushed/*/*") == 1
@@ -0,0 +1,131 @@
+import asyncio
+import json
+
+import pytest
+
+from app.services.llm_judge import JudgeError, JudgeRequest, LLMJudge, parse_verdict
+
+RUBRIC = {"correctness": "Is it right?", "depth": "Does it go beyond the basics?"}
+
+
+def verdict_json(**overrides):
+    verdict = {
+        "scores": {
+            "correctness": {"score": 4, "evidence": "Correct complexity"},
+            "depth": {"score": 3, "evidence": "Mentions trade-offs"}
+        },
+        "overall_score": 3.5,
+        "strengths": ["Clear"],
+        "areas_for_improvement": ["Edge cases"]
+    }
+    verdict.update(overrides)
+    return json.dumps(verdict)
+
+
+class ScriptedTransport:
+    """Replies from a script: a string is returned, an exception raised."""
+    model = "test-judge"
+
+    def __init__(self, *replies):
+        self.replies = list(replies)
+        self.calls = 0
+
+    async def complete(self, prompt):
+        self.calls += 1
+        reply = self.replies.pop(0) if len(self.replies) > 1 else self.replies[0]
+        if isinstance(reply, Exception):
+            raise reply
+        if reply == "hang":
+            await asyncio.sleep(10)
+        return reply
+
+    async def aclose(self):
+        pass
+
+
+def judge(transport, **kwargs):
+    options = dict(max_concurrency=4, requests_per_second=0, burst=1, timeout_seconds=1.0,
+                   max_attempts=3, backoff_seconds=0.0)
+    options.update(kwargs)
+    return LLMJudge(transport=transport, **options)
+
+
+def evaluate(llm_judge, *answers):
+    requests = [JudgeRequest(i, "What is a B-tree?", answer, RUBRIC) for i, answer in enumerate(answers)]
+    return asyncio.run(llm_judge.evaluate_many(requests))
+
+
+def test_parse_verdict_accepts_the_documented_schema():
+    verdict = parse_verdict(verdict_json(), RUBRIC)
+
+    assert verdict.scores["correctness"].score == 4
+    assert verdict.normalized_score == pytest.approx(0.625)
+
+
+@pytest.mark.parametrize("content", [
+    "not json",
+    verdict_json(overall_score=7),
+    verdict_json(overall_score="3.5"),
+    verdict_json(extra="field"),
+    verdict_json(scores={"correctness": {"score": 4.5, "evidence": "-"}, "depth": {"score": 3, "evidence": "-"}}),
+    verdict_json(scores={"correctness": {"score": 4, "evidence": "-"}}),
+    verdict_json(scores={
+        "correctness": {"score": 4, "evidence": "-"},
+        "depth": {"score": 3, "evidence": "-"},
+        "style": {"score": 3, "evidence": "-"}
+    }),
+])
+def test_parse_verdict_rejects_nonconforming_replies_as_retryable(content):
+    with pytest.raises(JudgeError) as excinfo:
+        parse_verdict(content, RUBRIC)
+    assert excinfo.value.retryable
+
+
+def test_malformed_and_failed_replies_are_retried():
+    transport = ScriptedTransport("not json", JudgeError("HTTP 503"), verdict_json())
+
+    result, = evaluate(judge(transport), "A balanced search tree")
+
+    assert result.verdict is not None
+    assert result.attempts == 3
+    assert transport.calls == 3
+
+
+def test_timeouts_are_retried():
+    transport = ScriptedTransport("hang", verdict_json())
+
+    result, = evaluate(judge(transport, timeout_seconds=0.05), "A balanced search tree")
+
+    assert result.verdict is not None
+    assert result.attempts == 2
+
+
+def test_non_retryable_errors_stop_immediately():
+    transport = ScriptedTransport(JudgeError("HTTP 401", retryable=False))
+
+    result, = evaluate(judge(transport), "A balanced search tree")
+
+    assert result.verdict is None
+    assert result.error == "HTTP 401"
+    assert transport.calls == 1
+
+
+def test_exhausted_attempts_return_the_last_error_without_raising():
+    transport = ScriptedTransport(JudgeError("HTTP 503"))
+
+    first, second = evaluate(judge(transport, max_attempts=2), "One answer", "Another answer")
+
+    assert first.verdict is None and second.verdict is None
+    assert first.attempts == 2
+    assert first.error == "HTTP 503"
+    assert transport.calls == 4
+
+
+def test_identical_answers_are_judged_once():
+    transport = ScriptedTransport(verdict_json())
+
+    results = evaluate(judge(transport), "Same answer", "Same answer")
+
+    assert [result.key for result in results] == [0, 1]
+    assert all(result.verdict is not None for result in results)
+    assert transport.calls == 1
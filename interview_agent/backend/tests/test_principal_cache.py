@@ -0,0 +1,83 @@
+import time
+from datetime import datetime
+
+from app.services import principal_cache as principal_cache_module
+from app.services.principal_cache import Principal, PrincipalCache, principal_cache
+
+
+def principal(user_id):
+    return Principal(id=user_id, email=f"{user_id}@example.com", full_name=None, created_at=datetime(2024, 1, 1))
+
+
+def test_profile_update_is_seen_on_the_next_request(client, db, make_user):
+    user, headers = make_user(full_name="Before")
+    assert client.get("/v1/users/me", headers=headers).json()["full_name"] == "Before"
+    assert len(principal_cache._keys_by_user[user.id]) == 1
+
+    user.full_name = "After"
+    db.commit()
+
+    assert user.id not in principal_cache._keys_by_user
+    assert client.get("/v1/users/me", headers=headers).json()["full_name"] == "After"
+
+
+def test_deleted_user_is_rejected_on_the_next_request(client, db, make_user):
+    user, headers = make_user()
+    assert client.get("/v1/users/me", headers=headers).status_code == 200
+
+    db.delete(user)
+    db.commit()
+
+    assert client.get("/v1/users/me", headers=headers).status_code == 401
+
+
+def test_invalidation_drops_every_token_of_the_user_only():
+    cache = PrincipalCache(ttl_seconds=60, max_entries=10)
+    for key in [(1, "a"), (1, "b"), (2, "a")]:
+        cache.put(key, principal(key[0]))
+
+    cache.invalidate_user(1)
+
+    assert cache.get((1, "a")) is None
+    assert cache.get((1, "b")) is None
+    assert cache.get((2, "a")) == principal(2)
+
+
+def test_entries_expire_after_the_ttl(monkeypatch):
+    cache = PrincipalCache(ttl_seconds=30, max_entries=10)
+    now = time.monotonic()
+    cache.put((1, "a"), principal(1))
+
+    monkeypatch.setattr(principal_cache_module.time, "monotonic", lambda: now + 31)
+
+    assert cache.get((1, "a")) is None
+    assert len(cache) == 0
+
+
+def test_entries_do_not_outlive_the_token():
+    cache = PrincipalCache(ttl_seconds=60, max_entries=10)
+
+    cache.put((1, "expired"), principal(1), token_exp=time.time() - 1)
+
+    assert cache.get((1, "expired")) is None
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = PrincipalCache(ttl_seconds=60, max_entries=2)
+    cache.put((1, "a"), principal(1))
+    cache.put((2, "a"), principal(2))
+    cache.get((1, "a"))
+
+    cache.put((3, "a"), principal(3))
+
+    assert cache.get((2, "a")) is None
+    assert cache.get((1, "a")) is not None
+    assert 2 not in cache._keys_by_user
+
+
+def test_zero_ttl_disables_the_cache():
+    cache = PrincipalCache(ttl_seconds=0, max_entries=10)
+
+    cache.put((1, "a"), principal(1))
+
+    assert cache.get((1, "a")) is None
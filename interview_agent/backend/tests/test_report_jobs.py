@@ -0,0 +1,166 @@
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.models.report import ReportJob
+from app.models.session import InterviewSession, SessionContent
+from app.services.question_bank import question_bank
+from app.services.report_jobs import ReportJobQueue
+
+
+@pytest.fixture
+def queue(db):
+    # claim() takes the oldest claimable job of the whole table
+    db.query(ReportJob).delete()
+    db.commit()
+    return ReportJobQueue(workers=1, lease_seconds=60, max_attempts=2, poll_seconds=1.0)
+
+
+@pytest.fixture
+def ended_session(db, make_user):
+    def make(transcript=None):
+        user, _ = make_user()
+        session = InterviewSession(
+            user_id=user.id, persona="neutral", depth_mode="interview_ready", domains=["coding"],
+            status="completed", ended_at=datetime.utcnow()
+        )
+        if transcript is not None:
+            session.transcript = transcript
+        db.add(session)
+        db.commit()
+        return session.id
+    return make
+
+
+def job_for(db, session_id):
+    db.expire_all()
+    return db.query(ReportJob).filter(ReportJob.session_id == session_id).one()
+
+
+def enqueue(db, queue, session_id):
+    job = queue.enqueue(db, session_id)
+    db.commit()
+    return job
+
+
+def expire_lease(db, session_id):
+    db.query(ReportJob).filter(ReportJob.session_id == session_id).update(
+        {"lease_expires_at": datetime.utcnow() - timedelta(seconds=1)}
+    )
+    db.commit()
+
+
+def sample_transcript():
+    question = question_bank.questions("coding")[0]
+    return [
+        {"role": "assistant", "content": question["question"], "timestamp": None, "question_id": question["id"]},
+        {"role": "user", "content": "I would start with a hash map and then discuss the trade-offs.", "timestamp": None},
+    ]
+
+
+def test_enqueue_is_idempotent_per_session(db, queue, ended_session):
+    session_id = ended_session()
+
+    first = enqueue(db, queue, session_id)
+    second = enqueue(db, queue, session_id)
+
+    assert first.id == second.id
+    assert db.query(ReportJob).filter(ReportJob.session_id == session_id).count() == 1
+
+
+def test_a_leased_job_is_claimed_once(db, queue, ended_session):
+    session_id = ended_session()
+    job = enqueue(db, queue, session_id)
+
+    assert queue.claim() == (job.id, session_id, 1)
+    assert queue.claim() is None
+    assert job_for(db, session_id).status == "running"
+
+
+def test_expired_lease_is_reclaimed_and_fences_out_the_stale_worker(db, queue, ended_session):
+    session_id = ended_session(sample_transcript())
+    enqueue(db, queue, session_id)
+    stale = queue.claim()
+    expire_lease(db, session_id)
+
+    fresh = queue.claim()
+    assert fresh[2] == stale[2] + 1
+
+    # The stale worker finishing late writes nothing
+    session = queue._load_session(session_id)
+    queue._complete(stale, session, object(), "stale report")
+    assert job_for(db, session_id).status == "running"
+    assert db.get(SessionContent, session_id).feedback_report is None
+
+    asyncio.run(queue.run(fresh))
+    job = job_for(db, session_id)
+    assert job.status == "done"
+    assert job.lease_expires_at is None
+    assert db.get(SessionContent, session_id).feedback_report
+
+
+def test_drain_writes_the_report_and_scores(db, queue, ended_session):
+    session_id = ended_session(sample_transcript())
+    enqueue(db, queue, session_id)
+
+    asyncio.run(queue.drain())
+
+    assert job_for(db, session_id).status == "done"
+    assert db.get(InterviewSession, session_id).scores is not None
+
+
+def test_session_without_transcript_finishes_as_no_transcript(db, queue, ended_session):
+    session_id = ended_session()
+    enqueue(db, queue, session_id)
+
+    asyncio.run(queue.drain())
+
+    job = job_for(db, session_id)
+    assert job.status == "no_transcript"
+    assert db.get(InterviewSession, session_id).scores is None
+
+
+def test_failures_are_retried_then_fail_for_good(db, queue, ended_session, monkeypatch):
+    session_id = ended_session(sample_transcript())
+    enqueue(db, queue, session_id)
+
+    def broken(session_id):
+        raise RuntimeError("storage unavailable")
+
+    monkeypatch.setattr(queue, "_load_session", broken)
+    asyncio.run(queue.run(queue.claim()))
+    job = job_for(db, session_id)
+    assert (job.status, job.attempts) == ("queued", 1)
+
+    asyncio.run(queue.run(queue.claim()))
+    job = job_for(db, session_id)
+    assert (job.status, job.attempts) == ("failed", 2)
+    assert job.error == "RuntimeError: storage unavailable"
+    assert queue.claim() is None
+
+
+def test_report_endpoint_reflects_the_job(client, db, queue, make_user):
+    user, headers = make_user()
+    session = InterviewSession(
+        user_id=user.id, persona="neutral", depth_mode="interview_ready", domains=["coding"],
+        status="completed", ended_at=datetime.utcnow()
+    )
+    db.add(session)
+    db.commit()
+    url = f"/v1/sessions/{session.id}/report"
+
+    queued = client.get(url, headers=headers)
+    assert queued.status_code == 202
+    assert queued.json()["status"] == "queued"
+
+    asyncio.run(queue.drain())
+    assert client.get(url, headers=headers).status_code == 409
+
+    db.query(ReportJob).filter(ReportJob.session_id == session.id).update(
+        {"status": "failed", "error": "RuntimeError: secret detail"}
+    )
+    db.commit()
+    failed = client.get(url, headers=headers)
+    assert failed.status_code == 500
+    assert "secret" not in failed.text
@@ -0,0 +1,65 @@
+from sqlalchemy import text
+
+from app.models.session import InterviewSession, SessionContent
+
+
+def new_session(db, user_id):
+    session = InterviewSession(user_id=user_id, persona="neutral", depth_mode="surface", domains=["ml"])
+    db.add(session)
+    db.commit()
+    return session
+
+
+def test_text_round_trips_through_compressed_columns(db, make_user):
+    user, _ = make_user()
+    session = new_session(db, user.id)
+    resume = "Résumé — 10 years of Python. " * 500
+    transcript = [{"role": "assistant", "content": "Explain B-trees ✓", "timestamp": None, "question_id": "q1"}]
+    session.resume_text = resume
+    session.transcript = transcript
+    session.feedback_report = "# Report\n\nGood."
+    db.commit()
+    session_id = session.id
+    db.expire_all()
+
+    stored = db.get(InterviewSession, session_id)
+    assert stored.resume_text == resume
+    assert stored.transcript == transcript
+    assert stored.feedback_report == "# Report\n\nGood."
+    assert stored.transcript_summary is None
+
+
+def test_large_text_is_stored_compressed(db, make_user):
+    user, _ = make_user()
+    session = new_session(db, user.id)
+    session.resume_text = "x" * 100_000
+    db.commit()
+
+    stored = db.execute(
+        text("SELECT length(resume_text) FROM session_contents WHERE session_id = :id"), {"id": session.id}
+    ).scalar_one()
+    assert stored < 1_000
+
+
+def test_content_row_is_created_on_first_write_only(db, make_user):
+    user, _ = make_user()
+    session = new_session(db, user.id)
+    assert session.content is None
+
+    session.resume_text = "resume"
+    session.feedback_report = "report"
+    db.commit()
+
+    assert db.query(SessionContent).filter(SessionContent.session_id == session.id).count() == 1
+
+
+def test_session_detail_returns_the_text(client, db, make_user):
+    user, headers = make_user()
+    session = new_session(db, user.id)
+    session.resume_text = "hello resume"
+    db.commit()
+
+    body = client.get(f"/v1/sessions/{session.id}", headers=headers).json()
+
+    assert body["resume_text"] == "hello resume"
+    assert body["feedback_report"] is None
@@ -0,0 +1,82 @@
+from datetime import datetime, timedelta
+
+from app.models.session import InterviewSession
+from app.routers.sessions import decode_cursor, encode_cursor
+
+
+def add_sessions(db, user_id, started_at):
+    sessions = [
+        InterviewSession(user_id=user_id, persona="neutral", depth_mode="surface", domains=["ml"], started_at=when)
+        for when in started_at
+    ]
+    db.add_all(sessions)
+    db.commit()
+    return [session.id for session in sessions]
+
+
+def list_all(client, headers, limit):
+    ids, cursor, pages = [], None, 0
+    while True:
+        response = client.get("/v1/sessions", params={"limit": limit, "cursor": cursor}, headers=headers)
+        assert response.status_code == 200
+        page = response.json()
+        assert len(page) <= limit
+        ids += [session["id"] for session in page]
+        pages += 1
+        cursor = response.headers.get("X-Next-Cursor")
+        if not cursor:
+            return ids, pages
+
+
+def test_cursor_round_trip():
+    when = datetime(2024, 5, 1, 12, 30, 15, 123456)
+    assert decode_cursor(encode_cursor(when, 42)) == (when, 42)
+
+
+def test_pages_cover_every_session_once_newest_first(client, db, make_user):
+    user, headers = make_user()
+    base = datetime(2024, 1, 1)
+    ids = add_sessions(db, user.id, [base + timedelta(minutes=i) for i in range(23)])
+
+    listed, pages = list_all(client, headers, limit=5)
+
+    assert listed == ids[::-1]
+    assert pages == 5
+
+
+def test_ties_on_started_at_are_broken_by_id(client, db, make_user):
+    user, headers = make_user()
+    same_time = datetime(2024, 1, 1)
+    ids = add_sessions(db, user.id, [same_time] * 7)
+
+    listed, _ = list_all(client, headers, limit=3)
+
+    assert listed == sorted(ids, reverse=True)
+
+
+def test_only_the_current_users_sessions_are_listed(client, db, make_user):
+    user, headers = make_user()
+    other, _ = make_user()
+    add_sessions(db, other.id, [datetime(2024, 1, 1)] * 3)
+    ids = add_sessions(db, user.id, [datetime(2024, 1, 2)])
+
+    listed, _ = list_all(client, headers, limit=10)
+
+    assert listed == ids
+
+
+def test_last_page_has_no_next_cursor(client, db, make_user):
+    user, headers = make_user()
+    add_sessions(db, user.id, [datetime(2024, 1, 1), datetime(2024, 1, 2)])
+
+    response = client.get("/v1/sessions", params={"limit": 2}, headers=headers)
+
+    assert len(response.json()) == 2
+    assert "X-Next-Cursor" not in response.headers
+
+
+def test_invalid_cursor_and_limit_are_rejected(client, make_user):
+    _, headers = make_user()
+
+    assert client.get("/v1/sessions", params={"cursor": "not a cursor!"}, headers=headers).status_code == 400
+    assert client.get("/v1/sessions", params={"limit": 0}, headers=headers).status_code == 422
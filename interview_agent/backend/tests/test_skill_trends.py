@@ -0,0 +1,94 @@
+from datetime import date, datetime
+
+import pytest
+
+from app.models.skill import SkillObservation, SkillTrend
+from app.services.skill_profile import TREND_EMA_ALPHA, record_skill_observations, skill_trends, week_start
+
+HASHING = ("coding", "hashing", None)
+GRAPHS = ("coding", "graphs", "bfs")
+
+
+def observe(db, user_id, when, **scores):
+    """Record one session's scores, keyed by HASHING / GRAPHS, at when."""
+    skills = {"hashing": HASHING, "graphs": GRAPHS}
+    record_skill_observations(
+        db, user_id, {skills[name]: (score, 1.0) for name, score in scores.items()}, None, when
+    )
+    db.commit()
+
+
+def trend_rows(db, user_id, skill):
+    _, topic, _ = skill
+    return db.query(SkillTrend).filter(
+        SkillTrend.user_id == user_id, SkillTrend.topic == topic
+    ).order_by(SkillTrend.week_start).all()
+
+
+def test_week_start_is_monday():
+    assert week_start(datetime(2024, 6, 9, 23, 59)) == date(2024, 6, 3)
+    assert week_start(datetime(2024, 6, 10)) == date(2024, 6, 10)
+
+
+def test_observations_in_one_week_share_a_rollup(db, make_user):
+    user, _ = make_user()
+    for day, score in [(3, 0.2), (4, 0.6), (7, 1.0)]:
+        observe(db, user.id, datetime(2024, 6, day, 12), hashing=score)
+
+    row, = trend_rows(db, user.id, HASHING)
+    assert row.week_start == date(2024, 6, 3)
+    assert row.count == 3
+    assert row.mean == pytest.approx(0.6)
+    assert row.last_score == 1.0
+    expected = 0.2
+    for score in (0.6, 1.0):
+        expected += TREND_EMA_ALPHA * (score - expected)
+    assert row.ema == pytest.approx(expected)
+    assert db.query(SkillObservation).filter(SkillObservation.user_id == user.id).count() == 3
+
+
+def test_a_new_week_continues_the_moving_average(db, make_user):
+    user, _ = make_user()
+    observe(db, user.id, datetime(2024, 6, 3), hashing=0.4, graphs=0.9)
+    observe(db, user.id, datetime(2024, 6, 17), hashing=0.8)
+
+    first, second = trend_rows(db, user.id, HASHING)
+    assert first.ema == pytest.approx(0.4)
+    assert second.count == 1
+    assert second.mean == pytest.approx(0.8)
+    assert second.ema == pytest.approx(0.4 + TREND_EMA_ALPHA * 0.4)
+    # Other skills' weeks are separate
+    assert [row.ema for row in trend_rows(db, user.id, GRAPHS)] == [pytest.approx(0.9)]
+
+
+def test_skill_trends_groups_per_skill_within_the_window(db, make_user):
+    user, _ = make_user()
+    observe(db, user.id, datetime(2024, 4, 1), hashing=0.1)
+    observe(db, user.id, datetime(2024, 6, 3), hashing=0.4, graphs=0.5)
+    observe(db, user.id, datetime(2024, 6, 10), hashing=0.8)
+
+    trends = skill_trends(db, user.id, weeks=4, today=date(2024, 6, 12))
+
+    by_topic = {trend["topic"]: trend for trend in trends}
+    hashing = by_topic["hashing"]
+    assert [point.week_start for point in hashing["points"]] == [date(2024, 6, 3), date(2024, 6, 10)]
+    assert hashing["ema"] == hashing["points"][-1].ema
+    assert hashing["change"] == pytest.approx(hashing["points"][-1].ema - hashing["points"][0].ema)
+    assert by_topic["graphs"]["subtopic"] == "bfs"
+    assert by_topic["graphs"]["change"] is None
+    assert skill_trends(db, user.id, weeks=4, domain="ml", today=date(2024, 6, 12)) == []
+
+
+def test_trends_endpoint_returns_the_current_users_rollups(client, db, make_user):
+    user, headers = make_user()
+    other, _ = make_user()
+    now = datetime.utcnow()
+    observe(db, user.id, now, hashing=0.7)
+    observe(db, other.id, now, graphs=0.3)
+
+    response = client.get("/v1/users/me/skills/trends", params={"weeks": 2}, headers=headers)
+
+    assert response.status_code == 200
+    trend, = response.json()
+    assert (trend["domain"], trend["topic"]) == ("coding", "hashing")
+    assert trend["ema"] == pytest.approx(0.7)
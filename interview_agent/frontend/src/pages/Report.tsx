@@ -1,7 +1,7 @@
 import { useState, useEffect } from 'react'
 import { useParams, useNavigate } from 'react-router-dom'
 import ReactMarkdown from 'react-markdown'
-import { getSession } from '../services/api'
+import { getSession, getSessionReport } from '../services/api'
 
 interface SessionDetail {
   id: number
@@ -26,6 +26,14 @@ export default function Report() {
 
       try {
         const data = await getSession(parseInt(sessionId))
+        // Reports are generated in the background after the session ends
+        if (data.status !== 'active' && !data.feedback_report) {
+          try {
+            data.feedback_report = await getSessionReport(parseInt(sessionId))
+          } catch {
+            // No report for this session: the placeholder is shown instead
+          }
+        }
         setSession(data)
       } catch (e: any) {
         setError(e.response?.data?.detail || 'Failed to load report')
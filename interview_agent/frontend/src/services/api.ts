@@ -65,6 +65,18 @@ export async function endSession(sessionId: number) {
   return response.data
 }
 
+// Resolves to the report markdown once generated, polling while it is pending (202)
+export async function getSessionReport(sessionId: number): Promise<string> {
+  for (;;) {
+    const response = await api.get(`/sessions/${sessionId}/report`)
+    if (response.status !== 202) {
+      return response.data.report_markdown
+    }
+    const retryAfter = parseInt(response.headers['retry-after'] || '2', 10)
+    await new Promise((resolve) => setTimeout(resolve, retryAfter * 1000))
+  }
+}
+
 // Resume endpoints
 export async function uploadResume(sessionId: number, file: File) {
   const formData = new FormData()